@@ -0,0 +1,119 @@
+"""Benchmark: entity construction rate and namespace bindings
+
+Measures
+    - graphs per second with the bindings of the ontologies: bound with NamespaceManager.bind on a graph with the
+      default bindings of rdflib (before) and copied from the cached table, Ontologies.bind_namespaces (after),
+    - entities per second: construction of a concept with one prefLabel, with dump() and with serialize(). Before:
+      the graph operations of the baseline Entity replayed with rdflib (a graph per entity with NamespaceManager.bind
+      for each prefix, a temporary graph per statement merged with graph + graph), after: dlod.skos.SkosConcept.
+
+Usage (from src):
+    python benchmarks/bench_namespaces.py [--n 3000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rdflib import RDF, Graph, Literal, URIRef  # noqa: E402
+from dlod.ontologies import Ontologies  # noqa: E402
+from dlod.skos import SKOS, SkosConcept  # noqa: E402
+
+BASE_URI = "https://genre.clscor.io/benchmark/"
+
+ONTOLOGIES = Ontologies()
+
+
+def bind_each_prefix(n: int) -> None:
+    """Before: default bindings of rdflib and NamespaceManager.bind for each prefix"""
+    prefixes = ONTOLOGIES.get_prefixes_uris()
+    for _ in range(n):
+        g = Graph()
+        for item in prefixes:
+            g.namespace_manager.bind(item["prefix"], URIRef(item["uri"]))
+
+
+def bind_cached_table(n: int) -> None:
+    """After: bindings copied from the cached table"""
+    for _ in range(n):
+        ONTOLOGIES.bind_namespaces(Graph(bind_namespaces="none"))
+
+
+def baseline_concept(i: int, prefixes: list) -> Graph:
+    """Graph of a concept with one prefLabel, built as the baseline Entity did"""
+    # __initialize_graph
+    g = Graph()
+    for item in prefixes:
+        g.namespace_manager.bind(item["prefix"], URIRef(item["uri"]))
+
+    uri = URIRef(f"{BASE_URI}{i}")
+
+    # instance_of_class
+    types = Graph()
+    types.add((uri, RDF.type, SKOS.Concept))
+    g = g + types
+
+    # add_property_to_literal_value_triple
+    label = Graph()
+    label.add((uri, SKOS.prefLabel, Literal(f"Concept {i}", lang="de")))
+    g = g + label
+
+    return g
+
+
+def baseline_construct_dump(n: int) -> None:
+    """Before: construction with dump() (the graph is returned)"""
+    prefixes = ONTOLOGIES.get_prefixes_uris()
+    for i in range(n):
+        baseline_concept(i, prefixes)
+
+
+def baseline_construct_serialize(n: int) -> None:
+    """Before: construction with serialize()"""
+    prefixes = ONTOLOGIES.get_prefixes_uris()
+    for i in range(n):
+        baseline_concept(i, prefixes).serialize(format="ttl")
+
+
+def construct_dump(n: int) -> None:
+    """After: construction with dump()"""
+    for i in range(n):
+        concept = SkosConcept(uri=f"{BASE_URI}{i}")
+        concept.skos_pref_label(f"Concept {i}", lang="de")
+        concept.dump()
+
+
+def construct_serialize(n: int) -> None:
+    """After: construction with serialize()"""
+    for i in range(n):
+        concept = SkosConcept(uri=f"{BASE_URI}{i}")
+        concept.skos_pref_label(f"Concept {i}", lang="de")
+        concept.serialize(format="ttl")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--n", type=int, default=3000, help="Number of graphs or entities")
+    args = parser.parse_args()
+
+    functions = [bind_each_prefix, bind_cached_table,
+                 baseline_construct_dump, construct_dump,
+                 baseline_construct_serialize, construct_serialize]
+
+    for function in functions:
+        # warm up
+        function(10)
+
+        start = time.perf_counter()
+        function(args.n)
+        seconds = time.perf_counter() - start
+
+        print(f"{function.__name__:30} {args.n / seconds:10.0f} /s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Benchmark: scaling of entity construction
+
+Times building n and 10 * n items with
+    - one entity with n properties (the triples are accumulated in the buffer of the entity),
+    - n concepts in a session (arena) linked to one concept scheme,
+    - n entities with Entity.bulk_create,
+and prints the ratio of the times. With linear scaling the ratio is about 10. Exits with status 1 if a ratio exceeds
+the threshold.
+
+Usage (from src):
+    python benchmarks/bench_scaling.py [--n 2000] [--threshold 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from dlod.session import Session  # noqa: E402
+from dlod.skos import SkosConcept, SkosConceptScheme  # noqa: E402
+
+BASE_URI = "https://genre.clscor.io/benchmark/"
+
+
+def properties(n: int) -> None:
+    """One entity with n properties"""
+    concept = SkosConcept(uri=BASE_URI + "concept")
+    for i in range(n):
+        concept.skos_alt_label(f"Label {i}", lang="de")
+    concept.serialize(format="nt")
+
+
+def session_arena(n: int) -> None:
+    """n concepts in a session, each linked to the scheme"""
+    session = Session()
+    scheme = SkosConceptScheme(uri=BASE_URI + "scheme", session=session)
+    for i in range(n):
+        concept = SkosConcept(uri=f"{BASE_URI}concept/{i}", session=session)
+        concept.skos_pref_label(f"Concept {i}", lang="de")
+        concept.skos_in_scheme(scheme)
+    session.serialize(format="nt")
+
+
+def bulk_create(n: int) -> None:
+    """n concepts created in bulk"""
+    session = Session()
+    records = [{"id": str(i), "label": f"Concept {i}", "lang": "de"} for i in range(n)]
+    SkosConcept.bulk_create(records, base_uri=BASE_URI + "concept/", session=session)
+    session.serialize(format="nt")
+
+
+def timed(function, n: int) -> float:
+    start = time.perf_counter()
+    function(n)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--n", type=int, default=2000, help="Number of items of the small run")
+    parser.add_argument("--threshold", type=float, default=20.0, help="Maximum ratio of the times of 10n and n")
+    args = parser.parse_args()
+
+    failed = False
+
+    for function in [properties, session_arena, bulk_create]:
+        # warm up caches (rdf:type tuples, property methods, namespace manager)
+        function(10)
+
+        small = timed(function, args.n)
+        large = timed(function, 10 * args.n)
+        ratio = large / small
+
+        print(f"{function.__name__:15} n={args.n:<7} {small:8.3f} s   10n={10 * args.n:<8} {large:8.3f} s"
+              f"   ratio {ratio:5.1f}")
+
+        if ratio > args.threshold:
+            failed = True
+
+    if failed:
+        print(f"FAILED: ratio above {args.threshold}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
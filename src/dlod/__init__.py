@@ -0,0 +1,59 @@
+"""dlod
+
+Python classes to generate Linked Open Data for the genre dynamics project.
+
+Submodules and the main classes are loaded on first access (PEP 562), e.g. "dlod.Session" or "dlod.cidoc.E21Person",
+importing the package itself does not load rdflib, marshmallow or the ontology classes.
+"""
+import importlib
+
+# Name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    "Session": "session",
+    "Entity": "entity",
+    "EntityHandle": "entity",
+    "TripleBuffer": "buffer",
+    "Ontologies": "ontologies",
+    "DB": "sparql",
+    "NTriplesWriter": "io",
+    "NQuadsWriter": "io",
+}
+
+_SUBMODULES = {
+    "buffer",
+    "cidoc",
+    "clscor",
+    "crmcls",
+    "crmdig",
+    "dracor",
+    "entity",
+    "io",
+    "lrmoo",
+    "matching",
+    "namespaces",
+    "ontologies",
+    "pem",
+    "properties",
+    "session",
+    "skos",
+    "sparql",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module("." + _LAZY_ATTRIBUTES[name], __name__), name)
+        # cache, __getattr__ is not called again for this name
+        globals()[name] = value
+        return value
+
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _SUBMODULES)
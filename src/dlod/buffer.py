@@ -0,0 +1,310 @@
+"""Triple buffer
+
+Compact store of the statements of an entity (or a session). Terms are interned once per buffer (or per table shared by
+several buffers) and a triple is kept as three integer IDs in an array. An rdflib.Graph is only built if it is needed,
+e.g. by dump(), serialize() or store(), and is cached until the buffer is changed.
+"""
+import threading
+from array import array
+from rdflib import Graph, BNode
+from .ontologies import Ontologies
+
+ONTOLOGIES = Ontologies()
+
+# Lock for adding new terms to a table; terms are looked up without it
+INTERN_LOCK = threading.Lock()
+
+
+class TermTable:
+    """Term Table
+
+    Interned terms of one or more buffers: ID -> term and term -> ID. The table lives as long as the buffers using it,
+    e.g. the buffer of an entity or of a session. New terms are added under a lock (INTERN_LOCK), so threads can share a
+    table.
+
+    Attributes:
+        terms (list): Term of each ID
+        ids (dict): ID of each term
+    """
+
+    __slots__ = ("terms", "ids")
+
+    def __init__(self):
+        """Initialize"""
+        self.terms = []
+        self.ids = {}
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def intern(self, term) -> int:
+        """Get the ID of a term, intern it if it is new
+
+        Args:
+            term: rdflib term (URIRef, Literal, BNode)
+
+        Returns:
+            int: ID of the term
+        """
+        term_id = self.ids.get(term)
+        if term_id is None:
+            with INTERN_LOCK:
+                # another thread might have added the term in the meantime
+                term_id = self.ids.get(term)
+                if term_id is None:
+                    term_id = len(self.terms)
+                    self.terms.append(term)
+                    self.ids[term] = term_id
+        return term_id
+
+
+class TripleBuffer:
+    """Triple Buffer
+
+    Append-only buffer of triples. Adding a triple that is already in the buffer is allowed, duplicates are removed
+    when the graph is built.
+
+    A sink (e.g. dlod.io.NTriplesWriter) can be attached; then all triples are also written to the sink as they are
+    added. If the triples are not retained, they are only written to the sink and memory stays flat. Triples copied
+    from other buffers (update) are only written to the sink if they are new to this buffer.
+    """
+
+    def __init__(self, terms: TermTable = None):
+        """Initialize
+
+        Args:
+            terms (TermTable, optional): Table of the interned terms, to share it with other buffers. Defaults to a new
+                table of this buffer.
+        """
+        # interned terms
+        self.terms = terms if terms is not None else TermTable()
+
+        # subject, predicate and object IDs of all triples, one after the other
+        self.__ids = array("L")
+
+        # cached rdflib.Graph
+        self.__graph = None
+
+        # cached index: subject ID -> positions of its triples in __ids
+        self.__subjects = None
+
+        # streaming sink
+        self.__sink = None
+        self.__retain = True
+
+        # triples (IDs) in the buffer or written to the sink, to write copied triples once; only kept with a sink
+        self.__written = None
+
+    def attach(self, sink, retain: bool = True) -> None:
+        """Attach a sink that the triples are written to
+
+        Triples that are already in the buffer are written to the sink at once.
+
+        Args:
+            sink: Object with a method write(triples), e.g. dlod.io.NTriplesWriter
+            retain (bool, optional): Also keep the triples in the buffer. Defaults to True.
+        """
+        if len(self.__ids) > 0:
+            sink.write(self)
+
+            if retain is False:
+                self.__ids = array("L")
+                self.__graph = None
+                self.__subjects = None
+
+        self.__sink = sink
+        self.__retain = retain
+        self.__written = None
+
+    def clear(self) -> None:
+        """Remove all triples, an attached sink stays attached"""
+        self.__ids = array("L")
+        self.__graph = None
+        self.__subjects = None
+
+    def detach(self) -> None:
+        """Detach the sink, triples added afterwards are kept in the buffer"""
+        self.__sink = None
+        self.__retain = True
+        self.__written = None
+
+    def add(self, triple: tuple) -> None:
+        """Add a triple
+
+        Args:
+            triple (tuple): (subject, predicate, object)
+        """
+        if self.__sink is not None:
+            self.__sink.write((triple,))
+            if self.__retain is False:
+                return
+
+        s, p, o = triple
+        intern = self.terms.intern
+        triple_ids = (intern(s), intern(p), intern(o))
+        self.__ids.extend(triple_ids)
+        if self.__written is not None:
+            self.__written.add(triple_ids)
+        self.__graph = None
+        self.__subjects = None
+
+    def extend(self, triples) -> None:
+        """Add triples
+
+        Args:
+            triples: Iterable of triples, e.g. an rdflib.Graph
+        """
+        if self.__sink is not None:
+            if self.__retain is False:
+                self.__sink.write(triples)
+                return
+
+            triples = list(triples)
+            self.__sink.write(triples)
+
+        ids = self.__ids
+        start = len(ids)
+        intern = self.terms.intern
+        for s, p, o in triples:
+            ids.extend((intern(s), intern(p), intern(o)))
+        if self.__written is not None:
+            self.__written.update(zip(ids[start::3], ids[start + 1::3], ids[start + 2::3]))
+        self.__graph = None
+        self.__subjects = None
+
+    def update(self, other: "TripleBuffer", subjects: list = None) -> None:
+        """Add all triples of another buffer
+
+        If both buffers share the table of terms, the IDs are copied and the terms do not need to be interned again.
+
+        Args:
+            other (TripleBuffer): Buffer to add the triples from
+            subjects (list, optional): Only add the triples of these subjects (e.g. URIRefs of entities in a shared
+                buffer) and of the blank nodes reachable from them
+        """
+        if other is self:
+            return
+
+        if subjects is None:
+            ids = other.__ids
+        else:
+            ids = other.__subject_ids(subjects)
+
+        if other.terms is not self.terms:
+            # IDs of the terms in this table, each term is interned once
+            other_terms = other.terms.terms
+            intern = self.terms.intern
+            translated = dict()
+            ids = array("L", [translated[term_id] if term_id in translated
+                              else translated.setdefault(term_id, intern(other_terms[term_id]))
+                              for term_id in ids])
+
+        if self.__sink is not None:
+            # only the triples that are new to this buffer are written, linking an entity again (or another entity
+            # with the same linked entities) does not repeat its triples in the output
+            if self.__written is None:
+                own = self.__ids
+                self.__written = set(zip(own[0::3], own[1::3], own[2::3]))
+
+            written = self.__written
+            new_ids = array("L")
+            for triple_ids in zip(ids[0::3], ids[1::3], ids[2::3]):
+                if triple_ids not in written:
+                    written.add(triple_ids)
+                    new_ids.extend(triple_ids)
+            ids = new_ids
+
+            self.__sink.write(self.__triples(ids))
+            if self.__retain is False:
+                return
+
+        self.__ids.extend(ids)
+        self.__graph = None
+        self.__subjects = None
+
+    def __iter__(self):
+        return self.__triples(self.__ids)
+
+    def __triples(self, ids: array):
+        """Helper function: triples of an array of IDs"""
+        terms = self.terms.terms
+        for i in range(0, len(ids), 3):
+            yield terms[ids[i]], terms[ids[i + 1]], terms[ids[i + 2]]
+
+    def __subject_ids(self, subjects: list) -> array:
+        """Helper function: IDs of the triples of subjects and of the blank nodes reachable from them
+
+        Args:
+            subjects (list): Subjects (rdflib terms)
+
+        Returns:
+            array: Subject, predicate and object IDs of the triples
+        """
+        ids = self.__ids
+
+        if self.__subjects is None:
+            index = dict()
+            for i in range(0, len(ids), 3):
+                index.setdefault(ids[i], []).append(i)
+            self.__subjects = index
+
+        index = self.__subjects
+
+        terms = self.terms.terms
+        term_ids = self.terms.ids
+
+        selected = array("L")
+        stack = [term_ids[subject] for subject in subjects if subject in term_ids]
+        seen = set(stack)
+
+        while stack:
+            for i in index.get(stack.pop(), ()):
+                selected.extend(ids[i:i + 3])
+
+                object_id = ids[i + 2]
+                if object_id not in seen and isinstance(terms[object_id], BNode):
+                    seen.add(object_id)
+                    stack.append(object_id)
+
+        return selected
+
+    def subject_triples(self, subjects: list) -> list:
+        """Get the triples of subjects and of the blank nodes reachable from them
+
+        Args:
+            subjects (list): Subjects (rdflib terms)
+
+        Returns:
+            list: Triples
+        """
+        return list(self.__triples(self.__subject_ids(subjects)))
+
+    def compact(self) -> None:
+        """Remove duplicate triples, keeps the order of the first occurrences"""
+        ids = self.__ids
+        unique = dict.fromkeys(zip(ids[0::3], ids[1::3], ids[2::3]))
+        if len(unique) * 3 < len(ids):
+            compacted = array("L")
+            for triple in unique:
+                compacted.extend(triple)
+            self.__ids = compacted
+            self.__subjects = None
+
+    def graph(self) -> Graph:
+        """Build the graph
+
+        The graph is cached until the buffer is changed. Changes to the returned graph are not written back
+        to the buffer.
+
+        Returns:
+            Graph: rdflib.Graph with the prefixes of the ontologies containing all triples of the buffer
+        """
+        if self.__graph is None:
+            self.compact()
+
+            # the cached prefixes of the ontologies are copied to the graph, no default bindings of rdflib
+            g = ONTOLOGIES.bind_namespaces(Graph(bind_namespaces="none"))
+            g.addN((s, p, o, g) for s, p, o in self)
+            self.__graph = g
+
+        return self.__graph
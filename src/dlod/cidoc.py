@@ -51,11 +51,13 @@ Inverse properties are only implemented for some classes, if it is expected, tha
 range entity than the domain, e.g. E39_Actor P14i_performed  E7_Activity.
 """
 
-from rdflib import Namespace, URIRef, Literal, XSD
+from rdflib import Namespace
 from .entity import Entity
+from .properties import EntityProperty, LiteralProperty
+from .namespaces import CIDOCNAMESPACE
 
 # Base uri used for Class URIs
-NAMESPACE = "http://www.cidoc-crm.org/cidoc-crm/"
+NAMESPACE = CIDOCNAMESPACE
 
 CRM = Namespace(NAMESPACE)
 
@@ -79,170 +81,47 @@ class E1CRMEntity(Entity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p1_is_identified_by(self, *entities, uris: list = None) -> bool:
-        """P1 is identified by (identifies): E41 Appellation
+    p1_is_identified_by = EntityProperty(CRM.P1_is_identified_by,
+                                         prop_inverse=CRM.P1i_identifies,
+                                         range_class="E41Appellation",
+                                         doc="""P1 is identified by (identifies): E41 Appellation
 
         Add triples "P1 is identified by" and inverse to the self.graph either for each passed entity
         or for each URI provided in "uris".
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p2_has_type = EntityProperty(CRM.P2_has_type,
+                                 prop_inverse=CRM.P2i_is_type_of,
+                                 range_class="E55Type",
+                                 doc="P2 has type (is type of): E55 Type")
 
-        Returns:
-            bool: True if added
+    p3_has_note = LiteralProperty(CRM.P3_has_note,
+                                  doc="P3 has note: E62 String")
 
-        """
-        prop = CRM.P1_is_identified_by
-        prop_inverse = CRM.P1i_identifies
+    p48_has_preferred_identifier = EntityProperty(CRM.P48_has_preferred_identifier,
+                                                  prop_inverse=CRM.P48i_is_preferred_identifier_of,
+                                                  range_class="E42Identifier",
+                                                  doc="P48 has preferred identifier (is preferred identifier of): E42 Identifier")
 
-        range_class_constraint = E41Appellation
+    p137_exemplifies = EntityProperty(CRM.P137_exemplifies,
+                                      prop_inverse=CRM.P137i_is_exemplified_by,
+                                      range_class="E55Type",
+                                      doc="P137 exemplifies( is exemplified by): E55 Type")
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p140i_was_attributed_by = EntityProperty(CRM.P140i_was_attributed_by,
+                                             prop_inverse=CRM.P140_assigned_attribute_to,
+                                             range_class="E13AttributeAssignment",
+                                             doc="P140i was attributed by (assigned attribute to): E13 Attribute Assignment")
 
-    def p2_has_type(self, *entities, uris: list = None) -> bool:
-        """P2 has type (is type of): E55 Type
+    p141i_was_assigned_by = EntityProperty(CRM.P141i_was_assigned_by,
+                                           prop_inverse=CRM.P141_assigned,
+                                           range_class="E13AttributeAssignment",
+                                           doc="P141i was assigned by (assigned): E13 Attribute Assignment")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P2_has_type
-        prop_inverse = CRM.P2i_is_type_of
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p3_has_note(self, content: str, lang: str = None) -> bool:
-        """P3 has note: E62 String
-
-        Args:
-            content (str): Textual content of the note
-            lang (str, optional): Language of the note. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P3_has_note
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
-
-    def p48_has_preferred_identifier(self, *entities, uris: list = None) -> bool:
-        """P48 has preferred identifier (is preferred identifier of): E42 Identifier
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P48_has_preferred_identifier
-        prop_inverse = CRM.P48i_is_preferred_identifier_of
-
-        range_class_constraint = E42Identifier
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p137_exemplifies(self, *entities, uris: list = None) -> bool:
-        """P137 exemplifies( is exemplified by): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P137_exemplifies
-        prop_inverse = CRM.P137i_is_exemplified_by
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p140i_was_attributed_by(self, *entities, uris: list = None) -> bool:
-        """P140i was attributed by (assigned attribute to): E13 Attribute Assignment
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P140i_was_attributed_by
-        prop_inverse = CRM.P140_assigned_attribute_to
-
-        range_class_constraint = E13AttributeAssignment
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p141i_was_assigned_by(self, *entities, uris: list = None) -> bool:
-        """P141i was assigned by (assigned): E13 Attribute Assignment
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P141i_was_assigned_by
-        prop_inverse = CRM.P141_assigned
-
-        range_class_constraint = E13AttributeAssignment
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p71i_is_listed_in(self, *entities, uris: list = None) -> bool:
-        """P71i is listed in (lists): E32 Authority Document
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P71i_is_listed_in
-        prop_inverse = CRM.P71_lists
-
-        range_class_constraint = E32AuthorityDocument
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p71i_is_listed_in = EntityProperty(CRM.P71i_is_listed_in,
+                                       prop_inverse=CRM.P71_lists,
+                                       range_class="E32AuthorityDocument",
+                                       doc="P71i is listed in (lists): E32 Authority Document")
 
 
 class E77PersistentItem(E1CRMEntity):
@@ -275,89 +154,25 @@ class E70Thing(E77PersistentItem):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p43_has_dimension(self, *entities, uris: list = None) -> bool:
-        """P43 has dimension (is dimension of): E54 Dimension
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P43_has_dimension
-        prop_inverse = CRM.P43i_is_dimension_of
-
-        range_class_constraint = E54Dimension
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p101_had_as_general_use(self, *entities, uris: list = None) -> bool:
-        """P101 had as general use (was use of): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P101_had_as_general_use
-        prop_inverse = CRM.P101i_was_use_of
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p130_shows_features_of(self, *entities, uris: list = None) -> bool:
-        """P130 shows features of (features are also found on): E70 Thing
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p43_has_dimension = EntityProperty(CRM.P43_has_dimension,
+                                       prop_inverse=CRM.P43i_is_dimension_of,
+                                       range_class="E54Dimension",
+                                       doc="P43 has dimension (is dimension of): E54 Dimension")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P130_shows_features_of
-        prop_inverse = CRM.P130i_features_are_also_found_on
+    p101_had_as_general_use = EntityProperty(CRM.P101_had_as_general_use,
+                                             prop_inverse=CRM.P101i_was_use_of,
+                                             range_class="E55Type",
+                                             doc="P101 had as general use (was use of): E55 Type")
 
-        range_class_constraint = E70Thing
+    p130_shows_features_of = EntityProperty(CRM.P130_shows_features_of,
+                                            prop_inverse=CRM.P130i_features_are_also_found_on,
+                                            range_class="E70Thing",
+                                            doc="P130 shows features of (features are also found on): E70 Thing")
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p16i_was_used_for(self, *entities, uris: list = None) -> bool:
-        """P16i was used for (used specific object): E7 Activity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P16i_was_used_for
-        prop_inverse = CRM.P16_used_specific_object
-
-        range_class_constraint = E7Activity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p16i_was_used_for = EntityProperty(CRM.P16i_was_used_for,
+                                       prop_inverse=CRM.P16_used_specific_object,
+                                       range_class="E7Activity",
+                                       doc="P16i was used for (used specific object): E7 Activity")
 
 
 class E71HumanMadeThing(E70Thing):
@@ -375,47 +190,15 @@ class E71HumanMadeThing(E70Thing):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p102_has_title(self, *entities, uris: list = None) -> bool:
-        """P102 has title (is title of): E35 Title
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P102_has_title
-        prop_inverse = CRM.P102i_is_title_of
-
-        range_class_constraint = E35Title
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p103_was_intended_for(self, *entities, uris: list = None) -> bool:
-        """P103 was intended for (was intention of): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p102_has_title = EntityProperty(CRM.P102_has_title,
+                                    prop_inverse=CRM.P102i_is_title_of,
+                                    range_class="E35Title",
+                                    doc="P102 has title (is title of): E35 Title")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P103_was_intended_for
-        prop_inverse = CRM.P103i_was_intention_of
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p103_was_intended_for = EntityProperty(CRM.P103_was_intended_for,
+                                           prop_inverse=CRM.P103i_was_intention_of,
+                                           range_class="E55Type",
+                                           doc="P103 was intended for (was intention of): E55 Type")
 
 
 class E28ConceptualObject(E71HumanMadeThing):
@@ -432,26 +215,10 @@ class E28ConceptualObject(E71HumanMadeThing):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p94i_was_created_by(self, *entities, uris: list = None) -> bool:
-        """P94i was created by (has created): E65 Creation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P94i_was_created_by
-        prop_inverse = CRM.P94_has_created
-
-        range_class_constraint = E65Creation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p94i_was_created_by = EntityProperty(CRM.P94i_was_created_by,
+                                         prop_inverse=CRM.P94_has_created,
+                                         range_class="E65Creation",
+                                         doc="P94i was created by (has created): E65 Creation")
 
 
 class E89PropositionalObject(E28ConceptualObject):
@@ -470,68 +237,20 @@ class E89PropositionalObject(E28ConceptualObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p148_has_component(self, *entities, uris: list = None) -> bool:
-        """P148 has component (is component of): E89 Propositional Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P148_has_component
-        prop_inverse = CRM.P148i_is_component_of
-
-        range_class_constraint = E89PropositionalObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p148_has_component = EntityProperty(CRM.P148_has_component,
+                                        prop_inverse=CRM.P148i_is_component_of,
+                                        range_class="E89PropositionalObject",
+                                        doc="P148 has component (is component of): E89 Propositional Object")
 
-    def p67_refers_to(self, *entities, uris: list = None) -> bool:
-        """P67 refers to (is referred to by): E1 CRM Entity
+    p67_refers_to = EntityProperty(CRM.P67_refers_to,
+                                   prop_inverse=CRM.P67i_is_referred_to_by,
+                                   range_class="E1CRMEntity",
+                                   doc="P67 refers to (is referred to by): E1 CRM Entity")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P67_refers_to
-        prop_inverse = CRM.P67i_is_referred_to_by
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p129_is_about(self, *entities, uris: list = None) -> bool:
-        """P129 is about (is subject of): E1 CRM Entity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P129_is_about
-        prop_inverse = CRM.P129i_is_subject_of
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p129_is_about = EntityProperty(CRM.P129_is_about,
+                                   prop_inverse=CRM.P129i_is_subject_of,
+                                   range_class="E1CRMEntity",
+                                   doc="P129 is about (is subject of): E1 CRM Entity")
 
 
 class E72LegalObject(E70Thing):
@@ -548,47 +267,15 @@ class E72LegalObject(E70Thing):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p104_is_subject_to(self, *entities, uris: list = None) -> bool:
-        """P104 is subject to (applies to): E30 Right
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P104_is_subject_to
-        prop_inverse = CRM.P104i_applies_to
-
-        range_class_constraint = E30Right
+    p104_is_subject_to = EntityProperty(CRM.P104_is_subject_to,
+                                        prop_inverse=CRM.P104i_applies_to,
+                                        range_class="E30Right",
+                                        doc="P104 is subject to (applies to): E30 Right")
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p105_right_held_by(self, *entities, uris: list = None) -> bool:
-        """P105 right held by (has right on): E39 Actor
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P105_right_held_by
-        prop_inverse = CRM.P105i_has_right_on
-
-        range_class_constraint = E39Actor
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p105_right_held_by = EntityProperty(CRM.P105_right_held_by,
+                                        prop_inverse=CRM.P105i_has_right_on,
+                                        range_class="E39Actor",
+                                        doc="P105 right held by (has right on): E39 Actor")
 
 
 class E90SymbolicObject(E28ConceptualObject, E72LegalObject):
@@ -605,40 +292,13 @@ class E90SymbolicObject(E28ConceptualObject, E72LegalObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p106_is_composed_of(self, *entities, uris: list = None) -> bool:
-        """P106 is composed of (forms part of): E90 Symbolic Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P106_is_composed_of
-        prop_inverse = CRM.P106i_forms_part_of
-
-        range_class_constraint = E90SymbolicObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p190_has_symbolic_content(self, content: str, lang: str = None) -> bool:
-        """P190 has symbolic content: E62 String
+    p106_is_composed_of = EntityProperty(CRM.P106_is_composed_of,
+                                         prop_inverse=CRM.P106i_forms_part_of,
+                                         range_class="E90SymbolicObject",
+                                         doc="P106 is composed of (forms part of): E90 Symbolic Object")
 
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P190_has_symbolic_content
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
+    p190_has_symbolic_content = LiteralProperty(CRM.P190_has_symbolic_content,
+                                                doc="P190 has symbolic content: E62 String")
 
 
 class E73InformationObject(E90SymbolicObject, E89PropositionalObject):
@@ -655,26 +315,10 @@ class E73InformationObject(E90SymbolicObject, E89PropositionalObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p165_incorporates(self, *entities, uris: list = None) -> bool:
-        """P165 incorporates (is incorporated in): E90 Symbolic Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P165_incorporates
-        prop_inverse = CRM.P165i_is_incorporated_in
-
-        range_class_constraint = E90SymbolicObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p165_incorporates = EntityProperty(CRM.P165_incorporates,
+                                       prop_inverse=CRM.P165i_is_incorporated_in,
+                                       range_class="E90SymbolicObject",
+                                       doc="P165 incorporates (is incorporated in): E90 Symbolic Object")
 
 
 class E29DesignOrProcedure(E73InformationObject):
@@ -693,47 +337,15 @@ class E29DesignOrProcedure(E73InformationObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p69_has_association_with(self, *entities, uris: list = None) -> bool:
-        """P69 has association with (is associated with): E29 Design or Procedure
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P69_has_association_with
-        prop_inverse = CRM.P69i_is_associated_with
-
-        range_class_constraint = E29DesignOrProcedure
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p33i_was_used_by(self, *entities, uris: list = None) -> bool:
-        """P33i was used by (used specific technique): E7 Activity
+    p69_has_association_with = EntityProperty(CRM.P69_has_association_with,
+                                              prop_inverse=CRM.P69i_is_associated_with,
+                                              range_class="E29DesignOrProcedure",
+                                              doc="P69 has association with (is associated with): E29 Design or Procedure")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P33i_was_used_by
-        prop_inverse = CRM.P33_used_specific_technique
-
-        range_class_constraint = E7Activity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p33i_was_used_by = EntityProperty(CRM.P33i_was_used_by,
+                                      prop_inverse=CRM.P33_used_specific_technique,
+                                      range_class="E7Activity",
+                                      doc="P33i was used by (used specific technique): E7 Activity")
 
 
 class E33LinguisticObject(E73InformationObject):
@@ -750,47 +362,15 @@ class E33LinguisticObject(E73InformationObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p72_has_language(self, *entities, uris: list = None) -> bool:
-        """P72 has language (is language of): E56 Language
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P72_has_language
-        prop_inverse = CRM.P72i_is_language_of
-
-        range_class_constraint = E56Language
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p73_has_translation(self, *entities, uris: list = None) -> bool:
-        """P73 has translation (is translation of): E33 Linguistic Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P73_has_translation
-        prop_inverse = CRM.P73i_is_translation_of
+    p72_has_language = EntityProperty(CRM.P72_has_language,
+                                      prop_inverse=CRM.P72i_is_language_of,
+                                      range_class="E56Language",
+                                      doc="P72 has language (is language of): E56 Language")
 
-        range_class_constraint = E33LinguisticObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p73_has_translation = EntityProperty(CRM.P73_has_translation,
+                                         prop_inverse=CRM.P73i_is_translation_of,
+                                         range_class="E33LinguisticObject",
+                                         doc="P73 has translation (is translation of): E33 Linguistic Object")
 
 
 class E41Appellation(E90SymbolicObject):
@@ -807,47 +387,15 @@ class E41Appellation(E90SymbolicObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p139_has_alternative_form(self, *entities, uris: list = None) -> bool:
-        """P139 has alternative form: E41 Appellation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P139_has_alternative_form
-        prop_inverse = CRM.P139i_is_alternative_form_of
-
-        range_class_constraint = E41Appellation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p1i_identifies(self, *entities, uris: list = None) -> bool:
-        """P1i identifies (is identified by): E1 CRM Entity
+    p139_has_alternative_form = EntityProperty(CRM.P139_has_alternative_form,
+                                               prop_inverse=CRM.P139i_is_alternative_form_of,
+                                               range_class="E41Appellation",
+                                               doc="P139 has alternative form: E41 Appellation")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P1i_identifies
-        prop_inverse = CRM.P1_is_identified_by
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p1i_identifies = EntityProperty(CRM.P1i_identifies,
+                                    prop_inverse=CRM.P1_is_identified_by,
+                                    range_class="E1CRMEntity",
+                                    doc="P1i identifies (is identified by): E1 CRM Entity")
 
 
 class E42Identifier(E41Appellation):
@@ -865,47 +413,15 @@ class E42Identifier(E41Appellation):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p37i_was_assigned_by(self, *entities, uris: list = None) -> bool:
-        """P37i was assigned by (assigned): E15 Identifier Assignment
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P37i_was_assigned_by
-        prop_inverse = CRM.P37_assigned
+    p37i_was_assigned_by = EntityProperty(CRM.P37i_was_assigned_by,
+                                          prop_inverse=CRM.P37_assigned,
+                                          range_class="E15IdentifierAssignment",
+                                          doc="P37i was assigned by (assigned): E15 Identifier Assignment")
 
-        range_class_constraint = E15IdentifierAssignment
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p38i_was_deassigned_by(self, *entities, uris: list = None) -> bool:
-        """P38i was deassigned by (deassigned): E15 Identifier Assignment
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P38i_was_deassigned_by
-        prop_inverse = CRM.P38_deassigned
-
-        range_class_constraint = E15IdentifierAssignment
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p38i_was_deassigned_by = EntityProperty(CRM.P38i_was_deassigned_by,
+                                            prop_inverse=CRM.P38_deassigned,
+                                            range_class="E15IdentifierAssignment",
+                                            doc="P38i was deassigned by (deassigned): E15 Identifier Assignment")
 
 
 class E35Title(E41Appellation, E33LinguisticObject):
@@ -921,26 +437,10 @@ class E35Title(E41Appellation, E33LinguisticObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p102i_is_title_of(self, *entities, uris: list = None) -> bool:
-        """P102i is title of (has title): E71 Human-Made Thing
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P102i_is_title_of
-        prop_inverse = CRM.P102_has_title
-
-        range_class_constraint = E71HumanMadeThing
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p102i_is_title_of = EntityProperty(CRM.P102i_is_title_of,
+                                       prop_inverse=CRM.P102_has_title,
+                                       range_class="E71HumanMadeThing",
+                                       doc="P102i is title of (has title): E71 Human-Made Thing")
 
 
 class E55Type(E28ConceptualObject):
@@ -962,158 +462,49 @@ class E55Type(E28ConceptualObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p127_has_broader_term(self, *entities, uris: list = None) -> bool:
-        """P127 has broader term (has narrower term): E55 Type
+    p127_has_broader_term = EntityProperty(CRM.P127_has_broader_term,
+                                           prop_inverse=CRM.P127i_has_narrower_term,
+                                           range_class="E55Type",
+                                           doc="""P127 has broader term (has narrower term): E55 Type
 
         Implemented in both directions, see self.has_broader_term
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P127_has_broader_term
-        prop_inverse = CRM.P127i_has_narrower_term
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p127i_has_narrower_term(self, *entities, uris: list = None) -> bool:
-        """P127i has narrower term (has broader term): E55 Type
+    p127i_has_narrower_term = EntityProperty(CRM.P127i_has_narrower_term,
+                                             prop_inverse=CRM.P127_has_broader_term,
+                                             range_class="E55Type",
+                                             doc="""P127i has narrower term (has broader term): E55 Type
 
         Implemented in both directions, see self.has_broader_term
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P127i_has_narrower_term
-        prop_inverse = CRM.P127_has_broader_term
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p150_defines_typical_parts_of(self, *entities, uris: list = None) -> bool:
-        """P150 defines typical parts of (defines typical wholes for): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P150_defines_typical_parts_of
-        prop_inverse = CRM.P150i_defines_typical_wholes_for
-
-        range_class_constraint = E55Type
+    p150_defines_typical_parts_of = EntityProperty(CRM.P150_defines_typical_parts_of,
+                                                   prop_inverse=CRM.P150i_defines_typical_wholes_for,
+                                                   range_class="E55Type",
+                                                   doc="P150 defines typical parts of (defines typical wholes for): E55 Type")
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p150i_defines_typical_wholes_for = EntityProperty(CRM.P150i_defines_typical_wholes_for,
+                                                      prop_inverse=CRM.P150_defines_typical_parts_of,
+                                                      range_class="E55Type",
+                                                      doc="P150i defines typical wholes for (defines typical parts of): E55 Type")
 
-    def p150i_defines_typical_wholes_for(self, *entities, uris: list = None) -> bool:
-        """P150i defines typical wholes for (defines typical parts of): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P150i_defines_typical_wholes_for
-        prop_inverse = CRM.P150_defines_typical_parts_of
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p2i_is_type_of(self, *entities, uris: list = None) -> bool:
-        """P2i is type of (has type): E1 CRM Entity
+    p2i_is_type_of = EntityProperty(CRM.P2i_is_type_of,
+                                    prop_inverse=CRM.P2_has_type,
+                                    range_class="E1CRMEntity",
+                                    doc="""P2i is type of (has type): E1 CRM Entity
 
         Implemented in both directions, see self.has_type
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P2i_is_type_of
-        prop_inverse = CRM.P2_has_type
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p125i_was_type_of_object_used_in(self, *entities, uris: list = None) -> bool:
-        """P125i was type of object used in (used object of type) E7 Activity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p125i_was_type_of_object_used_in = EntityProperty(CRM.P125i_was_type_of_object_used_in,
+                                                      prop_inverse=CRM.P125_used_object_of_type,
+                                                      range_class="E7Activity",
+                                                      doc="P125i was type of object used in (used object of type) E7 Activity")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P125i_was_type_of_object_used_in
-        prop_inverse = CRM.P125_used_object_of_type
-
-        range_class_constraint = E7Activity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p135i_was_created_by(self, *entities, uris: list = None) -> bool:
-        """P135i was created by (created type): E83 Type Creation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P135i_was_created_by
-        prop_inverse = CRM.P135_created_type
-
-        range_class_constraint = E83TypeCreation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p135i_was_created_by = EntityProperty(CRM.P135i_was_created_by,
+                                          prop_inverse=CRM.P135_created_type,
+                                          range_class="E83TypeCreation",
+                                          doc="P135i was created by (created type): E83 Type Creation")
 
 
 class E56Language(E55Type):
@@ -1131,26 +522,10 @@ class E56Language(E55Type):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p72i_is_language_of(self, *entities, uris: list = None) -> bool:
-        """P72i is language of (has language): E33 Linguistic Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P72i_is_language_of
-        prop_inverse = CRM.P72_has_language
-
-        range_class_constraint = E33LinguisticObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p72i_is_language_of = EntityProperty(CRM.P72i_is_language_of,
+                                         prop_inverse=CRM.P72_has_language,
+                                         range_class="E33LinguisticObject",
+                                         doc="P72i is language of (has language): E33 Linguistic Object")
 
 
 class E58MeasurementUnit(E55Type):
@@ -1188,26 +563,10 @@ class E2TemporalEntity(E1CRMEntity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p4_has_timespan(self, *entities, uris: list = None) -> bool:
-        """P4 has time-span (is time-span of): E52 Time-Span
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM["P4_has_time-span"]
-        prop_inverse = CRM["P4i_is_time-span_of"]
-
-        range_class_constraint = E52TimeSpan
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p4_has_timespan = EntityProperty(CRM['P4_has_time-span'],
+                                     prop_inverse=CRM['P4i_is_time-span_of'],
+                                     range_class="E52TimeSpan",
+                                     doc="P4 has time-span (is time-span of): E52 Time-Span")
 
 
 class E4Period(E2TemporalEntity):
@@ -1226,47 +585,15 @@ class E4Period(E2TemporalEntity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p7_took_place_at(self, *entities, uris: list = None) -> bool:
-        """P7 took place at (witnessed): E53 Place
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P7_took_place_at
-        prop_inverse = CRM.P7i_witnessed
-
-        range_class_constraint = E53Place
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p9_consists_of(self, *entities, uris: list = None) -> bool:
-        """P9 consists of (forms part of): E4 Period
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p7_took_place_at = EntityProperty(CRM.P7_took_place_at,
+                                      prop_inverse=CRM.P7i_witnessed,
+                                      range_class="E53Place",
+                                      doc="P7 took place at (witnessed): E53 Place")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P9_consists_of
-        prop_inverse = CRM.P9i_forms_part_of
-
-        range_class_constraint = E4Period
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p9_consists_of = EntityProperty(CRM.P9_consists_of,
+                                    prop_inverse=CRM.P9i_forms_part_of,
+                                    range_class="E4Period",
+                                    doc="P9 consists of (forms part of): E4 Period")
 
 
 class E5Event(E4Period):
@@ -1282,47 +609,15 @@ class E5Event(E4Period):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p11_had_participant(self, *entities, uris: list = None) -> bool:
-        """P11 had participant (participated in): E39 Actor
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P11_had_participant
-        prop_inverse = CRM.P11i_participated_in
-
-        range_class_constraint = E39Actor
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p11_had_participant = EntityProperty(CRM.P11_had_participant,
+                                         prop_inverse=CRM.P11i_participated_in,
+                                         range_class="E39Actor",
+                                         doc="P11 had participant (participated in): E39 Actor")
 
-    def p12_occurred_in_the_presence_of(self, *entities, uris: list = None) -> bool:
-        """P12 occurred in the presence of (was present at): E77 Persistent Item
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P12_occurred_in_the_presence_of
-        prop_inverse = CRM.P12i_was_present_at
-
-        range_class_constraint = E77PersistentItem
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p12_occurred_in_the_presence_of = EntityProperty(CRM.P12_occurred_in_the_presence_of,
+                                                     prop_inverse=CRM.P12i_was_present_at,
+                                                     range_class="E77PersistentItem",
+                                                     doc="P12 occurred in the presence of (was present at): E77 Persistent Item")
 
 
 class E7Activity(E5Event):
@@ -1350,215 +645,55 @@ class E7Activity(E5Event):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p14_carried_out_by(self, *entities, uris: list = None) -> bool:
-        """P14 carried out by (performed): E39 Actor
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P14_carried_out_by
-        prop_inverse = CRM.P14i_performed
-
-        range_class_constraint = E39Actor
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p15_was_influenced_by(self, *entities, uris: list = None) -> bool:
-        """P15 was influenced by (influenced): E1 CRM Entity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P15_was_influenced_by
-        prop_inverse = CRM.P15i_influenced
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p16_used_specific_object(self, *entities, uris: list = None) -> bool:
-        """P16 used specific object (was used for): E70 Thing
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P16_used_specific_object
-        prop_inverse = CRM.P16i_was_used_for
-
-        range_class_constraint = E70Thing
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p17_was_motivated_by(self, *entities, uris: list = None) -> bool:
-        """P17 was motivated by (motivated): E1 CRM Entity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P17_was_motivated_by
-        prop_inverse = CRM.P17i_motivated
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p19_was_intended_use_of(self, *entities, uris: list = None) -> bool:
-        """P19 was intended use of (was made for): E71 Human-Made Thing
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P19_was_intended_use_of
-        prop_inverse = CRM.P19i_was_made_for
-
-        range_class_constraint = E71HumanMadeThing
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p20_had_specific_purpose(self, *entities, uris: list = None) -> bool:
-        """P20 had specific purpose (was purpose of): E5 Event
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P20_had_specific_purpose
-        prop_inverse = CRM.P20i_was_purpose_of
-
-        range_class_constraint = E5Event
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p21_had_general_purpose(self, *entities, uris: list = None) -> bool:
-        """P21 had general purpose (was purpose of): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P21_had_general_purpose
-        prop_inverse = CRM.P21i_was_purpose_of
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p32_used_general_technique(self, *entities, uris: list = None) -> bool:
-        """P32 used general technique (was technique of): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P32_used_general_technique
-        prop_inverse = CRM.P32i_was_technique_of
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p33_used_specific_technique(self, *entities, uris: list = None) -> bool:
-        """P33 used specific technique (was used by): E29 Design or Procedure
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P33_used_specific_technique
-        prop_inverse = CRM.P33i_was_used_by
-
-        range_class_constraint = E29DesignOrProcedure
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p125_used_object_of_type(self, *entities, uris: list = None) -> bool:
-        """P125 used object of type (was type of object used in): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P125_used_object_of_type
-        prop_inverse = CRM.P125i_was_type_of_object_used_in
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p14_carried_out_by = EntityProperty(CRM.P14_carried_out_by,
+                                        prop_inverse=CRM.P14i_performed,
+                                        range_class="E39Actor",
+                                        doc="P14 carried out by (performed): E39 Actor")
+
+    p15_was_influenced_by = EntityProperty(CRM.P15_was_influenced_by,
+                                           prop_inverse=CRM.P15i_influenced,
+                                           range_class="E1CRMEntity",
+                                           doc="P15 was influenced by (influenced): E1 CRM Entity")
+
+    p16_used_specific_object = EntityProperty(CRM.P16_used_specific_object,
+                                              prop_inverse=CRM.P16i_was_used_for,
+                                              range_class="E70Thing",
+                                              doc="P16 used specific object (was used for): E70 Thing")
+
+    p17_was_motivated_by = EntityProperty(CRM.P17_was_motivated_by,
+                                          prop_inverse=CRM.P17i_motivated,
+                                          range_class="E1CRMEntity",
+                                          doc="P17 was motivated by (motivated): E1 CRM Entity")
+
+    p19_was_intended_use_of = EntityProperty(CRM.P19_was_intended_use_of,
+                                             prop_inverse=CRM.P19i_was_made_for,
+                                             range_class="E71HumanMadeThing",
+                                             doc="P19 was intended use of (was made for): E71 Human-Made Thing")
+
+    p20_had_specific_purpose = EntityProperty(CRM.P20_had_specific_purpose,
+                                              prop_inverse=CRM.P20i_was_purpose_of,
+                                              range_class="E5Event",
+                                              doc="P20 had specific purpose (was purpose of): E5 Event")
+
+    p21_had_general_purpose = EntityProperty(CRM.P21_had_general_purpose,
+                                             prop_inverse=CRM.P21i_was_purpose_of,
+                                             range_class="E55Type",
+                                             doc="P21 had general purpose (was purpose of): E55 Type")
+
+    p32_used_general_technique = EntityProperty(CRM.P32_used_general_technique,
+                                                prop_inverse=CRM.P32i_was_technique_of,
+                                                range_class="E55Type",
+                                                doc="P32 used general technique (was technique of): E55 Type")
+
+    p33_used_specific_technique = EntityProperty(CRM.P33_used_specific_technique,
+                                                 prop_inverse=CRM.P33i_was_used_by,
+                                                 range_class="E29DesignOrProcedure",
+                                                 doc="P33 used specific technique (was used by): E29 Design or Procedure")
+
+    p125_used_object_of_type = EntityProperty(CRM.P125_used_object_of_type,
+                                              prop_inverse=CRM.P125i_was_type_of_object_used_in,
+                                              range_class="E55Type",
+                                              doc="P125 used object of type (was type of object used in): E55 Type")
 
 
 class E13AttributeAssignment(E7Activity):
@@ -1576,68 +711,20 @@ class E13AttributeAssignment(E7Activity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p140_assigned_attribute_to(self, *entities, uris: list = None) -> bool:
-        """P140 assigned attribute to (was attributed by): E1 CRM Entity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P140_assigned_attribute_to
-        prop_inverse = CRM.P140i_was_attributed_by
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p141_assigned(self, *entities, uris: list = None) -> bool:
-        """P141 assigned (was assigned by): E1 CRM Entity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P141_assigned
-        prop_inverse = CRM.P141i_was_assigned_by
+    p140_assigned_attribute_to = EntityProperty(CRM.P140_assigned_attribute_to,
+                                                prop_inverse=CRM.P140i_was_attributed_by,
+                                                range_class="E1CRMEntity",
+                                                doc="P140 assigned attribute to (was attributed by): E1 CRM Entity")
 
-        range_class_constraint = E1CRMEntity
+    p141_assigned = EntityProperty(CRM.P141_assigned,
+                                   prop_inverse=CRM.P141i_was_assigned_by,
+                                   range_class="E1CRMEntity",
+                                   doc="P141 assigned (was assigned by): E1 CRM Entity")
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p177_assigned_property_of_type(self, *entities, uris: list = None) -> bool:
-        """P177 assigned property of type: E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P177_assigned_property_of_type
-        prop_inverse = CRM.P177i_is_type_of_property_assigned
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p177_assigned_property_of_type = EntityProperty(CRM.P177_assigned_property_of_type,
+                                                    prop_inverse=CRM.P177i_is_type_of_property_assigned,
+                                                    range_class="E55Type",
+                                                    doc="P177 assigned property of type: E55 Type")
 
 
 class E54Dimension(E1CRMEntity):
@@ -1654,61 +741,20 @@ class E54Dimension(E1CRMEntity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p90_has_value(self, content: str, datatype: str = None) -> bool:
-        """P90 has value: E60 Number
-
-        Args:
-            content (str): Textual content of the note
-            datatype (str, optional): Datatype that will be added to Literal. Use XSD datatypes.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P90_has_value
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, datatype=datatype)
-
-    def p91_has_unit(self, *entities, uris: list = None) -> bool:
-        """P91 has unit (is unit of): E58 Measurement Unit
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p90_has_value = LiteralProperty(CRM.P90_has_value,
+                                    typed=True,
+                                    argument="content",
+                                    doc="P90 has value: E60 Number")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P91_has_unit
-        prop_inverse = CRM.P91i_is_unit_of
+    p91_has_unit = EntityProperty(CRM.P91_has_unit,
+                                  prop_inverse=CRM.P91i_is_unit_of,
+                                  range_class="E58MeasurementUnit",
+                                  doc="P91 has unit (is unit of): E58 Measurement Unit")
 
-        range_class_constraint = E58MeasurementUnit
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p40i_was_observed_in(self, *entities, uris: list = None) -> bool:
-        """P40i observed dimension (was observed in): E16 Measurement
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P40i_was_observed_in
-        prop_inverse = CRM.P40_observed_dimension
-
-        range_class_constraint = E16Measurement
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p40i_was_observed_in = EntityProperty(CRM.P40i_was_observed_in,
+                                          prop_inverse=CRM.P40_observed_dimension,
+                                          range_class="E16Measurement",
+                                          doc="P40i observed dimension (was observed in): E16 Measurement")
 
 
 class E39Actor(E77PersistentItem):
@@ -1727,89 +773,25 @@ class E39Actor(E77PersistentItem):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p74_has_current_or_former_residence(self, *entities, uris: list = None) -> bool:
-        """P74 has current or former residence (is current or former residence of): E53 Place
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P74_has_current_or_former_residence
-        prop_inverse = CRM.P74i_is_current_or_former_residence_of
-
-        range_class_constraint = E53Place
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p75_possesses(self, *entities, uris: list = None) -> bool:
-        """P75 possesses (is possessed by): E30 Right
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P75_possesses
-        prop_inverse = CRM.P75i_is_possessed_by
-
-        range_class_constraint = E30Right
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p76_has_contact_point(self, *entities, uris: list = None) -> bool:
-        """P76 has contact point (provides access to): E41 Appellation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P76_has_contact_point
-        prop_inverse = CRM.P76i_provides_access_to
-
-        range_class_constraint = E41Appellation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p14i_performed(self, *entities, uris: list = None) -> bool:
-        """P14i performed (carried out by): E7 Activity
+    p74_has_current_or_former_residence = EntityProperty(CRM.P74_has_current_or_former_residence,
+                                                         prop_inverse=CRM.P74i_is_current_or_former_residence_of,
+                                                         range_class="E53Place",
+                                                         doc="P74 has current or former residence (is current or former residence of): E53 Place")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p75_possesses = EntityProperty(CRM.P75_possesses,
+                                   prop_inverse=CRM.P75i_is_possessed_by,
+                                   range_class="E30Right",
+                                   doc="P75 possesses (is possessed by): E30 Right")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P14i_performed
-        prop_inverse = CRM.P14_carried_out_by
+    p76_has_contact_point = EntityProperty(CRM.P76_has_contact_point,
+                                           prop_inverse=CRM.P76i_provides_access_to,
+                                           range_class="E41Appellation",
+                                           doc="P76 has contact point (provides access to): E41 Appellation")
 
-        range_class_constraint = E7Activity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p14i_performed = EntityProperty(CRM.P14i_performed,
+                                    prop_inverse=CRM.P14_carried_out_by,
+                                    range_class="E7Activity",
+                                    doc="P14i performed (carried out by): E7 Activity")
 
 
 class E74Group(E39Actor):
@@ -1826,26 +808,10 @@ class E74Group(E39Actor):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p107_has_current_or_former_member(self, *entities, uris: list = None) -> bool:
-        """P107 has current or former member (is current or former member of): E39 Actor
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P107_has_current_or_former_member
-        prop_inverse = CRM.P107i_is_current_or_former_member_of
-
-        range_class_constraint = E39Actor
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p107_has_current_or_former_member = EntityProperty(CRM.P107_has_current_or_former_member,
+                                                       prop_inverse=CRM.P107i_is_current_or_former_member_of,
+                                                       range_class="E39Actor",
+                                                       doc="P107 has current or former member (is current or former member of): E39 Actor")
 
 
 class E18PhysicalThing(E72LegalObject):
@@ -1921,26 +887,10 @@ class E21Person(E20BiologicalObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p152_has_parent(self, *entities, uris: list = None) -> bool:
-        """P152 has parent (is parent of): E21 Person
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P152_has_parent
-        prop_inverse = CRM.P152i_is_parent_of
-
-        range_class_constraint = E21Person
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p152_has_parent = EntityProperty(CRM.P152_has_parent,
+                                     prop_inverse=CRM.P152i_is_parent_of,
+                                     range_class="E21Person",
+                                     doc="P152 has parent (is parent of): E21 Person")
 
 
 class E30Right(E89PropositionalObject):
@@ -1958,26 +908,10 @@ class E30Right(E89PropositionalObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p75i_is_possessed_by(self, *entities, uris: list = None) -> bool:
-        """P75i is possessed by (possesses): E39 Actor
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P75i_is_possessed_by
-        prop_inverse = CRM.P75_possesses
-
-        range_class_constraint = E39Actor
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p75i_is_possessed_by = EntityProperty(CRM.P75i_is_possessed_by,
+                                          prop_inverse=CRM.P75_possesses,
+                                          range_class="E39Actor",
+                                          doc="P75i is possessed by (possesses): E39 Actor")
 
 
 class E63BeginningOfExistence(E5Event):
@@ -1992,26 +926,10 @@ class E63BeginningOfExistence(E5Event):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p92_brought_into_existence(self, *entities, uris: list = None) -> bool:
-        """P92 brought into existence (was brought into existence by): E77 Persistent Item
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P92_brought_into_existence
-        prop_inverse = CRM.P92i_was_brought_into_existence_by
-
-        range_class_constraint = E77PersistentItem
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p92_brought_into_existence = EntityProperty(CRM.P92_brought_into_existence,
+                                                prop_inverse=CRM.P92i_was_brought_into_existence_by,
+                                                range_class="E77PersistentItem",
+                                                doc="P92 brought into existence (was brought into existence by): E77 Persistent Item")
 
 
 class E65Creation(E7Activity, E63BeginningOfExistence):
@@ -2026,26 +944,10 @@ class E65Creation(E7Activity, E63BeginningOfExistence):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p94_has_created(self, *entities, uris: list = None) -> bool:
-        """P94 has created (was created by): E28 Conceptual Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P94_has_created
-        prop_inverse = CRM.P94i_was_created_by
-
-        range_class_constraint = E28ConceptualObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p94_has_created = EntityProperty(CRM.P94_has_created,
+                                     prop_inverse=CRM.P94i_was_created_by,
+                                     range_class="E28ConceptualObject",
+                                     doc="P94 has created (was created by): E28 Conceptual Object")
 
 
 class E83TypeCreation(E65Creation):
@@ -2063,47 +965,15 @@ class E83TypeCreation(E65Creation):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p135_created_type(self, *entities, uris: list = None) -> bool:
-        """P135 created type (was created by): E55 Type
+    p135_created_type = EntityProperty(CRM.P135_created_type,
+                                       prop_inverse=CRM.P135i_was_created_by,
+                                       range_class="E55Type",
+                                       doc="P135 created type (was created by): E55 Type")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P135_created_type
-        prop_inverse = CRM.P135i_was_created_by
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p136_was_based_on(self, *entities, uris: list = None) -> bool:
-        """P136 was based on (supported type creation): E1 CRM Entity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P136_was_based_on
-        prop_inverse = CRM.P136i_supported_type_creation
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p136_was_based_on = EntityProperty(CRM.P136_was_based_on,
+                                       prop_inverse=CRM.P136i_supported_type_creation,
+                                       range_class="E1CRMEntity",
+                                       doc="P136 was based on (supported type creation): E1 CRM Entity")
 
 
 class E24PhysicalHumanMadeThing(E18PhysicalThing, E71HumanMadeThing):
@@ -2163,26 +1033,10 @@ class E16Measurement(E13AttributeAssignment):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p40_observed_dimension(self, *entities, uris: list = None) -> bool:
-        """P40 observed dimension (was observed in): E54 Dimension
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P40_observed_dimension
-        prop_inverse = CRM.P40i_was_observed_in
-
-        range_class_constraint = E54Dimension
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p40_observed_dimension = EntityProperty(CRM.P40_observed_dimension,
+                                            prop_inverse=CRM.P40i_was_observed_in,
+                                            range_class="E54Dimension",
+                                            doc="P40 observed dimension (was observed in): E54 Dimension")
 
 
 class E52TimeSpan(E1CRMEntity):
@@ -2207,186 +1061,51 @@ class E52TimeSpan(E1CRMEntity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p79_beginning_is_qualified_by(self, content: str, lang: str = None) -> bool:
-        """P79 beginning is qualified by: E62 String
-
-        Args:
-            content (str): Textual content of the note
-            lang (str, optional): Language of the note. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P79_beginning_is_qualified_by
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
-
-    def p80_end_is_qualified_by(self, content: str, lang: str = None) -> bool:
-        """P80 end is qualified by: E62 String
-
-        Args:
-            content (str): Textual content of the note
-            lang (str, optional): Language of the note. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P80_end_is_qualified_by
-
-        if lang:
-            self.graph.add((URIRef(self.uri), prop, Literal(content, lang=lang)))
-        else:
-            self.graph.add((URIRef(self.uri), prop, Literal(content)))
-
-        return True
-
-    def p81_ongoing_throughout(self, value: str, datatype: str = None) -> bool:
-        """P81 ongoing throughout: E61 Time Primitive
+    p79_beginning_is_qualified_by = LiteralProperty(CRM.P79_beginning_is_qualified_by,
+                                                    doc="P79 beginning is qualified by: E62 String")
 
-        Args:
-            value (str): Value
-            datatype (str, optional): Datatype that will be added to Literal. Use XSD datatypes.
+    p80_end_is_qualified_by = LiteralProperty(CRM.P80_end_is_qualified_by,
+                                              doc="P80 end is qualified by: E62 String")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P81_ongoing_throughout
+    p81_ongoing_throughout = LiteralProperty(CRM.P81_ongoing_throughout,
+                                             typed=True,
+                                             doc="P81 ongoing throughout: E61 Time Primitive")
 
-        return self.add_property_to_literal_value_triple(value, prop=prop, datatype=datatype)
-
-    def p81a_end_of_the_begin(self, value: str, datatype: str = None) -> bool:
-        """P81a end of the begin: Literal
-
-        Args:
-            value (str): Value
-            datatype (str, optional): Datatype that will be added to Literal. Use XSD datatypes.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P81a_end_of_the_begin
-
-        return self.add_property_to_literal_value_triple(value, prop=prop, datatype=datatype)
+    p81a_end_of_the_begin = LiteralProperty(CRM.P81a_end_of_the_begin,
+                                            typed=True,
+                                            doc="P81a end of the begin: Literal")
 
     # P81b
-    def p81b_begin_of_the_end(self, value: str, datatype: str = None) -> bool:
-        """P81b begin of the end: Literal
-
-        Args:
-            value (str): Value
-            datatype (str, optional): Datatype that will be added to Literal. Use XSD datatypes.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P81b_begin_of_the_end
-
-        return self.add_property_to_literal_value_triple(value, prop=prop, datatype=datatype)
-
-    def p82_at_some_time_within(self, value: str, datatype: str = None) -> bool:
-        """P82 at some time within: E61 Time Primitive
-
-        Args:
-            value (str): Value
-            datatype (str, optional): Datatype that will be added to Literal. Use XSD datatypes.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P82_at_some_time_within
-
-        return self.add_property_to_literal_value_triple(value, prop=prop, datatype=datatype)
-
-    def p82a_begin_of_the_begin(self, value: str, datatype: str = None) -> bool:
-        """P82a begin of the begin: Literal
-
-        Args:
-            value (str): Value
-            datatype (str, optional): Datatype that will be added to Literal. Use XSD datatypes.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P82a_begin_of_the_begin
-
-        return self.add_property_to_literal_value_triple(value, prop=prop, datatype=datatype)
-
-    def p82b_end_of_the_end(self, value: str, datatype: str = None) -> bool:
-        """P82b end of the end: Literal
-
-        Args:
-            value (str): Value
-            datatype (str, optional): Datatype that will be added to Literal. Use XSD datatypes.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P82b_end_of_the_end
-
-        return self.add_property_to_literal_value_triple(value, prop=prop, datatype=datatype)
-
-    def p86_falls_within(self, *entities, uris: list = None) -> bool:
-        """P86 falls within (contains): E52 Time-Span
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p81b_begin_of_the_end = LiteralProperty(CRM.P81b_begin_of_the_end,
+                                            typed=True,
+                                            doc="P81b begin of the end: Literal")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P86_falls_within
-        prop_inverse = CRM.P86i_contains
+    p82_at_some_time_within = LiteralProperty(CRM.P82_at_some_time_within,
+                                              typed=True,
+                                              doc="P82 at some time within: E61 Time Primitive")
 
-        range_class_constraint = E52TimeSpan
+    p82a_begin_of_the_begin = LiteralProperty(CRM.P82a_begin_of_the_begin,
+                                              typed=True,
+                                              doc="P82a begin of the begin: Literal")
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p82b_end_of_the_end = LiteralProperty(CRM.P82b_end_of_the_end,
+                                          typed=True,
+                                          doc="P82b end of the end: Literal")
 
-    def p86i_contains(self, *entities, uris: list = None) -> bool:
-        """P86i contains (falls within): E52 Time-Span
+    p86_falls_within = EntityProperty(CRM.P86_falls_within,
+                                      prop_inverse=CRM.P86i_contains,
+                                      range_class="E52TimeSpan",
+                                      doc="P86 falls within (contains): E52 Time-Span")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p86i_contains = EntityProperty(CRM.P86i_contains,
+                                   prop_inverse=CRM.P86_falls_within,
+                                   range_class="E52TimeSpan",
+                                   doc="P86i contains (falls within): E52 Time-Span")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P86i_contains
-        prop_inverse = CRM.P86_falls_within
-
-        range_class_constraint = E52TimeSpan
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p191_had_duration(self, *entities, uris: list = None) -> bool:
-        """P191 had duration (was duration of): E54 Dimension
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P191_had_duration
-        prop_inverse = CRM.P191i_was_duration_of
-
-        range_class_constraint = E54Dimension
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p191_had_duration = EntityProperty(CRM.P191_had_duration,
+                                       prop_inverse=CRM.P191i_was_duration_of,
+                                       range_class="E54Dimension",
+                                       doc="P191 had duration (was duration of): E54 Dimension")
 
 
 class E53Place(E1CRMEntity):
@@ -2408,107 +1127,35 @@ class E53Place(E1CRMEntity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p89_falls_within(self, *entities, uris: list = None) -> bool:
-        """P89 falls within (contains): E53 Place
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P89_falls_within
-        prop_inverse = CRM.P89i_contains
-
-        range_class_constraint = E53Place
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p89_falls_within = EntityProperty(CRM.P89_falls_within,
+                                      prop_inverse=CRM.P89i_contains,
+                                      range_class="E53Place",
+                                      doc="P89 falls within (contains): E53 Place")
 
-    def p89i_contains(self, *entities, uris: list = None) -> bool:
-        """P89i contains (falls within): E53 Place
+    p89i_contains = EntityProperty(CRM.P89i_contains,
+                                   prop_inverse=CRM.P89_falls_within,
+                                   range_class="E53Place",
+                                   doc="P89i contains (falls within): E53 Place")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P89i_contains
-        prop_inverse = CRM.P89_falls_within
-
-        range_class_constraint = E53Place
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p121_overlaps_with(self, *entities, uris: list = None) -> bool:
-        """P121 overlaps with: E53 Place
+    p121_overlaps_with = EntityProperty(CRM.P121_overlaps_with,
+                                        prop_inverse=CRM.P121_overlaps_with,
+                                        range_class="E53Place",
+                                        doc="""P121 overlaps with: E53 Place
 
         Property is symmetric. Both directions are added.
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P121_overlaps_with
-        prop_inverse = CRM.P121_overlaps_with
-
-        range_class_constraint = E53Place
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p122_borders_with(self, *entities, uris: list = None) -> bool:
-        """P122 borders with: E53 Place
+    p122_borders_with = EntityProperty(CRM.P122_borders_with,
+                                       prop_inverse=CRM.P122_borders_with,
+                                       range_class="E53Place",
+                                       doc="""P122 borders with: E53 Place
 
         Property is symmetric. Both directions are added.
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P122_borders_with
-        prop_inverse = CRM.P122_borders_with
-
-        range_class_constraint = E53Place
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p168_place_is_defined_by(self, value: str, datatype: str = None) -> bool:
-        """P168 place is defined by: E94 Space Primitive
-
-        Args:
-            value (str): Value
-            datatype (str, optional): Datatype that will be added to Literal. Use XSD datatypes.
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P168_place_is_defined_by
-
-        return self.add_property_to_literal_value_triple(value, prop=prop, datatype=datatype)
+    p168_place_is_defined_by = LiteralProperty(CRM.P168_place_is_defined_by,
+                                               typed=True,
+                                               doc="P168 place is defined by: E94 Space Primitive")
 
 
 class E15IdentifierAssignment(E13AttributeAssignment):
@@ -2525,47 +1172,15 @@ class E15IdentifierAssignment(E13AttributeAssignment):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p37_assigned(self, *entities, uris: list = None) -> bool:
-        """P37 assigned (was assigned by): E42 Identifier
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P37_assigned
-        prop_inverse = CRM.P37i_was_assigned_by
-
-        range_class_constraint = E42Identifier
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def p38_deassigned(self, *entities, uris: list = None) -> bool:
-        """P38 deassigned (was deassigned by): E42 Identifier
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    p37_assigned = EntityProperty(CRM.P37_assigned,
+                                  prop_inverse=CRM.P37i_was_assigned_by,
+                                  range_class="E42Identifier",
+                                  doc="P37 assigned (was assigned by): E42 Identifier")
 
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P38_deassigned
-        prop_inverse = CRM.P38i_was_deassigned_by
-
-        range_class_constraint = E42Identifier
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p38_deassigned = EntityProperty(CRM.P38_deassigned,
+                                    prop_inverse=CRM.P38i_was_deassigned_by,
+                                    range_class="E42Identifier",
+                                    doc="P38 deassigned (was deassigned by): E42 Identifier")
 
 
 # E17 Type Assignment
@@ -2595,26 +1210,10 @@ class E31Document(E73InformationObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p70_documents(self, *entities, uris: list = None) -> bool:
-        """P70 documents (is documented in): E1 CRM Entity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P70_documents
-        prop_inverse = CRM.P70i_is_documented_in
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p70_documents = EntityProperty(CRM.P70_documents,
+                                   prop_inverse=CRM.P70i_is_documented_in,
+                                   range_class="E1CRMEntity",
+                                   doc="P70 documents (is documented in): E1 CRM Entity")
 
 
 class E32AuthorityDocument(E31Document):
@@ -2629,26 +1228,10 @@ class E32AuthorityDocument(E31Document):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def p71_lists(self, *entities, uris: list = None) -> bool:
-        """P71 lists (is listed in): E1 CRM Entity
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CRM.P71_lists
-        prop_inverse = CRM.P71i_is_listed_in
-
-        range_class_constraint = E1CRMEntity
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    p71_lists = EntityProperty(CRM.P71_lists,
+                               prop_inverse=CRM.P71i_is_listed_in,
+                               range_class="E1CRMEntity",
+                               doc="P71 lists (is listed in): E1 CRM Entity")
 
 # E36 Visual Item
 
@@ -7,7 +7,7 @@ from rdflib import Namespace
 from .skos import SkosConcept, SkosConceptScheme
 from .cidoc import E55Type, E32AuthorityDocument
 from .crmcls import X7Format, X3Feature
-from .ontologies import SKOSNAMESPACE, CIDOCNAMESPACE
+from .namespaces import SKOSNAMESPACE, CIDOCNAMESPACE
 
 SKOS = Namespace(SKOSNAMESPACE)
 CRM = Namespace(CIDOCNAMESPACE)
@@ -19,11 +19,11 @@ class CLSCorVocabTerm(E55Type, SkosConcept):
     Vocabulary Term is an instance of SkosConcept AND E55 Type
     """
 
+    # multiple instantiation is needed here
+    additional_class_uris = (SkosConcept.class_uri, E55Type.class_uri)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # multiple instantiation is needed here
-        self.graph = self.graph + self.instance_of_class(class_uri=SkosConcept.class_uri)
-        self.graph = self.graph + self.instance_of_class(class_uri=E55Type.class_uri)
 
     def is_term_in(self, *entities, uris: list = None, skos_top_concept: bool = False) -> bool:
         """is term in
@@ -79,11 +79,11 @@ class CLSCorVocab(E32AuthorityDocument, SkosConceptScheme):
     Vocabulary Term is an instance of SkosConcept AND E55 Type
     """
 
+    # multiple instantiation is needed here
+    additional_class_uris = (SkosConceptScheme.class_uri, E32AuthorityDocument.class_uri)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # multiple instantiation is needed here
-        self.graph = self.graph + self.instance_of_class(class_uri=SkosConceptScheme.class_uri)
-        self.graph = self.graph + self.instance_of_class(class_uri=E32AuthorityDocument.class_uri)
 
 
 class CLSCorFormat(CLSCorVocabTerm, X7Format):
@@ -92,11 +92,11 @@ class CLSCorFormat(CLSCorVocabTerm, X7Format):
     Format is an instance of cls:X7Format, crm:E55 Type (because of PE43EncodingType subClass E55) and skos:Concept
     """
 
+    # multiple instantiation is needed here
+    additional_class_uris = (SkosConcept.class_uri, X7Format.class_uri)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # multiple instantiation is needed here
-        self.graph = self.graph + self.instance_of_class(class_uri=SkosConcept.class_uri)
-        self.graph = self.graph + self.instance_of_class(class_uri=X7Format.class_uri)
 
 
 class CLSCorFeature(CLSCorVocabTerm, X3Feature):
@@ -104,11 +104,8 @@ class CLSCorFeature(CLSCorVocabTerm, X3Feature):
 
     """
 
+    # multiple instantiation is needed here
+    additional_class_uris = (SkosConcept.class_uri, X3Feature.class_uri)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # multiple instantiation is needed here
-        self.graph = self.graph + self.instance_of_class(class_uri=SkosConcept.class_uri)
-        self.graph = self.graph + self.instance_of_class(class_uri=X3Feature.class_uri)
-
-
-
@@ -9,8 +9,10 @@ from .cidoc import E73InformationObject, E55Type, E7Activity, E58MeasurementUnit
 from .lrmoo import F3Manifestation
 from .crmdig import D1DigitalObject, D14Software
 from .pem import PE43EncodingType
+from .properties import EntityProperty
+from .namespaces import CLSCORNAMESPACE
 
-NAMESPACE = "https://clscor.io/ontologies/CRMcls/"
+NAMESPACE = CLSCORNAMESPACE
 
 CLS = Namespace(NAMESPACE)
 
@@ -41,47 +43,15 @@ class X2CorpusDocument(D1DigitalObject, F3Manifestation):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def y2_has_format(self, *entities, uris: list = None) -> bool:
-        """Y2 has format (Y2i is format of): X7Format
+    y2_has_format = EntityProperty(CLS.Y2_has_format,
+                                   prop_inverse=CLS.Y2i_is_format_of,
+                                   range_class="X7Format",
+                                   doc="Y2 has format (Y2i is format of): X7Format")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CLS.Y2_has_format
-        prop_inverse = CLS.Y2i_is_format_of
-
-        range_class_constraint = X7Format
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def y3_adheres_to_schema(self, *entities, uris: list = None) -> bool:
-        """Y3 adheres to schema (Y3i is schema of): X8Schema
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = CLS.Y3_adheres_to_schema
-        prop_inverse = CLS.Y3i_is_schema_of
-
-        range_class_constraint = X8Schema
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    y3_adheres_to_schema = EntityProperty(CLS.Y3_adheres_to_schema,
+                                          prop_inverse=CLS.Y3i_is_schema_of,
+                                          range_class="X8Schema",
+                                          doc="Y3 adheres to schema (Y3i is schema of): X8Schema")
 
 class X3Feature(E73InformationObject, E58MeasurementUnit):
     """X3 Feature
@@ -8,9 +8,11 @@ Author: Ingo Börner
 
 from rdflib import Namespace
 from .cidoc import E73InformationObject, E54Dimension, E11Modification, E65Creation, E16Measurement, E55Type
+from .properties import EntityProperty
+from .namespaces import DIGNAMESPACE
 
 # Base uri used for Class URIs
-NAMESPACE = "http://www.ics.forth.gr/isl/CRMdig/"
+NAMESPACE = DIGNAMESPACE
 
 DIG = Namespace(NAMESPACE)
 
@@ -26,68 +28,20 @@ class D1DigitalObject(E73InformationObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def l10i_was_input_of(self, *entities, uris: list = None) -> bool:
-        """L10i was input of (had input): D7 Digital Machine Event
+    l10i_was_input_of = EntityProperty(DIG.L10i_was_input_of,
+                                       prop_inverse=DIG.L10_had_input,
+                                       range_class="D7DigitalMachineEvent",
+                                       doc="L10i was input of (had input): D7 Digital Machine Event")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    l11i_was_output_of = EntityProperty(DIG.L10i_was_output_of,
+                                        prop_inverse=DIG.L11_had_output,
+                                        range_class="D7DigitalMachineEvent",
+                                        doc="L11i was output of (had output): D7 Digital Machine Event")
 
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L10i_was_input_of
-        prop_inverse = DIG.L10_had_input
-
-        range_class_constraint = D7DigitalMachineEvent
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def l11i_was_output_of(self, *entities, uris: list = None) -> bool:
-        """L11i was output of (had output): D7 Digital Machine Event
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L10i_was_output_of
-        prop_inverse = DIG.L11_had_output
-
-        range_class_constraint = D7DigitalMachineEvent
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def l2i_was_source_for(self, *entities, uris: list = None) -> bool:
-        """L2i was source for (used as source): D10 Software Execution
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L2i_was_source_for
-        prop_inverse = DIG.L2_used_as_source
-
-        range_class_constraint = D10SoftwareExecution
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    l2i_was_source_for = EntityProperty(DIG.L2i_was_source_for,
+                                        prop_inverse=DIG.L2_used_as_source,
+                                        range_class="D10SoftwareExecution",
+                                        doc="L2i was source for (used as source): D10 Software Execution")
 
 
 class D7DigitalMachineEvent(E11Modification, E65Creation):
@@ -106,68 +60,20 @@ class D7DigitalMachineEvent(E11Modification, E65Creation):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def l10_had_input(self, *entities, uris: list = None) -> bool:
-        """L10 had input (was input of): D1 Digital Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L10_had_input
-        prop_inverse = DIG.L10i_was_input_of
-
-        range_class_constraint = D1DigitalObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def l11_had_output(self, *entities, uris: list = None) -> bool:
-        """L11 had output (was output of): D1 Digital Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L11_had_output
-        prop_inverse = DIG.L10i_was_output_of
-
-        range_class_constraint = D1DigitalObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def l23_used_software_or_firmware(self, *entities, uris: list = None) -> bool:
-        """L23 used software or firmware (was software or firmware used by): D14 Software
+    l10_had_input = EntityProperty(DIG.L10_had_input,
+                                   prop_inverse=DIG.L10i_was_input_of,
+                                   range_class="D1DigitalObject",
+                                   doc="L10 had input (was input of): D1 Digital Object")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    l11_had_output = EntityProperty(DIG.L11_had_output,
+                                    prop_inverse=DIG.L10i_was_output_of,
+                                    range_class="D1DigitalObject",
+                                    doc="L11 had output (was output of): D1 Digital Object")
 
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L23_used_software_or_firmware
-        prop_inverse = DIG.L23i_was_software_or_firmware_used_by
-
-        range_class_constraint = D14Software
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    l23_used_software_or_firmware = EntityProperty(DIG.L23_used_software_or_firmware,
+                                                   prop_inverse=DIG.L23i_was_software_or_firmware_used_by,
+                                                   range_class="D14Software",
+                                                   doc="L23 used software or firmware (was software or firmware used by): D14 Software")
 
 
 class D9DataObject(D1DigitalObject, E54Dimension):
@@ -181,26 +87,10 @@ class D9DataObject(D1DigitalObject, E54Dimension):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def l20i_was_created_by(self, *entities, uris: list = None) -> bool:
-        """L20i was created by (has created): D11 Digital Measurement Event
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L20i_was_created_by
-        prop_inverse = DIG.L20_has_created
-
-        range_class_constraint = D11DigitalMeasurementEvent
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    l20i_was_created_by = EntityProperty(DIG.L20i_was_created_by,
+                                         prop_inverse=DIG.L20_has_created,
+                                         range_class="D11DigitalMeasurementEvent",
+                                         doc="L20i was created by (has created): D11 Digital Measurement Event")
 
 
 class D10SoftwareExecution(D7DigitalMachineEvent):
@@ -218,26 +108,10 @@ class D10SoftwareExecution(D7DigitalMachineEvent):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def l2_used_as_source(self, *entities, uris: list = None) -> bool:
-        """L2 used as source (was source for): D1 Digital Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L2_used_as_source
-        prop_inverse = DIG.L2i_was_source_for
-
-        range_class_constraint = D1DigitalObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    l2_used_as_source = EntityProperty(DIG.L2_used_as_source,
+                                       prop_inverse=DIG.L2i_was_source_for,
+                                       range_class="D1DigitalObject",
+                                       doc="L2 used as source (was source for): D1 Digital Object")
 
 
 class D11DigitalMeasurementEvent(D7DigitalMachineEvent, E16Measurement):
@@ -253,47 +127,15 @@ class D11DigitalMeasurementEvent(D7DigitalMachineEvent, E16Measurement):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def l17_measured_thing_of_type(self, *entities, uris: list = None) -> bool:
-        """L17 measured thing of type (was type of thing measured by): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    l17_measured_thing_of_type = EntityProperty(DIG.L17_measured_thing_of_type,
+                                                prop_inverse=DIG.L17i_was_type_of_thing_measured_by,
+                                                range_class="E55Type",
+                                                doc="L17 measured thing of type (was type of thing measured by): E55 Type")
 
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L17_measured_thing_of_type
-        prop_inverse = DIG.L17i_was_type_of_thing_measured_by
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def l20_has_created(self, *entities, uris: list = None) -> bool:
-        """L20 has created (was created by): D9 Data Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L20_has_created
-        prop_inverse = DIG.L20i_was_created_by
-
-        range_class_constraint = D9DataObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    l20_has_created = EntityProperty(DIG.L20_has_created,
+                                     prop_inverse=DIG.L20i_was_created_by,
+                                     range_class="D9DataObject",
+                                     doc="L20 has created (was created by): D9 Data Object")
 
 
 class D14Software(D1DigitalObject):
@@ -306,24 +148,8 @@ class D14Software(D1DigitalObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def l23i_was_software_or_firmware_used_by(self, *entities, uris: list = None) -> bool:
-        """L23i was software or firmware used by (used software or firmware): D7 Digital Machine Event
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = DIG.L23i_was_software_or_firmware_used_by
-        prop_inverse = DIG.L23_used_software_or_firmware
-
-        range_class_constraint = D7DigitalMachineEvent
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    l23i_was_software_or_firmware_used_by = EntityProperty(DIG.L23i_was_software_or_firmware_used_by,
+                                                           prop_inverse=DIG.L23_used_software_or_firmware,
+                                                           range_class="D7DigitalMachineEvent",
+                                                           doc="L23i was software or firmware used by (used software or firmware): D7 Digital Machine Event")
 
@@ -2,14 +2,28 @@
 
 Provides basic functionality of all entities.
 """
+import importlib
 import logging
 from marshmallow import Schema, fields, ValidationError
 from .sparql import DB
+from .session import Session, STRICT, BATCH, TRUSTED, VALIDATION_POLICIES
+from .buffer import TripleBuffer
 from rdflib import Graph, Literal, URIRef, RDF, RDFS, XSD
-from .ontologies import Ontologies
 
-ONTOLOGIES = Ontologies()
-PREFIXES = ONTOLOGIES.get_prefixes_uris()
+# rdf:type URIs per class, see Entity.rdf_types
+RDF_TYPES = dict()
+
+# Results of the class constraint checks: (class, constraint class) -> bool, see is_allowed_class
+CLASS_CHECKS = dict()
+
+# Modules with the classes an entity fetched from a triple store can be an instance of, see entity_class
+ONTOLOGY_MODULES = ("cidoc", "lrmoo", "crmdig", "pem", "crmcls", "skos", "clscor")
+
+# Class of a fetched entity: (base class, rdf:type URIs) -> class
+ENTITY_CLASSES = dict()
+
+# Query to fetch the statements of several entities, see Entity.fetch_many
+FETCH_QUERY = "CONSTRUCT {{ ?s ?p ?o }} WHERE {{ VALUES ?s {{ {values} }} ?s ?p ?o }}"
 
 
 class LabelSchema(Schema):
@@ -18,6 +32,125 @@ class LabelSchema(Schema):
     label = fields.Str()
 
 
+# Schemas do not keep state between calls of load, one instance is used for all labels
+LABEL_SCHEMA = LabelSchema()
+
+
+def is_allowed_class(entity_class, constraint) -> bool:
+    """Check if instances of a class are allowed where an instance of constraint is expected
+
+    The result is cached per pair of classes.
+
+    Args:
+        entity_class: Class of the entity
+        constraint: Expected class
+
+    Returns:
+        bool: True if entity_class is constraint or a subclass thereof
+    """
+    key = (entity_class, constraint)
+    result = CLASS_CHECKS.get(key)
+
+    if result is None:
+        result = issubclass(entity_class, constraint)
+        CLASS_CHECKS[key] = result
+
+    return result
+
+
+def entity_class(base, class_uris) -> type:
+    """Get the class of an entity by its rdf:type statements
+
+    Of the subclasses of base (and base itself), the class with the most rdf:types (see Entity.rdf_types) that are
+    all in class_uris is chosen, e.g. E55Type for crm:E55_Type. The ontology modules are loaded on the first call.
+
+    Args:
+        base: Entity class the class must be a subclass of
+        class_uris: URIs of the classes of the entity (objects of rdf:type)
+
+    Returns:
+        type: Class or base if no class matches
+    """
+    class_uris = frozenset(URIRef(uri) for uri in class_uris)
+    key = (base, class_uris)
+
+    if key not in ENTITY_CLASSES:
+        for name in ONTOLOGY_MODULES:
+            importlib.import_module("." + name, __package__)
+
+        result = base
+        size = 0
+
+        # breadth-first, the more general class wins if the rdf:types are the same
+        classes = [base]
+        seen = set()
+        while classes:
+            klass = classes.pop(0)
+            if klass in seen:
+                continue
+            seen.add(klass)
+
+            rdf_types = klass.rdf_types()
+            if len(rdf_types) > size and class_uris.issuperset(rdf_types):
+                result = klass
+                size = len(rdf_types)
+
+            classes.extend(klass.__subclasses__())
+
+        ENTITY_CLASSES[key] = result
+
+    return ENTITY_CLASSES[key]
+
+
+def is_shared(entity) -> bool:
+    """Check if the buffer of an entity also holds the triples of other entities
+
+    This is the case for entities of a session and for handles of entities created in bulk.
+
+    Args:
+        entity: Entity or EntityHandle
+
+    Returns:
+        bool: True if the buffer is shared
+    """
+    return isinstance(entity, EntityHandle) or entity.session is not None
+
+
+class EntityHandle:
+    """Entity Handle
+
+    Lightweight reference to an entity that was created in bulk, e.g. with Entity.bulk_create. It can be used
+    as range of a property like an instance of the entity class.
+
+    Attributes:
+        uri (str): URI of the Entity
+        entity_class: Class of the Entity
+        buffer (TripleBuffer): Buffer the triples of the entity were written to
+    """
+
+    __slots__ = ("uri", "entity_class", "buffer")
+
+    def __init__(self, uri: str, entity_class, buffer: TripleBuffer):
+        """Initialize
+
+        Args:
+            uri (str): URI of the Entity
+            entity_class: Class of the Entity
+            buffer (TripleBuffer): Buffer the triples of the entity were written to
+        """
+        self.uri = uri
+        self.entity_class = entity_class
+        self.buffer = buffer
+
+    def __repr__(self) -> str:
+        return f"<{self.entity_class.__name__} {self.uri}>"
+
+    @property
+    def graph(self) -> Graph:
+        """Graph of the buffer the entity was written to"""
+        return self.buffer.graph()
+
+
 class Entity:
     """Entity
 
@@ -25,22 +158,62 @@ class Entity:
 
     Attributes:
         class_uri: URI of the Entity Class
+        additional_class_uris (tuple): URIs of further classes an instance is also an instance of (multiple
+            instantiation). Collected from all classes in the MRO.
+        infer_types (bool): Also add rdf:type for the URIs of all superclasses (e.g. E55 Type, E28 Conceptual Object,
+            E71 Human-Made Thing, ...)
+        validation (str): Validation policy. "strict": the arguments of every call are checked and each label is
+            validated (default); "batch": the labels of a call are validated at once; "trusted": nothing is checked,
+            e.g. for bulk loads of data that was validated upstream.
         uri (str): URI of the Entity
         database (DB): Triple Store connection
-        graph (Graph): Entity as rdflib.Graph
+        session (Session): Session the entity writes its triples to
+        buffer (TripleBuffer): Compact store of the triples. Triples are accumulated in place, the buffer lives as
+            long as the entity. If the entity belongs to a session, this is the buffer shared by the session.
+        graph (Graph): Entity as rdflib.Graph. Built from the buffer when accessed and cached until the next change.
     """
 
     # URI of the class
     class_uri = None
 
+    # URIs of further classes (multiple instantiation)
+    additional_class_uris = ()
+
+    # Add rdf:type statements of the superclasses
+    infer_types = False
+
+    # Validation policy
+    validation = STRICT
+
     # URI
     uri = None
 
     # Database connection
     database = None
 
-    # Graph
-    graph = None
+    # Session
+    session = None
+
+    # Triples
+    buffer = None
+
+    def __new__(cls, class_uri: str = None, uri: str = None, labels: list = None, mode: str = "create",
+                database: DB = None, session: Session = None, *args, **kwargs):
+        """Return the registered instance if the session keeps a registry and the URI is known
+
+        The arguments are bound like the arguments of __init__, positional or by keyword.
+        """
+        if session is not None and uri:
+            entity = session.get(uri)
+
+            if entity is not None:
+                if isinstance(entity, cls):
+                    return entity
+
+                logging.warning(f"Entity '{uri}' is registered as '{type(entity).__name__}', not as '{cls.__name__}'."
+                                f" Will create a new instance that is not registered.")
+
+        return super().__new__(cls)
 
     def __init__(self,
                  class_uri: str = None,
@@ -48,6 +221,10 @@ class Entity:
                  labels: list = None,
                  mode: str = "create",
                  database: DB = None,
+                 session: Session = None,
+                 infer_types: bool = None,
+                 validation: str = None,
+                 statements: list = None,
                  **kwargs
                  ):
         """Initialize
@@ -56,27 +233,83 @@ class Entity:
             class_uri (str, optional): URI of the entity class
             uri (str, optional): URI of the Entity
             labels (list, optional): Labels (rdfs:label)
-            mode (str): Create new data ("create") or fetch ("fetch") existing data from a triple store
+            mode (str): Create new data ("create") or fetch ("fetch") existing labels from the triple store (database)
             database (DB): Triple Store Connection
+            session (Session, optional): Session to add the triples to. Otherwise, the entity has its own graph.
+                If the session keeps a registry and an entity with the URI exists, that instance is returned.
+            infer_types (bool, optional): Also add rdf:type for all superclasses. Defaults to the class attribute.
+            validation (str, optional): Validation policy: "strict", "batch" or "trusted". Defaults to the policy of
+                the session or the class attribute.
+            statements (list, optional): Triples of the entity fetched from the triple store (see fetch_many). They
+                are added instead of the rdf:type statements of the class.
         """
 
-        # Create the graph
-        self.graph = self.__initialize_graph()
+        # constructed again with the URI of an entity in the registry of the session (see __new__)
+        registered = session is not None and uri is not None and session.get(uri) is self
+
+        if validation:
+            assert validation in VALIDATION_POLICIES, f"Invalid validation policy. Expected one of {VALIDATION_POLICIES}."
+            self.validation = validation
+        elif session is not None and session.validation:
+            self.validation = session.validation
+
+        checked = self.validation != TRUSTED
+
+        if session:
+            if checked:
+                assert type(session) == Session, "Invalid type. Expected Session."
+            self.session = session
+            # write to the shared buffer of the session
+            self.buffer = session.buffer
+        else:
+            self.buffer = TripleBuffer()
 
         if uri:
-            assert type(uri) == str, "Invalid type. Expected a string."
+            if checked:
+                assert type(uri) == str, "Invalid type. Expected a string."
             self.uri = uri
 
-        if class_uri:
-            assert type(class_uri) == str, "Invalid type. Expected a string."
-            self.class_uri = class_uri
-            self.graph = self.graph + self.instance_of_class()
+            if session and not registered:
+                session.register(self)
+
+        if infer_types is not None:
+            self.infer_types = infer_types
+
+        if class_uri and registered:
+            if checked:
+                assert type(class_uri) == str, "Invalid type. Expected a string."
+            # the types of the registered instance are in the buffer already, only a new class URI is added
+            if class_uri != self.class_uri:
+                self.add_rdf_types((URIRef(class_uri),))
 
-        elif self.class_uri:
+        elif class_uri:
+            if checked:
+                assert type(class_uri) == str, "Invalid type. Expected a string."
+            self.class_uri = class_uri
+            # the class URI passed replaces the one set on the class level (if there is one), the additional
+            # class URIs are kept, also if one of them is the class URI of the class level
+            replaced = None
+            inherited = type(self).class_uri
+            if inherited and not any(inherited in klass.__dict__.get("additional_class_uris", ())
+                                     for klass in type(self).__mro__):
+                replaced = URIRef(inherited)
+            class_uris = tuple(uri for uri in self.rdf_types(self.infer_types) if uri != replaced)
+            self.add_rdf_types((URIRef(class_uri),) + class_uris)
+
+        elif self.class_uri and not registered and statements is None:
             # this was set on the class level; should also add it to the graph
-            self.graph = self.graph + self.instance_of_class()
+            self.add_rdf_types(self.rdf_types(self.infer_types))
 
-        if labels:
+        if statements is not None:
+            # hydrated: only the statements of the triple store, the entity states no types of its own
+            self.add_graph(statements)
+
+        if database:
+            if checked:
+                assert type(database) == DB, "Invalid type. Expected sparql.DB (database connection)."
+            self.database = database
+
+        if labels or mode == "fetch":
             """
                 [ 
                     {
@@ -87,9 +320,202 @@ class Entity:
             """
             self.add_labels(data=labels, mode=mode)
 
-        if database:
-            assert type(database) == DB, "Invalid type. Expected sparql.DB (database connection)."
-            self.database = database
+    @classmethod
+    def rdf_types(cls, inferred: bool = False) -> tuple:
+        """URIs of all classes an instance of this class is an instance of
+
+        class_uri and the additional_class_uris of all classes in the MRO. With inferred=True also the class_uri of
+        all superclasses. Computed once per class.
+
+        Args:
+            inferred (bool, optional): Include the superclasses. Defaults to False.
+
+        Returns:
+            tuple: URIRefs of the classes; class_uri is the first
+        """
+        key = (cls, inferred)
+
+        if key not in RDF_TYPES:
+            uris = [cls.class_uri] if cls.class_uri else []
+
+            for klass in cls.__mro__:
+                uris.extend(klass.__dict__.get("additional_class_uris", ()))
+
+                if inferred and klass.__dict__.get("class_uri"):
+                    uris.append(klass.__dict__["class_uri"])
+
+            RDF_TYPES[key] = tuple(URIRef(uri) for uri in dict.fromkeys(uris))
+
+        return RDF_TYPES[key]
+
+    def add_rdf_types(self, class_uris: tuple) -> bool:
+        """Add rdf:type statements for several classes in one step
+
+        Args:
+            class_uris (tuple): URIs of the classes, e.g. as returned by rdf_types()
+
+        Returns:
+            bool: True if added
+        """
+        if not self.uri:
+            logging.warning("No URI of this entity is set. Will not add rdf:type statement.")
+            return False
+
+        domain_e = URIRef(self.uri)
+        self.buffer.extend([(domain_e, RDF.type, class_e) for class_e in class_uris])
+
+        return True
+
+    @classmethod
+    def bulk_create(cls,
+                    records,
+                    base_uri: str = "",
+                    prop: URIRef = RDFS.label,
+                    lang: str = None,
+                    session: Session = None,
+                    buffer: TripleBuffer = None) -> list:
+        """Create many entities of this class from records in one pass
+
+        Each record is a dictionary with an "id" that is appended to base_uri (or the full "uri"), and optionally
+        a "label" and its "lang". No instances of the class are created, all triples are written to one buffer.
+
+        Args:
+            records: Iterable of records, e.g. [{"id": "drama", "label": "Drama", "lang": "de"}]
+            base_uri (str, optional): Base URI of the entities
+            prop (URIRef, optional): Property of the label. Defaults to rdfs:label
+            lang (str, optional): Language of the labels if a record does not have "lang"
+            session (Session, optional): Session to write the triples to
+            buffer (TripleBuffer, optional): Buffer to write the triples to if no session is passed
+
+        Returns:
+            list: EntityHandle of each created entity
+        """
+        if session:
+            buffer = session.buffer
+        elif buffer is None:
+            buffer = TripleBuffer()
+
+        class_uris = cls.rdf_types(cls.infer_types)
+
+        triples = []
+        handles = []
+
+        for record in records:
+            uri = cls.record_uri(record, base_uri)
+            if uri is None:
+                continue
+
+            domain_e = URIRef(uri)
+
+            for class_e in class_uris:
+                triples.append((domain_e, RDF.type, class_e))
+
+            if record.get("label"):
+                triples.append((domain_e, prop, Literal(record["label"], lang=record.get("lang", lang))))
+
+            handles.append(EntityHandle(uri, cls, buffer))
+
+        buffer.extend(triples)
+
+        return handles
+
+    @staticmethod
+    def record_uri(record: dict, base_uri: str = "") -> str:
+        """URI of the entity described by a record
+
+        Args:
+            record (dict): Record with "uri" or "id"
+            base_uri (str, optional): Base URI the "id" is appended to
+
+        Returns:
+            str: URI or None if the record has neither "uri" nor "id"
+        """
+        if record.get("uri"):
+            return record["uri"]
+
+        if record.get("id"):
+            return base_uri + record["id"]
+
+        logging.warning("Record has neither 'uri' nor 'id'. Skipped.")
+        return None
+
+    @classmethod
+    def fetch_many(cls,
+                   uris: list,
+                   database: DB,
+                   session: Session = None,
+                   chunk_size: int = 200) -> list:
+        """Fetch many entities from the triple store
+
+        The statements of the entities (as subject) are fetched with one CONSTRUCT query per chunk of URIs.
+        Each entity is an instance of the class that matches its rdf:type statements best (see entity_class), e.g.
+        SkosConcept.fetch_many returns instances of SkosConcept or its subclasses. URIs whose rdf:types do not
+        include the types of cls (e.g. a skos:ConceptScheme fetched with SkosConcept) are skipped with a warning.
+        The entities hold the fetched statements only, no rdf:type statements are added.
+
+        Args:
+            uris (list): URIs of the entities
+            database (DB): Triple Store connection
+            session (Session, optional): Session to add the triples to. Otherwise, each entity has its own graph.
+            chunk_size (int, optional): Number of URIs per query. Defaults to 200.
+
+        Returns:
+            list: Entities in the order of the URIs. URIs without statements in the triple store or of another
+                class are left out.
+        """
+        assert type(database) == DB, "Invalid type. Expected sparql.DB (database connection)."
+
+        uris = list(dict.fromkeys(str(uri) for uri in uris))
+
+        # statements per subject
+        statements = {uri: [] for uri in uris}
+
+        for start in range(0, len(uris), chunk_size):
+            values = " ".join(URIRef(uri).n3() for uri in uris[start:start + chunk_size])
+            for s, p, o in database.construct(FETCH_QUERY.format(values=values)):
+                statements[str(s)].append((s, p, o))
+
+        entities = []
+
+        for uri in uris:
+            if not statements[uri]:
+                continue
+
+            class_uris = frozenset(o for s, p, o in statements[uri] if p == RDF.type)
+            klass = entity_class(cls, class_uris)
+
+            if not class_uris.issuperset(klass.rdf_types()):
+                logging.warning(f"Entity '{uri}' is not an instance of '{cls.__name__}' (rdf:type"
+                                f" {', '.join(sorted(str(class_uri) for class_uri in class_uris)) or 'missing'})."
+                                f" Skipped.")
+                continue
+
+            # the data is read from the triple store, it is not validated again
+            entities.append(klass(uri=uri, database=database, session=session, validation=TRUSTED,
+                                  statements=statements[uri]))
+
+        return entities
+
+    @classmethod
+    def fetch(cls, uri: str, database: DB, session: Session = None):
+        """Fetch an entity from the triple store
+
+        See fetch_many.
+
+        Args:
+            uri (str): URI of the entity
+            database (DB): Triple Store connection
+            session (Session, optional): Session to add the triples to
+
+        Returns:
+            Entity: Instance or None if there are no statements about the URI
+        """
+        entities = cls.fetch_many([uri], database, session=session)
+
+        if entities:
+            return entities[0]
+
+        return None
 
     @staticmethod
     def __item_is_valid(item: dict, schema: Schema) -> bool:
@@ -110,26 +536,62 @@ class Entity:
             return False
 
     @staticmethod
-    def __initialize_graph() -> Graph:
-        """Return a bare rdflib.graph with prefixes
+    def __valid_items(items: list, schema: Schema) -> list:
+        """Helper function to validate all labels at once
+
+        Args:
+            items (list): Items to validate
+            schema (Schema): Schema used to validate
 
         Returns:
-            bool: True if successful
+            list: Valid items
+        """
+        try:
+            schema.load(items, many=True)
+            return items
+        except ValidationError as error:
+            # messages are keyed by the index of the invalid items
+            logging.debug(f"Validation of {len(error.messages)} items failed. Removed.")
+            return [item for index, item in enumerate(items) if index not in error.messages]
+
+    @property
+    def graph(self) -> Graph:
+        """Entity as rdflib.Graph
+
+        The graph is built from the buffer and cached until the next change. Changes to the returned graph
+        are not written back, use add_graph() instead.
         """
+        return self.buffer.graph()
 
-        g = Graph()
+    @graph.setter
+    def graph(self, graph: Graph):
+        """Replace the triples of the entity with the triples of a graph
 
-        # add the namespaces
-        for item in PREFIXES:
-            g.namespace_manager.bind(item["prefix"], URIRef(item["uri"]))
+        The buffer is kept (with an attached sink). Not possible for an entity of a session, the buffer is shared.
+        """
+        if self.session is not None:
+            raise Exception("Can not replace the graph of an entity of a session. Use add_graph() instead.")
 
-        return g
+        self.buffer.clear()
+        self.buffer.extend(graph)
+
+    def add_graph(self, graph: Graph) -> bool:
+        """Add all triples of a graph
+
+        Args:
+            graph (Graph): rdflib.Graph, e.g. as returned by instance_of_class()
+
+        Returns:
+            bool: True if successful
+        """
+        self.buffer.extend(graph)
+        return True
 
     def add_labels(self, data: list = None, mode: str = "create") -> bool:
         """Add rdfs: labels to the graph.
 
         If the flag is set to create, it is expected, that there is a list of labels passed as "data".
-        mode="fetch" is not implemented.
+        With mode="fetch" the labels of the entity are fetched from the triple store (self.database).
 
         Args:
             data (list): Data of labels. Should confirm to schema LabelSchema.
@@ -140,11 +602,21 @@ class Entity:
 
         """
         if mode == "create":
-            self.graph = self.graph + self.__generate_rdfs_labels(labels=data)
+            self.buffer.extend(self.__generate_rdfs_labels(labels=data))
+            return True
+
+        elif mode == "fetch":
+            if self.database is None or not self.uri:
+                logging.warning("No database connection or no URI of this entity is set. Can not fetch labels.")
+                return False
+
+            domain = URIRef(self.uri).n3()
+            query = f"CONSTRUCT {{ {domain} {RDFS.label.n3()} ?label }} WHERE {{ {domain} {RDFS.label.n3()} ?label }}"
+            self.buffer.extend(self.database.construct(query))
             return True
 
         else:
-            raise Exception("Fetching data not implemented.")
+            raise Exception(f"Unknown mode '{mode}'.")
 
     def __generate_rdfs_labels(self,
                                domain_uri: str = None,
@@ -157,20 +629,27 @@ class Entity:
             domain_uri (str): URI of the domain. Defaults to self.uri
             labels (list): label data
             lang_to_literals (bool): Explicitly add language to literals. Defaults to False.
+            validation (bool): Validate the labels according to the validation policy. Defaults to True.
 
         Returns:
             Graph: rdflib.Graph containing the labels
 
         """
         if labels:
-            assert type(labels) == list, "Invalid type. Expected a list."
+            if self.validation != TRUSTED:
+                assert type(labels) == list, "Invalid type. Expected a list."
 
-            if validation:
-                schema = LabelSchema()
+            if validation and self.validation == STRICT:
+                valid_labels = []
                 for item in labels:
-                    if self.__item_is_valid(item, schema) is False:
-                        labels.pop(item)
+                    if self.__item_is_valid(item, LABEL_SCHEMA):
+                        valid_labels.append(item)
+                    else:
                         logging.debug("Validation of item failed. Removed.")
+                labels = valid_labels
+
+            elif validation and self.validation == BATCH:
+                labels = self.__valid_items(labels, LABEL_SCHEMA)
 
             if len(labels) > 0:
 
@@ -270,10 +749,12 @@ class Entity:
         Returns:
             Graph: Triples in a graph
         """
-        if prop:
+        checked = self.validation != TRUSTED
+
+        if prop and checked:
             assert type(prop) == URIRef, "Invalid type. Expected property prop as URIRef."
 
-        if prop_inverse:
+        if prop_inverse and checked:
             assert type(prop_inverse) == URIRef, "Invalid type. Expected property prop_inverse as URIRef."
 
         if domain_uri:
@@ -287,7 +768,8 @@ class Entity:
                 return Graph()
 
         if uris:
-            assert type(uris) == list, "Invalid type. Expected a list of uris."
+            if checked:
+                assert type(uris) == list, "Invalid type. Expected a list of uris."
 
             # results graph
             g = Graph()
@@ -311,6 +793,7 @@ class Entity:
                                             prop: URIRef = None,
                                             prop_inverse: URIRef = None,
                                             range_class_constraint = None,
+                                            include_range_graph: bool = True
                                             ) -> Graph:
         """Add triples to graph: self.uri prop entity.uri.
 
@@ -320,6 +803,7 @@ class Entity:
             prop (URIRef): Property. Expected rdflib.term.URIRef, e.g. CRM.P1_is_identified_by
             prop_inverse (URIRef, optional): Inverse Property. Expected rdflib.term.URIRef, e.g. CRM.P1i_identifies
             range_class_constraint (optional): Expected class as range or a subclass thereof
+            include_range_graph (bool, optional): Add the triples of the range entity. Defaults to True.
 
         Returns:
             Graph: Triples in a graph
@@ -327,10 +811,12 @@ class Entity:
         Raises:
             ValidationError: Wrong Class or subclass provided as range.
         """
-        if prop:
+        checked = self.validation != TRUSTED
+
+        if prop and checked:
             assert type(prop) == URIRef, "Invalid type. Expected property prop as URIRef."
 
-        if prop_inverse:
+        if prop_inverse and checked:
             assert type(prop_inverse) == URIRef, "Invalid type. Expected property prop_inverse as URIRef."
 
         if domain_uri:
@@ -344,9 +830,14 @@ class Entity:
                 return Graph()
 
         if entity:
-            if range_class_constraint:
-                if issubclass(type(entity), range_class_constraint) is False:
-                    logging.warning(f"An instance of class '{type(entity).__name__}' is not allowed as range of"
+            if range_class_constraint and checked:
+                if isinstance(entity, EntityHandle):
+                    entity_class = entity.entity_class
+                else:
+                    entity_class = type(entity)
+
+                if is_allowed_class(entity_class, range_class_constraint) is False:
+                    logging.warning(f"An instance of class '{entity_class.__name__}' is not allowed as range of"
                                     f" '{str(prop)}'. Must be an instance of '{range_class_constraint.__name__}'"
                                     f" or a subclass thereof.")
                     raise ValidationError("Wrong class of range")
@@ -358,11 +849,18 @@ class Entity:
 
                 if prop:
                     g.add((domain_e, prop, URIRef(entity.uri)))
-                    g = g + entity.graph
 
                 if prop_inverse:
                     g.add((URIRef(entity.uri), prop_inverse, domain_e))
-                    g = g + entity.graph
+
+                # Entities of the same session already share their triples, only the link is added
+                if include_range_graph and (prop or prop_inverse) and entity.buffer is not self.buffer:
+                    if is_shared(entity):
+                        # only the statements about the entity, not the whole shared buffer
+                        for triple in entity.buffer.subject_triples([URIRef(entity.uri)]):
+                            g.add(triple)
+                    else:
+                        g += entity.graph
 
             return g
 
@@ -389,7 +887,9 @@ class Entity:
             Graph: Triples in a graph
 
         """
-        if prop:
+        checked = self.validation != TRUSTED
+
+        if prop and checked:
             assert type(prop) == URIRef, "Invalid type. Expected property prop as URIRef."
 
         if domain_uri:
@@ -402,10 +902,10 @@ class Entity:
                 logging.warning("No self.uri set. Will not create anything.")
                 return Graph()
 
-        if datatype:
+        if datatype and checked:
             assert type(datatype) == URIRef, "Expected URIRef as datatype."
 
-        if lang:
+        if lang and checked:
             assert type(lang) == str, "Expected language as string."
 
         if value:
@@ -446,13 +946,14 @@ class Entity:
 
         """
         if datatype:
-            assert type(datatype) == str, "Expected datatype as string."
+            if self.validation != TRUSTED:
+                assert type(datatype) == str, "Expected datatype as string."
             datatype_uri = XSD[datatype]
         else:
             datatype_uri = None
 
         g = self.generate_property_to_literal_value_triples(value, prop=prop, datatype=datatype_uri, lang=lang)
-        self.graph = self.graph + g
+        self.buffer.extend(g)
 
         return True
 
@@ -485,8 +986,18 @@ class Entity:
                     g = self.generate_property_to_entity_triples(entity,
                                                                  prop=prop,
                                                                  prop_inverse=prop_inverse,
-                                                                 range_class_constraint=range_class_constraint)
-                    self.graph = self.graph + g
+                                                                 range_class_constraint=range_class_constraint,
+                                                                 include_range_graph=False)
+                    self.buffer.extend(g)
+
+                    # copy the triples of the range entity from its buffer without building its graph;
+                    # nothing to copy if both belong to the same session
+                    if entity.uri and (prop or prop_inverse) and entity.buffer is not self.buffer:
+                        if is_shared(entity):
+                            # only the statements about the entity, not the whole shared buffer
+                            self.buffer.update(entity.buffer, subjects=[URIRef(entity.uri)])
+                        else:
+                            self.buffer.update(entity.buffer)
 
                 except ValidationError:
                     # Wrong class or subclass was provided as range. Catch the ValidationError
@@ -496,7 +1007,7 @@ class Entity:
 
         elif uris:
             g = self.generate_property_to_uris_triples(uris=uris, prop=prop, prop_inverse=prop_inverse)
-            self.graph = self.graph + g
+            self.buffer.extend(g)
 
             return True
 
@@ -504,9 +1015,166 @@ class Entity:
             logging.warning("No data provided to generate triples from.")
             return False
 
+    def add_edges(self,
+                  prop: URIRef,
+                  pairs=None,
+                  prop_inverse: URIRef = None,
+                  range_class_constraint=None,
+                  domains=None,
+                  ranges=None) -> bool:
+        """Add the triples domain prop range for many pairs to self.graph in one operation.
+
+        The domains do not need to be this entity; the triples are written to the buffer of this entity (the shared
+        buffer if it belongs to a session). See insert_edges.
+
+        Args:
+            prop (URIRef): Property
+            pairs (optional): Iterable of (domain, range) pairs. Items are URIs or entities (Entity, EntityHandle)
+            prop_inverse (URIRef, optional): Inverse Property
+            range_class_constraint (optional): Expected class as range or a subclass thereof
+            domains (optional): Domains as a sequence parallel to ranges, if no pairs are passed
+            ranges (optional): Ranges as a sequence parallel to domains, if no pairs are passed
+
+        Returns:
+            bool: True if successful
+        """
+        return self.insert_edges(self.buffer,
+                                 prop,
+                                 pairs=pairs,
+                                 prop_inverse=prop_inverse,
+                                 range_class_constraint=range_class_constraint,
+                                 domains=domains,
+                                 ranges=ranges,
+                                 validation=self.validation)
+
+    @staticmethod
+    def insert_edges(buffer: TripleBuffer,
+                     prop: URIRef,
+                     pairs=None,
+                     prop_inverse: URIRef = None,
+                     range_class_constraint=None,
+                     domains=None,
+                     ranges=None,
+                     domain_class_constraint=None,
+                     validation: str = STRICT) -> bool:
+        """Insert the triples domain prop range (and range prop_inverse domain) for many pairs into a buffer.
+
+        Class constraints are checked once per class of the entities, not per entity. URIs are not checked.
+        Nothing is checked with the validation policy "trusted". Nothing is inserted if an entity violates a constraint.
+        Triples of entities in other buffers are copied once per buffer; of a shared buffer (session, bulk creation)
+        only the statements about the linked entities are copied.
+
+        Args:
+            buffer (TripleBuffer): Buffer to insert the triples into
+            prop (URIRef): Property
+            pairs (optional): Iterable of (domain, range) pairs. Items are URIs or entities (Entity, EntityHandle)
+            prop_inverse (URIRef, optional): Inverse Property
+            range_class_constraint (optional): Expected class as range or a subclass thereof
+            domains (optional): Domains as a sequence parallel to ranges, if no pairs are passed
+            ranges (optional): Ranges as a sequence parallel to domains, if no pairs are passed
+            domain_class_constraint (optional): Expected class as domain or a subclass thereof
+            validation (str, optional): Validation policy. Defaults to "strict".
+
+        Returns:
+            bool: True if successful
+        """
+        checked = validation != TRUSTED
+
+        if checked:
+            assert type(prop) == URIRef, "Invalid type. Expected property prop as URIRef."
+
+        if prop_inverse and checked:
+            assert type(prop_inverse) == URIRef, "Invalid type. Expected property prop_inverse as URIRef."
+
+        if pairs is None:
+            if domains is None or ranges is None:
+                logging.warning("No data provided to generate triples from.")
+                return False
+
+            assert len(domains) == len(ranges), "Expected domains and ranges of the same length."
+            pairs = zip(domains, ranges)
+
+        if checked:
+            constraints = {"domain": domain_class_constraint, "range": range_class_constraint}
+        else:
+            constraints = {"domain": None, "range": None}
+
+        # buffers of the entities to copy the triples from: id -> (buffer, subjects or None for all triples)
+        linked_buffers = dict()
+
+        def term(item, role: str) -> URIRef:
+            if isinstance(item, str):
+                return URIRef(item)
+
+            if isinstance(item, EntityHandle):
+                item_class = item.entity_class
+            else:
+                item_class = type(item)
+
+            constraint = constraints[role]
+            if constraint and is_allowed_class(item_class, constraint) is False:
+                logging.warning(f"An instance of class '{item_class.__name__}' is not allowed as {role} of"
+                                f" '{str(prop)}'. Must be an instance of '{constraint.__name__}'"
+                                f" or a subclass thereof.")
+                raise ValidationError(f"Wrong class of {role}")
+
+            item_e = URIRef(item.uri)
+
+            if item.buffer is not buffer:
+                linked_buffer, subjects = linked_buffers.setdefault(id(item.buffer), (item.buffer, set()))
+                if subjects is not None:
+                    if is_shared(item):
+                        subjects.add(item_e)
+                    else:
+                        linked_buffers[id(item.buffer)] = (item.buffer, None)
+
+            return item_e
+
+        triples = []
+
+        try:
+            for domain, range_ in pairs:
+                domain_e = term(domain, "domain")
+                range_e = term(range_, "range")
+
+                triples.append((domain_e, prop, range_e))
+
+                if prop_inverse:
+                    triples.append((range_e, prop_inverse, domain_e))
+
+        except ValidationError:
+            # Wrong class or subclass was provided. Nothing is inserted.
+            return False
+
+        buffer.extend(triples)
+
+        for linked_buffer, subjects in linked_buffers.values():
+            buffer.update(linked_buffer, subjects=subjects)
+
+        return True
+
+    def attach(self, sink, retain: bool = False) -> bool:
+        """Attach a streaming sink, e.g. dlod.io.NTriplesWriter
+
+        Triples are written to the sink as they are added (to the shared buffer if the entity belongs to a session).
+        Triples that were added before are written at once.
+
+        Args:
+            sink: Object with a method write(triples)
+            retain (bool, optional): Also keep the triples in memory, e.g. to serialize them later. Defaults to False.
+
+        Returns:
+            bool: True if successful
+        """
+        self.buffer.attach(sink, retain=retain)
+        return True
+
     def dump(self) -> Graph:
         """Return the graph
 
+        The graph is built from the buffer when needed and cached until the next change.
+        If the entity belongs to a session, this is the shared graph of the session.
+
         Returns:
             Graph: Instance as Graph
 
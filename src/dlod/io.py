@@ -0,0 +1,130 @@
+"""IO
+
+Streaming sinks that write triples to a file while entities are created.
+"""
+import gzip
+from rdflib import URIRef, Literal, BNode
+
+
+def _quote(value: str) -> str:
+    """Escape a string for a literal in N-Triples"""
+    return (value.replace("\\", "\\\\")
+                 .replace('"', '\\"')
+                 .replace("\n", "\\n")
+                 .replace("\r", "\\r"))
+
+
+def nt_term(term) -> str:
+    """Serialize a term in N-Triples syntax
+
+    Args:
+        term: rdflib term (URIRef, Literal, BNode)
+
+    Returns:
+        str: Serialized term
+    """
+    if isinstance(term, Literal):
+        if term.language:
+            return f'"{_quote(str(term))}"@{term.language}'
+        if term.datatype:
+            return f'"{_quote(str(term))}"^^<{term.datatype}>'
+        return f'"{_quote(str(term))}"'
+
+    if isinstance(term, BNode):
+        return f"_:{term}"
+
+    return f"<{term}>"
+
+
+class NTriplesWriter:
+    """N-Triples Writer
+
+    Writes triples to a file as they are added. Attach it to an entity (Entity.attach) or a session (Session.attach);
+    the triples are written line by line with buffered writes, nothing is kept in memory.
+    Duplicate triples are not removed, but they have no effect when the file is loaded.
+
+    Attributes:
+        path (str): Path of the file
+        count (int): Number of triples written
+    """
+
+    path = None
+
+    count = 0
+
+    def __init__(self, path: str, compress: bool = None, buffer_size: int = 1 << 16):
+        """Initialize
+
+        Args:
+            path (str): Path of the file
+            compress (bool, optional): Write gzip-compressed. Defaults to True if path ends with ".gz"
+            buffer_size (int, optional): Size of the write buffer in bytes
+        """
+        self.path = path
+
+        if compress is None:
+            compress = path.endswith(".gz")
+
+        if compress:
+            self.__file = gzip.open(path, "wt", encoding="utf-8")
+        else:
+            self.__file = open(path, "w", encoding="utf-8", buffering=buffer_size)
+
+        self.count = 0
+
+    def _line(self, s, p, o) -> str:
+        return f"{nt_term(s)} {nt_term(p)} {nt_term(o)} .\n"
+
+    def write(self, triples) -> int:
+        """Write triples
+
+        Args:
+            triples: Iterable of triples, e.g. an rdflib.Graph
+
+        Returns:
+            int: Number of triples written
+        """
+        count = 0
+        write = self.__file.write
+        for s, p, o in triples:
+            write(self._line(s, p, o))
+            count += 1
+
+        self.count += count
+        return count
+
+    def flush(self) -> None:
+        """Flush the write buffer to the file"""
+        self.__file.flush()
+
+    def close(self) -> None:
+        """Close the file"""
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class NQuadsWriter(NTriplesWriter):
+    """N-Quads Writer
+
+    Like NTriplesWriter, but each triple is written to the named graph passed as "graph".
+    """
+
+    def __init__(self, path: str, graph: str, compress: bool = None, buffer_size: int = 1 << 16):
+        """Initialize
+
+        Args:
+            path (str): Path of the file
+            graph (str): URI of the named graph
+            compress (bool, optional): Write gzip-compressed. Defaults to True if path ends with ".gz"
+            buffer_size (int, optional): Size of the write buffer in bytes
+        """
+        super().__init__(path, compress=compress, buffer_size=buffer_size)
+        self.__graph = nt_term(URIRef(graph))
+
+    def _line(self, s, p, o) -> str:
+        return f"{nt_term(s)} {nt_term(p)} {nt_term(o)} {self.__graph} .\n"
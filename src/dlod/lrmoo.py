@@ -9,9 +9,11 @@ Author: Ingo Börner
 from rdflib import Namespace
 from .cidoc import E89PropositionalObject, E73InformationObject, E24PhysicalHumanMadeThing, E65Creation, E12Production, \
     E7Activity, E90SymbolicObject, E55Type, E54Dimension
+from .properties import EntityProperty
+from .namespaces import LRMNAMESPACE
 
 # Base uri used for Class URIs
-NAMESPACE = "http://iflastandards.info/ns/lrm/lrmoo/"
+NAMESPACE = LRMNAMESPACE
 
 LRM = Namespace(NAMESPACE)
 
@@ -37,341 +39,85 @@ class F1Work(E89PropositionalObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def r1_is_logical_successor_of(self, *entities, uris: list = None) -> bool:
-        """R1 is logical successor of (has successor): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R1_is_logical_successor_of
-        prop_inverse = LRM.R1i_has_successor
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r1i_has_successor(self, *entities, uris: list = None) -> bool:
-        """R1i has successor (is logical successor of): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R1i_has_successor
-        prop_inverse = LRM.R1_is_logical_successor_of
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r2_is_derivative_of(self, *entities, uris: list = None) -> bool:
-        """R2 is derivative of (has derivative): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R2_is_derivative_of
-        prop_inverse = LRM.R2i_has_derivative
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r2i_has_derivative(self, *entities, uris: list = None) -> bool:
-        """R2i has derivative (is derivative of): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R2i_has_derivative
-        prop_inverse = LRM.R2_is_derivative_of
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r3_is_realised_in(self, *entities, uris: list = None) -> bool:
-        """R3 is realised in (realises): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R3_is_realised_in
-        prop_inverse = LRM.R3i_realises
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r10_has_member(self, *entities, uris: list = None) -> bool:
-        """R10 has member (is member of): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R10_has_member
-        prop_inverse = LRM.R10i_is_member_of
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r10i_is_member_of(self, *entities, uris: list = None) -> bool:
-        """R10i is member of (has member): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R10i_is_member_of
-        prop_inverse = LRM.R10_has_member
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r67_has_part(self, *entities, uris: list = None) -> bool:
-        """R67 has part (forms part of): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R67_has_part
-        prop_inverse = LRM.R67i_forms_part_of
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r67i_forms_part_of(self, *entities, uris: list = None) -> bool:
-        """R67i forms part of (has part): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R67i_forms_part_of
-        prop_inverse = LRM.R67_has_part
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r68_is_inspired_by(self, *entities, uris: list = None) -> bool:
-        """R68 is inspired by (is inspiration for): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R68_is_inspired_by
-        prop_inverse = LRM.R68i_is_inspiration_for
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r68i_is_inspiration_for(self, *entities, uris: list = None) -> bool:
-        """R68i is inspiration for (is inspired by): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R68i_is_inspiration_for
-        prop_inverse = LRM.R68_is_inspired_by
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r73_takes_representative_attribute_from(self, *entities, uris: list = None) -> bool:
-        """R73 takes representative attribute from (bears representative attribute for): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R73_takes_representative_attribute_from
-        prop_inverse = LRM.R73i_bears_representative_attribute_for
-
-        range_class_constraint = F2Expression
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r74_uses_expression_of(self, *entities, uris: list = None) -> bool:
-        """R74 uses expression of (has expression used in): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R74_uses_expression_of
-        prop_inverse = LRM.R74i_has_expression_used_in
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r74i_has_expression_used_in(self, *entities, uris: list = None) -> bool:
-        """R74i has expression used in (uses expression of): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R74i_has_expression_used_in
-        prop_inverse = LRM.R74_uses_expression_of
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r16i_was_created_by(self, *entities, uris: list = None) -> bool:
-        """R16i created (was created by): F27 Work Creation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R16i_was_created_by
-        prop_inverse = LRM.R16_created
-
-        range_class_constraint = F27WorkCreation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r19i_was_realised_through(self, *entities, uris: list = None) -> bool:
-        """R19i was realised through (created a realisation of): F28 Expression Creation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R19i_was_realised_through
-        prop_inverse = LRM.R19_created_a_realisation_of
-
-        range_class_constraint = F28ExpressionCreation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    r1_is_logical_successor_of = EntityProperty(LRM.R1_is_logical_successor_of,
+                                                prop_inverse=LRM.R1i_has_successor,
+                                                range_class="F1Work",
+                                                doc="R1 is logical successor of (has successor): F1 Work")
+
+    r1i_has_successor = EntityProperty(LRM.R1i_has_successor,
+                                       prop_inverse=LRM.R1_is_logical_successor_of,
+                                       range_class="F1Work",
+                                       doc="R1i has successor (is logical successor of): F1 Work")
+
+    r2_is_derivative_of = EntityProperty(LRM.R2_is_derivative_of,
+                                         prop_inverse=LRM.R2i_has_derivative,
+                                         range_class="F1Work",
+                                         doc="R2 is derivative of (has derivative): F1 Work")
+
+    r2i_has_derivative = EntityProperty(LRM.R2i_has_derivative,
+                                        prop_inverse=LRM.R2_is_derivative_of,
+                                        range_class="F1Work",
+                                        doc="R2i has derivative (is derivative of): F1 Work")
+
+    r3_is_realised_in = EntityProperty(LRM.R3_is_realised_in,
+                                       prop_inverse=LRM.R3i_realises,
+                                       range_class="F1Work",
+                                       doc="R3 is realised in (realises): F2 Expression")
+
+    r10_has_member = EntityProperty(LRM.R10_has_member,
+                                    prop_inverse=LRM.R10i_is_member_of,
+                                    range_class="F1Work",
+                                    doc="R10 has member (is member of): F1 Work")
+
+    r10i_is_member_of = EntityProperty(LRM.R10i_is_member_of,
+                                       prop_inverse=LRM.R10_has_member,
+                                       range_class="F1Work",
+                                       doc="R10i is member of (has member): F1 Work")
+
+    r67_has_part = EntityProperty(LRM.R67_has_part,
+                                  prop_inverse=LRM.R67i_forms_part_of,
+                                  range_class="F1Work",
+                                  doc="R67 has part (forms part of): F1 Work")
+
+    r67i_forms_part_of = EntityProperty(LRM.R67i_forms_part_of,
+                                        prop_inverse=LRM.R67_has_part,
+                                        range_class="F1Work",
+                                        doc="R67i forms part of (has part): F1 Work")
+
+    r68_is_inspired_by = EntityProperty(LRM.R68_is_inspired_by,
+                                        prop_inverse=LRM.R68i_is_inspiration_for,
+                                        range_class="F1Work",
+                                        doc="R68 is inspired by (is inspiration for): F1 Work")
+
+    r68i_is_inspiration_for = EntityProperty(LRM.R68i_is_inspiration_for,
+                                             prop_inverse=LRM.R68_is_inspired_by,
+                                             range_class="F1Work",
+                                             doc="R68i is inspiration for (is inspired by): F1 Work")
+
+    r73_takes_representative_attribute_from = EntityProperty(LRM.R73_takes_representative_attribute_from,
+                                                             prop_inverse=LRM.R73i_bears_representative_attribute_for,
+                                                             range_class="F2Expression",
+                                                             doc="R73 takes representative attribute from (bears representative attribute for): F2 Expression")
+
+    r74_uses_expression_of = EntityProperty(LRM.R74_uses_expression_of,
+                                            prop_inverse=LRM.R74i_has_expression_used_in,
+                                            range_class="F1Work",
+                                            doc="R74 uses expression of (has expression used in): F1 Work")
+
+    r74i_has_expression_used_in = EntityProperty(LRM.R74i_has_expression_used_in,
+                                                 prop_inverse=LRM.R74_uses_expression_of,
+                                                 range_class="F1Work",
+                                                 doc="R74i has expression used in (uses expression of): F1 Work")
+
+    r16i_was_created_by = EntityProperty(LRM.R16i_was_created_by,
+                                         prop_inverse=LRM.R16_created,
+                                         range_class="F27WorkCreation",
+                                         doc="R16i created (was created by): F27 Work Creation")
+
+    r19i_was_realised_through = EntityProperty(LRM.R19i_was_realised_through,
+                                               prop_inverse=LRM.R19_created_a_realisation_of,
+                                               range_class="F28ExpressionCreation",
+                                               doc="R19i was realised through (created a realisation of): F28 Expression Creation")
 
 
 class F2Expression(E73InformationObject):
@@ -391,236 +137,60 @@ class F2Expression(E73InformationObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def r5_has_component(self, *entities, uris: list = None) -> bool:
-        """R5 has component (is component of): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R5_has_component
-        prop_inverse = LRM.R5i_is_component_of
-
-        range_class_constraint = F2Expression
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r5i_is_component_of(self, *entities, uris: list = None) -> bool:
-        """R5i is component of (has component): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R5i_is_component_of
-        prop_inverse = LRM.R5_has_component
-
-        range_class_constraint = F2Expression
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r15_has_fragment(self, *entities, uris: list = None) -> bool:
-        """R15 has fragment (is fragment of): E90 Symbolic Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R15_has_fragment
-        prop_inverse = LRM.R15i_is_fragment_of
-
-        range_class_constraint = E90SymbolicObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r75_incorporates(self, *entities, uris: list = None) -> bool:
-        """R75 incorporates (is incorporated in): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R75_incorporates
-        prop_inverse = LRM.R75i_is_incorporated_in
-
-        range_class_constraint = F2Expression
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r75i_is_incorporated_in(self, *entities, uris: list = None) -> bool:
-        """R75i is incorporated in (incorporates): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R75i_is_incorporated_in
-        prop_inverse = LRM.R75_incorporates
-
-        range_class_constraint = F2Expression
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r76_is_derivative_of(self, *entities, uris: list = None) -> bool:
-        """R76 is derivative of (has derivative): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R76_is_derivative_of
-        prop_inverse = LRM.R76i_has_derivative
-
-        range_class_constraint = F2Expression
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r76i_has_derivative(self, *entities, uris: list = None) -> bool:
-        """R76i has derivative (is derivative of): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R76i_has_derivative
-        prop_inverse = LRM.R76_is_derivative_of
-
-        range_class_constraint = F2Expression
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r3i_realises(self, *entities, uris: list = None) -> bool:
-        """R3i realises (is realised in): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R3i_realises
-        prop_inverse = LRM.R3_is_realised_in
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r73i_bears_representative_attribute_for(self, *entities, uris: list = None) -> bool:
-        """R73i bears representative attribute for (takes representative attribute from): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R73i_bears_representative_attribute_for
-        prop_inverse = LRM.R73_takes_representative_attribute_from
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r4i_is_embodied_in(self, *entities, uris: list = None) -> bool:
-        """R4i is embodied in (embodies): F3 Manifestation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R4i_is_embodied_in
-        prop_inverse = LRM.R4_embodies
-
-        range_class_constraint = F3Manifestation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r17i_was_created_by(self, *entities, uris: list = None) -> bool:
-        """R17i was created by (created): F28 Expression Creation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R17i_was_created_by
-        prop_inverse = LRM.R17_created
-
-        range_class_constraint = F28ExpressionCreation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    r5_has_component = EntityProperty(LRM.R5_has_component,
+                                      prop_inverse=LRM.R5i_is_component_of,
+                                      range_class="F2Expression",
+                                      doc="R5 has component (is component of): F2 Expression")
+
+    r5i_is_component_of = EntityProperty(LRM.R5i_is_component_of,
+                                         prop_inverse=LRM.R5_has_component,
+                                         range_class="F2Expression",
+                                         doc="R5i is component of (has component): F2 Expression")
+
+    r15_has_fragment = EntityProperty(LRM.R15_has_fragment,
+                                      prop_inverse=LRM.R15i_is_fragment_of,
+                                      range_class="E90SymbolicObject",
+                                      doc="R15 has fragment (is fragment of): E90 Symbolic Object")
+
+    r75_incorporates = EntityProperty(LRM.R75_incorporates,
+                                      prop_inverse=LRM.R75i_is_incorporated_in,
+                                      range_class="F2Expression",
+                                      doc="R75 incorporates (is incorporated in): F2 Expression")
+
+    r75i_is_incorporated_in = EntityProperty(LRM.R75i_is_incorporated_in,
+                                             prop_inverse=LRM.R75_incorporates,
+                                             range_class="F2Expression",
+                                             doc="R75i is incorporated in (incorporates): F2 Expression")
+
+    r76_is_derivative_of = EntityProperty(LRM.R76_is_derivative_of,
+                                          prop_inverse=LRM.R76i_has_derivative,
+                                          range_class="F2Expression",
+                                          doc="R76 is derivative of (has derivative): F2 Expression")
+
+    r76i_has_derivative = EntityProperty(LRM.R76i_has_derivative,
+                                         prop_inverse=LRM.R76_is_derivative_of,
+                                         range_class="F2Expression",
+                                         doc="R76i has derivative (is derivative of): F2 Expression")
+
+    r3i_realises = EntityProperty(LRM.R3i_realises,
+                                  prop_inverse=LRM.R3_is_realised_in,
+                                  range_class="F1Work",
+                                  doc="R3i realises (is realised in): F1 Work")
+
+    r73i_bears_representative_attribute_for = EntityProperty(LRM.R73i_bears_representative_attribute_for,
+                                                             prop_inverse=LRM.R73_takes_representative_attribute_from,
+                                                             range_class="F1Work",
+                                                             doc="R73i bears representative attribute for (takes representative attribute from): F1 Work")
+
+    r4i_is_embodied_in = EntityProperty(LRM.R4i_is_embodied_in,
+                                        prop_inverse=LRM.R4_embodies,
+                                        range_class="F3Manifestation",
+                                        doc="R4i is embodied in (embodies): F3 Manifestation")
+
+    r17i_was_created_by = EntityProperty(LRM.R17i_was_created_by,
+                                         prop_inverse=LRM.R17_created,
+                                         range_class="F28ExpressionCreation",
+                                         doc="R17i was created by (created): F28 Expression Creation")
 
 
 class F3Manifestation(E73InformationObject):
@@ -639,152 +209,40 @@ class F3Manifestation(E73InformationObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def r4_embodies(self, *entities, uris: list = None) -> bool:
-        """R4 embodies (is embodied in): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R4_embodies
-        prop_inverse = LRM.R4i_is_embodied_in
-
-        range_class_constraint = F2Expression
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r69_has_physical_form(self, *entities, uris: list = None) -> bool:
-        """R69 has physical form (is physical form of): E55 Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R69_has_physical_form
-        prop_inverse = LRM.R69i_is_physical_form_of
-
-        range_class_constraint = E55Type
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r70_has_dimension(self, *entities, uris: list = None) -> bool:
-        """R70 has dimension (is dimension of): E54 Dimension
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R70_has_dimension
-        prop_inverse = LRM.R70i_is_dimension_of
-
-        range_class_constraint = E54Dimension
+    r4_embodies = EntityProperty(LRM.R4_embodies,
+                                 prop_inverse=LRM.R4i_is_embodied_in,
+                                 range_class="F2Expression",
+                                 doc="R4 embodies (is embodied in): F2 Expression")
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    r69_has_physical_form = EntityProperty(LRM.R69_has_physical_form,
+                                           prop_inverse=LRM.R69i_is_physical_form_of,
+                                           range_class="E55Type",
+                                           doc="R69 has physical form (is physical form of): E55 Type")
 
-    def r71_has_part(self, *entities, uris: list = None) -> bool:
-        """R71 has part (is part of): F3 Manifestation
+    r70_has_dimension = EntityProperty(LRM.R70_has_dimension,
+                                       prop_inverse=LRM.R70i_is_dimension_of,
+                                       range_class="E54Dimension",
+                                       doc="R70 has dimension (is dimension of): E54 Dimension")
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    r71_has_part = EntityProperty(LRM.R71_has_part,
+                                  prop_inverse=LRM.R71i_is_part_of,
+                                  range_class="F3Manifestation",
+                                  doc="R71 has part (is part of): F3 Manifestation")
 
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R71_has_part
-        prop_inverse = LRM.R71i_is_part_of
+    r71i_is_part_of = EntityProperty(LRM.R71i_is_part_of,
+                                     prop_inverse=LRM.R71_has_part,
+                                     range_class="F3Manifestation",
+                                     doc="R71i is part of (has part): F3 Manifestation")
 
-        range_class_constraint = F3Manifestation
+    r7i_is_materialization_of = EntityProperty(LRM.R7i_is_materialized_in,
+                                               prop_inverse=LRM.R7_is_materialization_of,
+                                               range_class="F5Item",
+                                               doc="R7i is materialized in (is materialization of): F5 Item")
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r71i_is_part_of(self, *entities, uris: list = None) -> bool:
-        """R71i is part of (has part): F3 Manifestation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R71i_is_part_of
-        prop_inverse = LRM.R71_has_part
-
-        range_class_constraint = F3Manifestation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r7i_is_materialization_of(self, *entities, uris: list = None) -> bool:
-        """R7i is materialized in (is materialization of): F5 Item
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R7i_is_materialized_in
-        prop_inverse = LRM.R7_is_materialization_of
-
-        range_class_constraint = F5Item
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r24i_was_created_through(self, *entities, uris: list = None) -> bool:
-        """R24i was created through (created): F30 Manifestation Creation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R24i_was_created_through
-        prop_inverse = LRM.R24_created
-
-        range_class_constraint = F30ManifestationCreation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    r24i_was_created_through = EntityProperty(LRM.R24i_was_created_through,
+                                              prop_inverse=LRM.R24_created,
+                                              range_class="F30ManifestationCreation",
+                                              doc="R24i was created through (created): F30 Manifestation Creation")
 
 
 class F5Item(E24PhysicalHumanMadeThing):
@@ -800,26 +258,10 @@ class F5Item(E24PhysicalHumanMadeThing):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def r7_is_materialization_of(self, *entities, uris: list = None) -> bool:
-        """R7 is materialization of (is materialized in): F3 Manifestation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R7_is_materialization_of
-        prop_inverse = LRM.R7i_is_materialized_in
-
-        range_class_constraint = F3Manifestation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    r7_is_materialization_of = EntityProperty(LRM.R7_is_materialization_of,
+                                              prop_inverse=LRM.R7i_is_materialized_in,
+                                              range_class="F3Manifestation",
+                                              doc="R7 is materialization of (is materialized in): F3 Manifestation")
 
 
 class F27WorkCreation(E65Creation):
@@ -836,26 +278,10 @@ class F27WorkCreation(E65Creation):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def r16_created(self, *entities, uris: list = None) -> bool:
-        """R16 created (was created by): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R16_created
-        prop_inverse = LRM.R16i_was_created_by
-
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    r16_created = EntityProperty(LRM.R16_created,
+                                 prop_inverse=LRM.R16i_was_created_by,
+                                 range_class="F1Work",
+                                 doc="R16 created (was created by): F1 Work")
 
 
 class F28ExpressionCreation(E65Creation, E12Production):
@@ -872,47 +298,15 @@ class F28ExpressionCreation(E65Creation, E12Production):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def r17_created(self, *entities, uris: list = None) -> bool:
-        """R17 created (was created by): F2 Expression
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R17_created
-        prop_inverse = LRM.R17i_was_created_by
-
-        range_class_constraint = F2Expression
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def r19_created_a_realisation_of(self, *entities, uris: list = None) -> bool:
-        """R19 created a realisation of (was realised through): F1 Work
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R19_created_a_realisation_of
-        prop_inverse = LRM.R19i_was_realised_through
+    r17_created = EntityProperty(LRM.R17_created,
+                                 prop_inverse=LRM.R17i_was_created_by,
+                                 range_class="F2Expression",
+                                 doc="R17 created (was created by): F2 Expression")
 
-        range_class_constraint = F1Work
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    r19_created_a_realisation_of = EntityProperty(LRM.R19_created_a_realisation_of,
+                                                  prop_inverse=LRM.R19i_was_realised_through,
+                                                  range_class="F1Work",
+                                                  doc="R19 created a realisation of (was realised through): F1 Work")
 
 
 class F30ManifestationCreation(F28ExpressionCreation):
@@ -928,26 +322,10 @@ class F30ManifestationCreation(F28ExpressionCreation):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def r24_created(self, *entities, uris: list = None) -> bool:
-        """R24 created (was created through): F3 Manifestation
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R24_created
-        prop_inverse = LRM.R24i_was_created_through
-
-        range_class_constraint = F3Manifestation
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    r24_created = EntityProperty(LRM.R24_created,
+                                 prop_inverse=LRM.R24i_was_created_through,
+                                 range_class="F3Manifestation",
+                                 doc="R24 created (was created through): F3 Manifestation")
 
 
 class F31Performance(E7Activity):
@@ -962,24 +340,8 @@ class F31Performance(E7Activity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def r66_included_performed_version_of(self, *entities, uris: list = None) -> bool:
-        """R66 included performed version of (had a performed version through): E89 Propositional Object
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = LRM.R66_included_performed_version_of
-        prop_inverse = LRM.R66i_had_a_performed_version_through
-
-        range_class_constraint = E89PropositionalObject
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    r66_included_performed_version_of = EntityProperty(LRM.R66_included_performed_version_of,
+                                                       prop_inverse=LRM.R66i_had_a_performed_version_through,
+                                                       range_class="E89PropositionalObject",
+                                                       doc="R66 included performed version of (had a performed version through): E89 Propositional Object")
 
@@ -0,0 +1,819 @@
+"""Matching
+
+Find mapping candidates between the concepts of two vocabularies (e.g. Bouterwek and Eschenburg) by their labels.
+
+Terms are dictionaries with the URI of the concept as "id" and the label as "label", as in the mapping notebooks, e.g.
+{"id": "https://genre.clscor.io/eschenburg/satire", "label": "Satire"}. Matchers return the pairs (term_1, term_2)
+of candidates; close_match_graphs creates the skos:closeMatch statements of the pairs in both directions.
+"""
+import bisect
+import heapq
+import json
+import logging
+from collections import Counter, defaultdict, deque
+from rdflib import Graph, Literal, URIRef, SKOS
+
+
+def normalize_label(label: str) -> str:
+    """Normalize a label for comparison
+
+    Args:
+        label (str): Label
+
+    Returns:
+        str: Label in lower case
+    """
+    return str(label).lower()
+
+
+def exact_matches(terms_1: list, terms_2: list) -> list:
+    """Find the terms with the same label (ignoring case)
+
+    The labels of terms_2 are normalized once and indexed; the labels of terms_1 are looked up in the index
+    (hash join), the time is linear in the number of terms.
+
+    Args:
+        terms_1 (list): Terms of the first vocabulary
+        terms_2 (list): Terms of the second vocabulary
+
+    Returns:
+        list: Pairs (term_1, term_2), ordered by term_1 and term_2
+    """
+    index = defaultdict(list)
+    for term_2 in terms_2:
+        index[normalize_label(term_2["label"])].append(term_2)
+
+    matches = []
+    for term_1 in terms_1:
+        for term_2 in index.get(normalize_label(term_1["label"]), ()):
+            matches.append((term_1, term_2))
+
+    return matches
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton
+
+    Finds all patterns that occur in a text in one pass over the text; the time is linear in the length of the text
+    plus the number of occurrences.
+    """
+
+    def __init__(self, patterns: list):
+        """Initialize
+
+        Args:
+            patterns (list): Strings to search for. Empty strings are ignored.
+        """
+        self.patterns = list(patterns)
+
+        # transitions of each state: character -> state; state 0 is the root
+        self.__goto = [dict()]
+        # failure link of each state: state of the longest proper suffix that is a prefix of a pattern
+        self.__fail = [0]
+        # patterns (indices) that end in a state
+        self.__output = [[]]
+        # next state on the failure chain that has an output (dictionary suffix link), -1 if there is none
+        self.__output_link = [-1]
+
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+
+            state = 0
+            for character in pattern:
+                next_state = self.__goto[state].get(character)
+                if next_state is None:
+                    next_state = len(self.__goto)
+                    self.__goto[state][character] = next_state
+                    self.__goto.append(dict())
+                    self.__fail.append(0)
+                    self.__output.append([])
+                    self.__output_link.append(-1)
+                state = next_state
+
+            self.__output[state].append(index)
+
+        # failure links, breadth-first
+        queue = deque(self.__goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self.__goto[state].items():
+                queue.append(next_state)
+
+                fail = self.__fail[state]
+                while fail and character not in self.__goto[fail]:
+                    fail = self.__fail[fail]
+                fail = self.__goto[fail].get(character, 0)
+                if fail == next_state:
+                    fail = 0
+
+                self.__fail[next_state] = fail
+                self.__output_link[next_state] = fail if self.__output[fail] else self.__output_link[fail]
+
+    def iter_matches(self, text: str):
+        """Find the occurrences of the patterns
+
+        Args:
+            text (str): Text
+
+        Returns:
+            Generator: (end position, index of the pattern) of each occurrence
+        """
+        goto = self.__goto
+        fail = self.__fail
+        output = self.__output
+        output_link = self.__output_link
+
+        state = 0
+        for position, character in enumerate(text):
+            while state and character not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(character, 0)
+
+            match_state = state if output[state] else output_link[state]
+            while match_state > 0:
+                for index in output[match_state]:
+                    yield position, index
+                match_state = output_link[match_state]
+
+    def contained(self, text: str) -> set:
+        """Find the patterns that occur in a text
+
+        Args:
+            text (str): Text
+
+        Returns:
+            set: Indices of the patterns
+        """
+        return {index for position, index in self.iter_matches(text)}
+
+
+def _contained_pairs(labels_1: list, labels_2: list) -> set:
+    """Helper function: pairs (i, j) of the labels with labels_1[i] in labels_2[j]
+
+    Args:
+        labels_1 (list): Normalized labels searched for
+        labels_2 (list): Normalized labels searched in
+
+    Returns:
+        set: Pairs of indices
+    """
+    # the automaton is built over the distinct labels
+    indices = defaultdict(list)
+    for i, label in enumerate(labels_1):
+        indices[label].append(i)
+    distinct = list(indices)
+
+    automaton = AhoCorasick(distinct)
+
+    pairs = set()
+    for j, label in enumerate(labels_2):
+        for pattern in automaton.contained(label):
+            for i in indices[distinct[pattern]]:
+                pairs.add((i, j))
+
+    return pairs
+
+
+def containment_matches(terms_1: list, terms_2: list, blocking: bool = False, q: int = 2) -> list:
+    """Find the terms whose label (ignoring case) contains the label of the other term
+
+    Rules of the mapping notebook: only pairs in which at least one label is a multi-word expression (contains a
+    space) are candidates, and pairs with the same label are left out (they are exact matches). Terms with an empty
+    label are not matched.
+
+    An Aho-Corasick automaton over the labels of one vocabulary finds all its labels in each label of the other
+    vocabulary in one pass (and the other way round); the time is close to linear in the total length of the labels.
+    With blocking, the labels are instead compared directly, but only the pairs that pass the q-gram filter of
+    QGramIndex.containing_candidates (in both directions).
+
+    Args:
+        terms_1 (list): Terms of the first vocabulary
+        terms_2 (list): Terms of the second vocabulary
+        blocking (bool, optional): Compare only the candidates of a q-gram index. Defaults to False.
+        q (int, optional): Length of the q-grams for blocking. Defaults to 2.
+
+    Returns:
+        list: Pairs (term_1, term_2), ordered by term_1 and term_2
+    """
+    labels_1 = [normalize_label(term["label"]) for term in terms_1]
+    labels_2 = [normalize_label(term["label"]) for term in terms_2]
+
+    if blocking:
+        pairs = set()
+        for i, j in blocking_candidates(terms_1, terms_2, q=q)[0]:
+            if labels_1[i] and labels_2[j] and (labels_1[i] in labels_2[j] or labels_2[j] in labels_1[i]):
+                pairs.add((i, j))
+    else:
+        pairs = _contained_pairs(labels_1, labels_2)
+        pairs.update((i, j) for j, i in _contained_pairs(labels_2, labels_1))
+
+    matches = []
+    for i, j in sorted(pairs):
+        # at least one multi-word expression
+        if " " not in terms_1[i]["label"] and " " not in terms_2[j]["label"]:
+            continue
+
+        # exact matches are not containment candidates
+        if labels_1[i] == labels_2[j]:
+            continue
+
+        matches.append((terms_1[i], terms_2[j]))
+
+    return matches
+
+
+def _distinct_labels(terms: list) -> tuple:
+    """Helper function: distinct normalized labels of terms
+
+    Args:
+        terms (list): Terms
+
+    Returns:
+        tuple: List of the distinct labels and list of the indices of the terms with each label
+    """
+    indices = defaultdict(list)
+    for i, term in enumerate(terms):
+        indices[normalize_label(term["label"])].append(i)
+
+    return list(indices), list(indices.values())
+
+
+def edit_distance_candidates(terms_a: list, terms_b: list, max_distance: int, block_size: int = 1000,
+                             workers: int = -1, blocking: bool = False, q: int = 2) -> list:
+    """Find the terms whose labels (ignoring case) have a Levenshtein distance of at most max_distance
+
+    Pairs with the same label are left out (they are exact matches), as in the mapping notebook.
+
+    The distances of the distinct labels are computed by rapidfuzz.process.cdist in native code on all cores, a block
+    of rows of the matrix at a time; values above max_distance are cut off early. Only the pairs within the distance are
+    kept, the memory needed is block_size x number of distinct labels of terms_b (one byte per value for
+    max_distance < 255). With blocking, only the pairs that pass the q-gram filter of
+    QGramIndex.edit_distance_candidates are compared (one call per pair, no matrix). The index is pure Python, for short
+    labels the native matrix is usually faster even if the filter prunes almost all pairs.
+
+    Args:
+        terms_a (list): Terms of the first vocabulary
+        terms_b (list): Terms of the second vocabulary
+        max_distance (int): Maximum Levenshtein distance
+        block_size (int, optional): Number of labels of terms_a per call. Defaults to 1000.
+        workers (int, optional): Number of threads, -1 uses all cores. Defaults to -1.
+        blocking (bool, optional): Compare only the candidates of a q-gram index. Defaults to False.
+        q (int, optional): Length of the q-grams for blocking. Defaults to 2.
+
+    Returns:
+        list: Triples (term_a, term_b, distance), ordered by term_a and term_b
+    """
+    assert type(max_distance) == int and max_distance >= 0, "Invalid value. Expected max_distance as int >= 0."
+
+    import numpy
+    from rapidfuzz.distance import Levenshtein
+    from rapidfuzz.process import cdist
+
+    labels_a, indices_a = _distinct_labels(terms_a)
+    labels_b, indices_b = _distinct_labels(terms_b)
+
+    if not labels_a or not labels_b:
+        return []
+
+    if blocking:
+        candidates = []
+        for row, columns in _blocked_label_pairs(labels_a, indices_a, labels_b, indices_b, max_distance, q)[0]:
+            for column in columns:
+                edit_distance = Levenshtein.distance(labels_a[row], labels_b[column], score_cutoff=max_distance)
+                if 0 < edit_distance <= max_distance:
+                    for i in indices_a[row]:
+                        for j in indices_b[column]:
+                            candidates.append((i, j, edit_distance))
+
+        candidates.sort()
+
+        return [(terms_a[i], terms_b[j], edit_distance) for i, j, edit_distance in candidates]
+
+    # values above the cutoff are max_distance + 1, which has to fit into the type
+    dtype = numpy.uint8 if max_distance < 255 else numpy.int32
+
+    candidates = []
+    for start in range(0, len(labels_a), block_size):
+        distances = cdist(labels_a[start:start + block_size], labels_b,
+                          scorer=Levenshtein.distance,
+                          score_cutoff=max_distance,
+                          dtype=dtype,
+                          workers=workers)
+
+        # distance 0: same label
+        rows, columns = numpy.nonzero((distances > 0) & (distances <= max_distance))
+        for row, column in zip(rows.tolist(), columns.tolist()):
+            edit_distance = int(distances[row, column])
+            for i in indices_a[start + row]:
+                for j in indices_b[column]:
+                    candidates.append((i, j, edit_distance))
+
+    candidates.sort()
+
+    return [(terms_a[i], terms_b[j], edit_distance) for i, j, edit_distance in candidates]
+
+
+# Padding of the q-grams at the start and end of a label, must not occur in labels
+QGRAM_PADDING = "\x00"
+
+
+def qgrams(label: str, q: int = 2, padded: bool = True) -> Counter:
+    """Get the q-grams (substrings of length q) of a label
+
+    Args:
+        label (str): Normalized label
+        q (int, optional): Length of the q-grams. Defaults to 2.
+        padded (bool, optional): Pad the label with q - 1 characters at the start and end. Defaults to True.
+
+    Returns:
+        Counter: Number of occurrences of each q-gram
+    """
+    if padded:
+        label = QGRAM_PADDING * (q - 1) + label + QGRAM_PADDING * (q - 1)
+
+    return Counter(label[i:i + q] for i in range(len(label) - q + 1))
+
+
+class QGramIndex:
+    """Inverted index of the q-grams of labels for blocking
+
+    Finds the candidates among the indexed labels that can be within an edit distance of a label or contain it without
+    comparing the label with every indexed label. The filters never drop a pair that matches:
+
+    edit distance k (count filter on padded q-grams and length filter): a label of length m within distance k of a label
+    of length n shares at least max(n, m) + q - 1 - k * q q-grams with it and |n - m| <= k. If this bound is not
+    positive, the candidates are taken from the labels of the lengths in range.
+
+    containment: all q-grams of a label also occur in a label that contains it, i.e. a label of length n shares
+    n - q + 1 (unpadded) q-grams with it. A label shorter than q has no q-grams, all labels as long are candidates.
+
+    Prefix filtering: a label that shares at least t of the N q-grams of the query label shares one of any N - t + 1 of
+    them, so only the postings of the rarest N - t + 1 q-grams (k * q + 1 for edit distance, one for containment) are
+    read; the postings are ordered by the length of the labels, only the part in the length range is read. The count
+    filter is then applied to these labels.
+    """
+
+    def __init__(self, labels: list, q: int = 2):
+        """Initialize
+
+        Args:
+            labels (list): Normalized labels, a candidate is the index of a label in this list
+            q (int, optional): Length of the q-grams. Defaults to 2.
+        """
+        assert type(q) == int and q > 0, "Invalid value. Expected q as int > 0."
+
+        self.labels = list(labels)
+        self.q = q
+
+        # padded q-grams of each label
+        self.grams = [qgrams(label, q) for label in self.labels]
+        # q-gram -> labels with the q-gram, ordered by length; the padded q-grams contain QGRAM_PADDING
+        self.postings = defaultdict(list)
+        # q-gram -> lengths of the labels in the postings
+        self.posting_lengths = defaultdict(list)
+        # length -> labels of the length
+        self.lengths = defaultdict(list)
+
+        for index in sorted(range(len(self.labels)), key=lambda index: len(self.labels[index])):
+            for gram in self.grams[index]:
+                self.postings[gram].append(index)
+                self.posting_lengths[gram].append(len(self.labels[index]))
+            self.lengths[len(self.labels[index])].append(index)
+
+    def __probe(self, grams: Counter, prefix: int, min_length: int, max_length: int) -> set:
+        """Helper function: labels in a length range with one of the rarest q-grams
+
+        Args:
+            grams (Counter): q-grams of the label
+            prefix (int): Number of occurrences of q-grams to probe
+            min_length (int): Minimum length of the labels
+            max_length (int): Maximum length of the labels
+
+        Returns:
+            set: Labels
+        """
+        ranges = []
+        for gram in grams:
+            lengths = self.posting_lengths.get(gram)
+            if lengths:
+                start = bisect.bisect_left(lengths, min_length)
+                end = bisect.bisect_right(lengths, max_length)
+                ranges.append((end - start, gram, start, end))
+            else:
+                ranges.append((0, gram, 0, 0))
+        ranges.sort()
+
+        indices = set()
+        for size, gram, start, end in ranges:
+            if prefix <= 0:
+                break
+            indices.update(self.postings[gram][start:end] if size else ())
+            prefix -= grams[gram]
+
+        return indices
+
+    def __shared(self, grams: Counter, index: int) -> int:
+        """Helper function: number of q-grams shared with an indexed label
+
+        Args:
+            grams (Counter): q-grams of the label
+            index (int): Indexed label
+
+        Returns:
+            int: Number of shared q-grams (with multiplicity)
+        """
+        indexed_grams = self.grams[index]
+        return sum(min(count, indexed_grams[gram]) for gram, count in grams.items() if gram in indexed_grams)
+
+    def edit_distance_candidates(self, label: str, max_distance: int) -> list:
+        """Find the labels that can be within an edit distance of a label
+
+        Args:
+            label (str): Normalized label
+            max_distance (int): Maximum edit distance
+
+        Returns:
+            list: Indices of the candidates
+        """
+        q = self.q
+        length = len(label)
+        grams = qgrams(label, q)
+
+        candidates = set()
+        for index in self.__probe(grams, max_distance * q + 1, length - max_distance, length + max_distance):
+            indexed_length = len(self.labels[index])
+            if self.__shared(grams, index) >= max(length, indexed_length) + q - 1 - max_distance * q:
+                candidates.add(index)
+
+        # lengths for which the count filter cannot prune
+        for indexed_length in range(max(0, length - max_distance), length + max_distance + 1):
+            if max(length, indexed_length) + q - 1 - max_distance * q <= 0:
+                candidates.update(self.lengths.get(indexed_length, ()))
+
+        return sorted(candidates)
+
+    def containing_candidates(self, label: str) -> list:
+        """Find the labels that can contain a label
+
+        Args:
+            label (str): Normalized label
+
+        Returns:
+            list: Indices of the candidates
+        """
+        q = self.q
+        length = len(label)
+
+        if length < q:
+            return sorted(index for indexed_length, indices in self.lengths.items() if indexed_length >= length
+                          for index in indices)
+
+        grams = qgrams(label, q, padded=False)
+
+        candidates = set()
+        for index in self.__probe(grams, 1, length, float("inf")):
+            if self.__shared(grams, index) >= length - q + 1:
+                candidates.add(index)
+
+        return sorted(candidates)
+
+
+def _blocked_label_pairs(labels_a: list, indices_a: list, labels_b: list, indices_b: list, max_distance: int,
+                          q: int) -> tuple:
+    """Helper function: candidates of the distinct labels and the numbers of comparisons of the terms
+
+    Args:
+        labels_a (list): Distinct labels of the first vocabulary
+        indices_a (list): Indices of the terms with each label
+        labels_b (list): Distinct labels of the second vocabulary
+        indices_b (list): Indices of the terms with each label
+        max_distance (int): Maximum edit distance or None for containment
+        q (int): Length of the q-grams
+
+    Returns:
+        tuple: List of pairs (label of labels_a, candidates in labels_b) and a dictionary with statistics
+    """
+    index = QGramIndex(labels_b, q=q)
+
+    if max_distance is None:
+        # labels of labels_a in labels of labels_b and the other way round
+        columns = [set(index.containing_candidates(label)) for label in labels_a]
+        index_a = QGramIndex(labels_a, q=q)
+        for column, label in enumerate(labels_b):
+            for row in index_a.containing_candidates(label):
+                columns[row].add(column)
+        columns = [sorted(row_columns) for row_columns in columns]
+    else:
+        columns = [index.edit_distance_candidates(label, max_distance) for label in labels_a]
+
+    blocks = []
+    candidates = 0
+    for row, row_columns in enumerate(columns):
+        if row_columns:
+            blocks.append((row, row_columns))
+            candidates += len(indices_a[row]) * sum(len(indices_b[column]) for column in row_columns)
+
+    comparisons = sum(len(indices) for indices in indices_a) * sum(len(indices) for indices in indices_b)
+    stats = {
+        "comparisons": comparisons,
+        "candidates": candidates,
+        "pruned": comparisons - candidates,
+        "pruned_ratio": (comparisons - candidates) / comparisons if comparisons else 0.0
+    }
+
+    logging.info(f"Blocking: {candidates} of {comparisons} comparisons left, {stats['pruned']} pruned "
+                 f"({stats['pruned_ratio']:.1%}).")
+
+    return blocks, stats
+
+
+def blocking_candidates(terms_a: list, terms_b: list, max_distance: int = None, q: int = 2) -> tuple:
+    """Find the pairs of terms that have to be compared, using a q-gram index of the labels of terms_b
+
+    Args:
+        terms_a (list): Terms of the first vocabulary
+        terms_b (list): Terms of the second vocabulary
+        max_distance (int, optional): Maximum edit distance. Defaults to None: candidates for containment.
+        q (int, optional): Length of the q-grams. Defaults to 2.
+
+    Returns:
+        tuple: List of pairs (index in terms_a, index in terms_b), ordered, and a dictionary with the number of
+            "comparisons" without blocking, of "candidates", of "pruned" comparisons and the "pruned_ratio"
+    """
+    if max_distance is not None:
+        assert type(max_distance) == int and max_distance >= 0, "Invalid value. Expected max_distance as int >= 0."
+
+    labels_a, indices_a = _distinct_labels(terms_a)
+    labels_b, indices_b = _distinct_labels(terms_b)
+
+    blocks, stats = _blocked_label_pairs(labels_a, indices_a, labels_b, indices_b, max_distance, q)
+
+    pairs = []
+    for row, columns in blocks:
+        for column in columns:
+            for i in indices_a[row]:
+                for j in indices_b[column]:
+                    pairs.append((i, j))
+    pairs.sort()
+
+    return pairs, stats
+
+
+class BKTree:
+    """BK-tree
+
+    Metric index of the normalized labels of a vocabulary for lookups by Levenshtein distance. Each node is a distinct
+    label; a child is stored under its distance to the node, by the triangle inequality only the children with a
+    distance in [d - radius, d + radius] of a node with distance d to the query can contain results. Each node keeps
+    the terms with the label.
+
+    Build it with from_graph (concepts of a SKOS graph) or from_terms (terms or terms JSON file), store it with save and
+    restore it with load.
+    """
+
+    def __init__(self):
+        """Initialize an empty tree"""
+        from rapidfuzz.distance import Levenshtein
+
+        self.__distance = Levenshtein.distance
+
+        # normalized label of each node, node 0 is the root
+        self.labels = list()
+        # terms with the label of each node
+        self.terms = list()
+        # children of each node: distance -> node
+        self.children = list()
+        # normalized label -> node
+        self.__nodes = dict()
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def add(self, term: dict) -> bool:
+        """Add a term
+
+        Args:
+            term (dict): Term with "id" and "label"
+
+        Returns:
+            bool: True if the label is new
+        """
+        label = normalize_label(term["label"])
+
+        node = self.__nodes.get(label)
+        if node is not None:
+            self.terms[node].append(term)
+            return False
+
+        new_node = len(self.labels)
+        self.labels.append(label)
+        self.terms.append([term])
+        self.children.append(dict())
+        self.__nodes[label] = new_node
+
+        if new_node == 0:
+            return True
+
+        node = 0
+        while True:
+            distance = self.__distance(label, self.labels[node])
+            child = self.children[node].get(distance)
+            if child is None:
+                self.children[node][distance] = new_node
+                return True
+            node = child
+
+    def search(self, label: str, max_distance: int) -> list:
+        """Find the terms with a label within a distance (ignoring case)
+
+        Args:
+            label (str): Label
+            max_distance (int): Maximum Levenshtein distance
+
+        Returns:
+            list: Pairs (term, distance), ordered by distance
+        """
+        assert type(max_distance) == int and max_distance >= 0, "Invalid value. Expected max_distance as int >= 0."
+
+        if not self.labels:
+            return []
+
+        label = normalize_label(label)
+
+        results = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            distance = self.__distance(label, self.labels[node])
+            if distance <= max_distance:
+                results.append((distance, node))
+
+            for child_distance, child in self.children[node].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+
+        return self.__expand(sorted(results))
+
+    def nearest(self, label: str, k: int = 1, max_distance: int = None) -> list:
+        """Find the terms with the k closest labels (ignoring case)
+
+        The search radius shrinks to the distance of the k-th closest label found so far. Labels with the same distance
+        are ordered by the order in which they were added; all terms of a label are returned.
+
+        Args:
+            label (str): Label
+            k (int, optional): Number of labels. Defaults to 1.
+            max_distance (int, optional): Maximum Levenshtein distance. Defaults to None (no limit).
+
+        Returns:
+            list: Pairs (term, distance), ordered by distance
+        """
+        assert type(k) == int and k > 0, "Invalid value. Expected k as int > 0."
+
+        if not self.labels:
+            return []
+
+        label = normalize_label(label)
+
+        # max heap of the k closest labels found so far: (-distance, -node)
+        closest = []
+        radius = float("inf") if max_distance is None else max_distance
+
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            distance = self.__distance(label, self.labels[node])
+
+            if distance <= radius:
+                heapq.heappush(closest, (-distance, -node))
+                if len(closest) > k:
+                    heapq.heappop(closest)
+                if len(closest) == k:
+                    radius = -closest[0][0]
+
+            # the most promising child (edge closest to the distance) last, it is visited first
+            children = sorted(self.children[node].items(), key=lambda item: -abs(item[0] - distance))
+            for child_distance, child in children:
+                if distance - radius <= child_distance <= distance + radius:
+                    stack.append(child)
+
+        return self.__expand(sorted((-distance, -node) for distance, node in closest))
+
+    def __expand(self, results: list) -> list:
+        """Helper function: terms of the nodes
+
+        Args:
+            results (list): Pairs (distance, node)
+
+        Returns:
+            list: Pairs (term, distance)
+        """
+        return [(term, distance) for distance, node in results for term in self.terms[node]]
+
+    @classmethod
+    def from_terms(cls, terms):
+        """Build a tree of terms
+
+        Args:
+            terms: List of terms with "id" and "label" or path of a terms JSON file
+
+        Returns:
+            BKTree: Tree
+        """
+        if isinstance(terms, str):
+            with open(terms, "r") as f:
+                terms = json.load(f)
+
+        tree = cls()
+        for term in terms:
+            tree.add(term)
+
+        return tree
+
+    @classmethod
+    def from_graph(cls, graph, scheme: str = None):
+        """Build a tree of the skos:prefLabel and skos:altLabel values of the concepts in a graph
+
+        Args:
+            graph: Graph or an entity (e.g. SkosConceptScheme) with the concepts in its graph
+            scheme (str, optional): URI of a concept scheme. Only concepts with skos:inScheme scheme are added.
+
+        Returns:
+            BKTree: Tree
+        """
+        if not isinstance(graph, Graph):
+            graph = graph.graph
+
+        terms = []
+        for prop in [SKOS.prefLabel, SKOS.altLabel]:
+            for concept, label in graph.subject_objects(prop):
+                if not isinstance(label, Literal):
+                    continue
+                if scheme and (concept, SKOS.inScheme, URIRef(scheme)) not in graph:
+                    continue
+                terms.append({"id": str(concept), "label": str(label)})
+
+        # the shape of the tree depends on the order, sort to build the same tree from the same graph
+        terms.sort(key=lambda term: (term["id"], term["label"]))
+
+        return cls.from_terms(terms)
+
+    def save(self, filename: str):
+        """Save the tree to a JSON file
+
+        Args:
+            filename (str): Path of the file
+        """
+        data = {
+            "labels": self.labels,
+            "terms": self.terms,
+            "children": [sorted(children.items()) for children in self.children]
+        }
+
+        with open(filename, "w") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, filename: str):
+        """Load a tree saved with save
+
+        Args:
+            filename (str): Path of the file
+
+        Returns:
+            BKTree: Tree
+        """
+        with open(filename, "r") as f:
+            data = json.load(f)
+
+        tree = cls()
+        tree.labels = data["labels"]
+        tree.terms = data["terms"]
+        tree.children = [{distance: node for distance, node in children} for children in data["children"]]
+        tree.__nodes = {label: node for node, label in enumerate(tree.labels)}
+
+        return tree
+
+
+def close_match_graphs(matches: list, prop: URIRef = SKOS.closeMatch) -> tuple:
+    """Create the statements of matching terms in both directions
+
+    Args:
+        matches (list): Pairs (term_1, term_2), e.g. as returned by exact_matches
+        prop (URIRef, optional): Property. Defaults to skos:closeMatch
+
+    Returns:
+        tuple: Graph with term_1 prop term_2 and Graph with term_2 prop term_1
+    """
+    g_1 = Graph()
+    g_2 = Graph()
+
+    for term_1, term_2 in matches:
+        uri_1 = URIRef(term_1["id"])
+        uri_2 = URIRef(term_2["id"])
+
+        g_1.add((uri_1, prop, uri_2))
+        g_2.add((uri_2, prop, uri_1))
+
+    return g_1, g_2
@@ -0,0 +1,23 @@
+"""Namespaces
+
+URIs of the namespaces of the ontologies. This module has no dependencies, so the namespaces can be used
+without loading the ontology classes (e.g. by dlod.ontologies).
+"""
+
+RDFSNAMESPACE = "http://www.w3.org/2000/01/rdf-schema#"
+
+CIDOCNAMESPACE = "http://www.cidoc-crm.org/cidoc-crm/"
+
+LRMNAMESPACE = "http://iflastandards.info/ns/lrm/lrmoo/"
+
+DIGNAMESPACE = "http://www.ics.forth.gr/isl/CRMdig/"
+
+PEMNAMESPACE = "http://parthenos.d4science.org/CRMext/CRMpe.rdfs#"
+
+CLSCORNAMESPACE = "https://clscor.io/ontologies/CRMcls/"
+
+SKOSNAMESPACE = "http://www.w3.org/2004/02/skos/core#"
+
+DCNAMESPACE = "http://purl.org/dc/elements/1.1/"
+
+DCTNAMESPACE = "http://purl.org/dc/terms/"
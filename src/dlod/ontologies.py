@@ -4,41 +4,14 @@ Stuff that is connected to handling ontologies.
 The functionality has been implemented to the DraCor class. I moved it.
 """
 import logging
+from rdflib import Graph, URIRef
+from rdflib.namespace import NamespaceManager
+from .namespaces import RDFSNAMESPACE, CIDOCNAMESPACE, LRMNAMESPACE, DIGNAMESPACE, PEMNAMESPACE, CLSCORNAMESPACE, \
+    SKOSNAMESPACE, DCNAMESPACE, DCTNAMESPACE
 
-RDFSNAMESPACE = "http://www.w3.org/2000/01/rdf-schema#"
+# Namespace bindings of graphs, see Ontologies.get_namespace_bindings
+NAMESPACE_BINDINGS = None
 
-try:
-    from .cidoc import NAMESPACE as CIDOCNAMESPACE
-except ImportError:
-    CIDOCNAMESPACE = "http://www.cidoc-crm.org/cidoc-crm/"
-
-try:
-    from .lrmoo import LRMNAMESPACE
-except ImportError:
-    LRMNAMESPACE = "http://iflastandards.info/ns/lrm/lrmoo/"
-
-try:
-    from .crmdig import NAMESPACE as DIGNAMESPACE
-except ImportError:
-    DIGNAMESPACE = "http://www.ics.forth.gr/isl/CRMdig/"
-
-try:
-    from .pem import NAMESPACE as PEMNAMESPACE
-except ImportError:
-    PEMNAMESPACE = "http://parthenos.d4science.org/CRMext/CRMpe.rdfs#"
-
-try:
-    from .crmcls import NAMESPACE as CLSCORNAMESPACE
-except ImportError:
-    CLSCORNAMESPACE = "https://clscor.io/ontologies/CRMcls/"
-
-try:
-    from .skos import NAMESPACE as SKOSNAMESPACE
-except ImportError:
-    SKOSNAMESPACE = "http://www.w3.org/2004/02/skos/core#"
-
-DCNAMESPACE = "http://purl.org/dc/elements/1.1/"
-DCTNAMESPACE = "http://purl.org/dc/terms/"
 
 class Ontologies:
     """Ontologies
@@ -93,6 +66,14 @@ class Ontologies:
         }
     ]
 
+    # prefix -> URI
+    __prefix_index = {item["prefix"]: item["uri"] for item in __data}
+
+    # URI -> prefix
+    __namespace_index = {item["uri"]: item["prefix"] for item in __data}
+
+    # lengths of the namespace URIs, longest first; used to find the longest namespace a URI starts with
+    __namespace_lengths = sorted({len(item["uri"]) for item in __data}, reverse=True)
 
     def __init__(self):
         pass
@@ -106,16 +87,75 @@ class Ontologies:
         Returns:
             str: URI
         """
-        assert self.__data
+        uri = self.__prefix_index.get(prefix)
 
-        try:
-            uri = list(filter(lambda item: prefix in item["prefix"], self.__data))[0]["uri"]
-        except IndexError:
+        if uri is None:
             logging.warning(f"Prefix '{prefix}' is not defined.")
-            uri = None
 
         return uri
 
+    def get_namespace_prefix(self, uri: str) -> str:
+        """Get the prefix of a namespace URI
+
+        Args:
+            uri (str): URI of the namespace, e.g. "http://www.w3.org/2004/02/skos/core#"
+
+        Returns:
+            str: Prefix or None if the namespace is not defined
+        """
+        return self.__namespace_index.get(str(uri))
+
+    def split_uri(self, uri: str) -> tuple:
+        """Split a URI into the prefix of the longest matching namespace and the local name
+
+        Args:
+            uri (str): URI, e.g. "http://www.cidoc-crm.org/cidoc-crm/E55_Type"
+
+        Returns:
+            tuple: (prefix, local name), e.g. ("crm", "E55_Type"); None if no namespace matches
+        """
+        uri = str(uri)
+
+        for length in self.__namespace_lengths:
+            prefix = self.__namespace_index.get(uri[:length])
+            if prefix is not None:
+                return prefix, uri[length:]
+
+        return None
+
+    def compact_uri(self, uri: str) -> str:
+        """Compact a URI to a CURIE, e.g. "crm:E55_Type"
+
+        Args:
+            uri (str): URI
+
+        Returns:
+            str: CURIE or the URI itself if no namespace matches
+        """
+        split = self.split_uri(uri)
+
+        if split is None:
+            return str(uri)
+
+        return f"{split[0]}:{split[1]}"
+
+    def expand_curie(self, curie: str) -> str:
+        """Expand a CURIE, e.g. "crm:E55_Type" to the full URI
+
+        Args:
+            curie (str): CURIE
+
+        Returns:
+            str: URI or None if the prefix is not defined
+        """
+        prefix, _, local_name = curie.partition(":")
+
+        namespace = self.get_prefix_uri(prefix)
+        if namespace is None:
+            return None
+
+        return namespace + local_name
+
     def get_prefixes_uris(self) -> list:
         """Get prefix and corresponding URI
 
@@ -127,4 +167,41 @@ class Ontologies:
             prefix_uris.append(dict(prefix=item["prefix"], uri=item["uri"]))
         return prefix_uris
 
+    def get_namespace_bindings(self) -> tuple:
+        """Get the namespace bindings of graphs: the rdflib core prefixes (rdf, rdfs, owl, xsd, xml) and the prefixes
+        of the ontologies
+
+        The table is built once and cached, see bind_namespaces.
+
+        Returns:
+            tuple: Pairs (prefix, namespace as URIRef)
+        """
+        global NAMESPACE_BINDINGS
+
+        if NAMESPACE_BINDINGS is None:
+            core = NamespaceManager(Graph(bind_namespaces="none"), bind_namespaces="core").namespaces()
+            bindings = dict(core)
+            for item in self.__data:
+                bindings[item["prefix"]] = URIRef(item["uri"])
+            NAMESPACE_BINDINGS = tuple(bindings.items())
+
+        return NAMESPACE_BINDINGS
+
+    def bind_namespaces(self, graph: Graph) -> Graph:
+        """Bind the prefixes of the ontologies in a graph
+
+        The cached bindings (see get_namespace_bindings) are written to the store of the graph directly, without the
+        checks of NamespaceManager.bind. Create the graph with bind_namespaces="none" to skip the default bindings
+        of rdflib. Each graph keeps its own bindings, binding further prefixes in one graph does not change others.
+
+        Args:
+            graph (Graph): Graph
+
+        Returns:
+            Graph: The graph
+        """
+        bind = graph.store.bind
+        for prefix, namespace in self.get_namespace_bindings():
+            bind(prefix, namespace)
 
+        return graph
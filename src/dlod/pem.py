@@ -19,9 +19,11 @@ CIDOC E51 Contact Point is deprecated; in PE29 Access Point superclass was chang
 from rdflib import Namespace
 from .cidoc import E7Activity, E70Thing, E55Type, E39Actor, E41Appellation
 from .crmdig import D1DigitalObject, D14Software
+from .properties import EntityProperty
+from .namespaces import PEMNAMESPACE
 
 # Strange namespace, but it's in the RDF-XML of PEM (Downloaded this: http://parthenos.d4science.org/CRMext/CRMpe.rdfs)
-NAMESPACE = "http://parthenos.d4science.org/CRMext/CRMpe.rdfs#"
+NAMESPACE = PEMNAMESPACE
 
 PEM = Namespace(NAMESPACE)
 
@@ -41,70 +43,22 @@ class PE1Service(E7Activity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def pp2_provided_by(self, *entities, uris: list = None) -> bool:
-        """PP2 provided by (provides): E39 Actor
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = PEM.PP2_provided_by
-        prop_inverse = PEM.PP2i_provides
-
-        range_class_constraint = E39Actor
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    pp2_provided_by = EntityProperty(PEM.PP2_provided_by,
+                                     prop_inverse=PEM.PP2i_provides,
+                                     range_class="E39Actor",
+                                     doc="PP2 provided by (provides): E39 Actor")
 
     # PP42 has declarative time [Not implemented]
 
-    def pp45_has_competency(self, *entities, uris: list = None) -> bool:
-        """PP45 has competency (is competency of): PE36 Competency Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = PEM.PP45_has_competency
-        prop_inverse = PEM.PP45i_is_competency_of
-
-        range_class_constraint = PE36CompetencyType
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def pp51_has_availability(self, *entities, uris: list = None) -> bool:
-        """PP51 has availability (is availability of): PE39 Availability Type
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+    pp45_has_competency = EntityProperty(PEM.PP45_has_competency,
+                                         prop_inverse=PEM.PP45i_is_competency_of,
+                                         range_class="PE36CompetencyType",
+                                         doc="PP45 has competency (is competency of): PE36 Competency Type")
 
-        Returns:
-             bool: True if added
-        """
-        prop = PEM.PP51_has_availability
-        prop_inverse = PEM.PP51i_is_availability_of
-
-        range_class_constraint = PE39AvailabilityType
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    pp51_has_availability = EntityProperty(PEM.PP51_has_availability,
+                                           prop_inverse=PEM.PP51i_is_availability_of,
+                                           range_class="PE39AvailabilityType",
+                                           doc="PP51 has availability (is availability of): PE39 Availability Type")
 
 
 class PE8EService(PE1Service):
@@ -124,51 +78,19 @@ class PE8EService(PE1Service):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def pp28_has_designated_access_point(self, *entities, uris: list = None) -> bool:
-        """PP28 has designated access point (is designated access point of): PE29 Access Point
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = PEM.PP28_has_designated_access_point
-        prop_inverse = PEM.PP28i_is_designated_access_point_of
-
-        range_class_constraint = PE29AccessPoint
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    pp28_has_designated_access_point = EntityProperty(PEM.PP28_has_designated_access_point,
+                                                      prop_inverse=PEM.PP28i_is_designated_access_point_of,
+                                                      range_class="PE29AccessPoint",
+                                                      doc="PP28 has designated access point (is designated access point of): PE29 Access Point")
 
     # PP29 uses access protocol: D14 Software [Not implemented]
     # PP47 has protocol type: PE37 Protocol Type [Not implemented]
     # PP48 uses protocol parameter: PE38 [Not implemented]
 
-    def pp49_provides_access_point(self, *entities, uris: list = None) -> bool:
-        """PP49 provides access point (is access point provided by): PE29 Access Point
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-             bool: True if added
-        """
-        prop = PEM.PP49_provides_access_point
-        prop_inverse = PEM.PP49i_is_access_point_provided_by
-
-        range_class_constraint = PE29AccessPoint
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    pp49_provides_access_point = EntityProperty(PEM.PP49_provides_access_point,
+                                                prop_inverse=PEM.PP49i_is_access_point_provided_by,
+                                                range_class="PE29AccessPoint",
+                                                doc="PP49 provides access point (is access point provided by): PE29 Access Point")
 
 
 class PE19PersistentDigitalObject(D1DigitalObject):
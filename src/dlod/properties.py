@@ -0,0 +1,310 @@
+"""Properties
+
+Declarative registry of the properties of the ontology classes.
+
+A property is declared as class attribute, e.g.
+
+    p1_is_identified_by = EntityProperty(CRM.P1_is_identified_by,
+                                         prop_inverse=CRM.P1i_identifies,
+                                         range_class="E41Appellation",
+                                         doc="P1 is identified by (identifies): E41 Appellation")
+
+When the class is created the declaration is replaced by a generated method and added to PROPERTIES, the index of
+all properties (domain class, method name, property, inverse property, range class, kind).
+For properties with an entity as range, a class method "bulk_" + name is generated as well, to add the property
+for many (domain, range) pairs at once (see Entity.insert_edges).
+"""
+import inspect
+import sys
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from rdflib import URIRef
+
+# Index of all declared properties
+PROPERTIES = list()
+
+# (domain class, method name) -> PropertyDefinition
+PROPERTIES_BY_METHOD = dict()
+
+ENTITY_ARGS_DOC = """
+Args:
+    *entities (optional): Any number of instances of an Entity class
+    uris (list, optional): List of URIs of entities that identify this
+
+Returns:
+     bool: True if added
+"""
+
+BULK_DOC = """Add "{name}" for many (domain, range) pairs in one operation
+
+Triples are written to the buffer of the target (an entity or a session). Domains must be instances of
+{domain} and ranges of {range} (or subclasses thereof); the classes are checked once per class.
+Nothing is added if an entity violates a constraint. Nothing is checked if the validation policy of the target
+(or, if it has none, of {domain}) is "trusted".
+
+Args:
+    target: Entity, EntityHandle or Session to write the triples to
+    pairs (optional): Iterable of (domain, range) pairs. Items are URIs or entities (Entity, EntityHandle)
+    domains (optional): Domains as a sequence parallel to ranges, if no pairs are passed
+    ranges (optional): Ranges as a sequence parallel to domains, if no pairs are passed
+
+Returns:
+     bool: True if added
+"""
+
+LITERAL_ARGS_DOC = """
+Args:
+    content (str): Textual content
+    lang (str, optional): Language of the content. Added to the Literal.
+
+Returns:
+     bool: True if added
+"""
+
+TYPED_LITERAL_ARGS_DOC = """
+Args:
+    {argument} (str): Value as range
+    datatype (str, optional): Datatype that will be added to Literal. Use XSD datatypes.
+
+Returns:
+     bool: True if added
+"""
+
+PropertyDefinition = namedtuple("PropertyDefinition",
+                                ["domain_class", "name", "prop", "prop_inverse", "range_class", "kind"])
+PropertyDefinition.__doc__ = """Property Definition
+
+Row of the property index. range_class is the name of the class (or None), use resolve_range_class to get the class.
+kind is "entity", "literal" (Literal with language) or "typed_literal" (Literal with datatype).
+"""
+
+
+def resolve_range_class(definition: PropertyDefinition):
+    """Get the range class of a property
+
+    Names are looked up in the module of the domain class.
+
+    Args:
+        definition (PropertyDefinition): Property
+
+    Returns:
+        Class of the range or None
+    """
+    if definition.range_class is None or not isinstance(definition.range_class, str):
+        return definition.range_class
+
+    return getattr(sys.modules[definition.domain_class.__module__], definition.range_class)
+
+
+def get_property(domain_class, name: str) -> PropertyDefinition:
+    """Get the definition of a property method of a class or its superclasses
+
+    Args:
+        domain_class: Class
+        name (str): Name of the method, e.g. "p1_is_identified_by"
+
+    Returns:
+        PropertyDefinition: Definition or None if it is not a declared property
+    """
+    for klass in domain_class.__mro__:
+        definition = PROPERTIES_BY_METHOD.get((klass, name))
+        if definition:
+            return definition
+
+    return None
+
+
+def get_properties(domain_class) -> list:
+    """Get the definitions of all properties of a class, including inherited ones
+
+    Args:
+        domain_class: Class
+
+    Returns:
+        list: PropertyDefinition for each method
+    """
+    definitions = dict()
+
+    for klass in reversed(domain_class.__mro__):
+        for definition in PROPERTIES:
+            if definition.domain_class is klass:
+                definitions[definition.name] = definition
+
+    return list(definitions.values())
+
+
+class Property(ABC):
+    """Property
+
+    Abstract base class of the declarations. Subclasses implement _method and _args_doc.
+    """
+
+    kind = None
+
+    def __init__(self, prop: URIRef, doc: str = None):
+        """Initialize
+
+        Args:
+            prop (URIRef): Property
+            doc (str, optional): Docstring of the method, Args and Returns are added
+        """
+        assert type(prop) == URIRef, "Invalid type. Expected property prop as URIRef."
+
+        self.prop = prop
+        self.prop_inverse = None
+        self.range_class = None
+        self.doc = doc
+
+    @abstractmethod
+    def _method(self, definition: PropertyDefinition):
+        """Generate the method that replaces the declaration
+
+        Args:
+            definition (PropertyDefinition): Property
+
+        Returns:
+            Function that takes the entity as first argument
+        """
+
+    @abstractmethod
+    def _args_doc(self) -> str:
+        """Args and Returns section of the docstring of the generated method"""
+
+    def _bulk_method(self, definition: PropertyDefinition):
+        return None
+
+    def __set_name__(self, owner, name):
+        definition = PropertyDefinition(owner, name, self.prop, self.prop_inverse, self.range_class, self.kind)
+        PROPERTIES.append(definition)
+        PROPERTIES_BY_METHOD[(owner, name)] = definition
+
+        method = self._method(definition)
+        method.__name__ = name
+        method.__qualname__ = f"{owner.__qualname__}.{name}"
+        method.__module__ = owner.__module__
+        method.__doc__ = inspect.cleandoc(self.doc or "") + "\n" + self._args_doc()
+        method.property_definition = definition
+
+        # replace the declaration with the method
+        setattr(owner, name, method)
+
+        bulk_method = self._bulk_method(definition)
+        if bulk_method:
+            bulk_name = "bulk_" + name
+            bulk_method.__name__ = bulk_name
+            bulk_method.__qualname__ = f"{owner.__qualname__}.{bulk_name}"
+            bulk_method.__module__ = owner.__module__
+            bulk_method.__doc__ = BULK_DOC.format(name=name,
+                                                  domain=owner.__name__,
+                                                  range=definition.range_class or "any class")
+            bulk_method.property_definition = definition
+            setattr(owner, bulk_name, classmethod(bulk_method))
+
+
+class EntityProperty(Property):
+    """Property with an entity as range
+
+    The generated method takes any number of entities or a list of URIs, see Entity.add_triples.
+    """
+
+    kind = "entity"
+
+    def __init__(self, prop: URIRef, prop_inverse: URIRef = None, range_class=None, doc: str = None):
+        """Initialize
+
+        Args:
+            prop (URIRef): Property
+            prop_inverse (URIRef, optional): Inverse property
+            range_class (optional): Expected class (or name of the class in the module) as range or a subclass thereof
+            doc (str, optional): Docstring of the method
+        """
+        super().__init__(prop, doc=doc)
+
+        if prop_inverse:
+            assert type(prop_inverse) == URIRef, "Invalid type. Expected property prop_inverse as URIRef."
+
+        self.prop_inverse = prop_inverse
+        self.range_class = range_class
+
+    def _args_doc(self) -> str:
+        return ENTITY_ARGS_DOC
+
+    def _method(self, definition: PropertyDefinition):
+        prop = definition.prop
+        prop_inverse = definition.prop_inverse
+
+        # the range class might be defined later in the module, it is resolved on the first call
+        range_class_constraint = []
+
+        def method(self, *entities, uris: list = None) -> bool:
+            if not range_class_constraint:
+                range_class_constraint.append(resolve_range_class(definition))
+
+            return self.add_triples(entities=list(entities),
+                                    uris=uris,
+                                    prop=prop,
+                                    prop_inverse=prop_inverse,
+                                    range_class_constraint=range_class_constraint[0])
+
+        return method
+
+    def _bulk_method(self, definition: PropertyDefinition):
+        prop = definition.prop
+        prop_inverse = definition.prop_inverse
+
+        def bulk_method(cls, target, pairs=None, domains=None, ranges=None) -> bool:
+            return cls.insert_edges(target.buffer,
+                                    prop,
+                                    pairs=pairs,
+                                    prop_inverse=prop_inverse,
+                                    range_class_constraint=resolve_range_class(definition),
+                                    domains=domains,
+                                    ranges=ranges,
+                                    domain_class_constraint=cls,
+                                    validation=getattr(target, "validation", None) or cls.validation)
+
+        return bulk_method
+
+
+class LiteralProperty(Property):
+    """Property with a Literal as range
+
+    The generated method takes the content and the language (or with typed=True the value and the datatype),
+    see Entity.add_property_to_literal_value_triple.
+    """
+
+    def __init__(self, prop: URIRef, typed: bool = False, argument: str = None, doc: str = None):
+        """Initialize
+
+        Args:
+            prop (URIRef): Property
+            typed (bool, optional): Add a datatype instead of a language to the Literal. Defaults to False.
+            argument (str, optional): Name of the first argument of a typed method: "value" (default) or "content"
+            doc (str, optional): Docstring of the method
+        """
+        super().__init__(prop, doc=doc)
+
+        self.kind = "typed_literal" if typed else "literal"
+        self.argument = argument or ("value" if typed else "content")
+
+    def _args_doc(self) -> str:
+        if self.kind == "typed_literal":
+            return TYPED_LITERAL_ARGS_DOC.format(argument=self.argument)
+        return LITERAL_ARGS_DOC
+
+    def _method(self, definition: PropertyDefinition):
+        prop = definition.prop
+
+        if self.kind == "literal":
+            def method(self, content: str, lang: str = None) -> bool:
+                return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
+
+        elif self.argument == "content":
+            def method(self, content: str, datatype: str = None) -> bool:
+                return self.add_property_to_literal_value_triple(content, prop=prop, datatype=datatype)
+
+        else:
+            def method(self, value: str, datatype: str = None) -> bool:
+                return self.add_property_to_literal_value_triple(value, prop=prop, datatype=datatype)
+
+        return method
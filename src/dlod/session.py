@@ -0,0 +1,138 @@
+"""Session
+
+Shared graph (arena) that all entities created in a session write to.
+"""
+from rdflib import Graph
+from .buffer import TripleBuffer
+
+# Validation policies of entities, see Entity.validation
+# strict: validate every call; batch: validate the data of a call at once; trusted: do not validate
+STRICT = "strict"
+BATCH = "batch"
+TRUSTED = "trusted"
+VALIDATION_POLICIES = (STRICT, BATCH, TRUSTED)
+
+
+class Session:
+    """Session
+
+    Entities created with session=... do not hold a graph of their own, but add their triples to the graph
+    of the session. Linking two entities of the same session only adds the triples of the link itself.
+
+    With registry=True the session keeps an identity map of its entities: constructing an entity with the URI of an
+    entity of the session returns the existing instance, new statements (e.g. labels) are added to it.
+
+    Attributes:
+        buffer (TripleBuffer): Triples of all entities of the session
+        graph (Graph): Shared graph, built from the buffer when accessed and cached until the next change
+        registry (dict): Entities of the session by URI. None if the session does not keep a registry.
+        validation (str): Validation policy of the entities created in the session ("strict", "batch" or
+            "trusted"). None if the entities use the policy of their class.
+    """
+
+    # Triples
+    buffer = None
+
+    # Identity map
+    registry = None
+
+    # Validation policy of the entities
+    validation = None
+
+    def __init__(self, registry: bool = False, validation: str = None):
+        """Initialize
+
+        Args:
+            registry (bool, optional): Keep a registry of the entities by URI. Defaults to False.
+            validation (str, optional): Validation policy of the entities: "strict", "batch" or "trusted"
+                (e.g. for bulk loads of data that was validated upstream). Defaults to the policy of the entity class.
+        """
+        self.buffer = TripleBuffer()
+
+        if registry:
+            self.registry = dict()
+
+        if validation:
+            assert validation in VALIDATION_POLICIES, f"Invalid validation policy. Expected one of {VALIDATION_POLICIES}."
+            self.validation = validation
+
+    def get(self, uri: str):
+        """Get an entity of the session by URI
+
+        Args:
+            uri (str): URI of the entity
+
+        Returns:
+            Entity: Instance or None if there is no such entity (or the session does not keep a registry)
+        """
+        if self.registry is None:
+            return None
+
+        return self.registry.get(uri)
+
+    def register(self, entity) -> bool:
+        """Add an entity to the registry
+
+        Args:
+            entity (Entity): Entity with a URI
+
+        Returns:
+            bool: True if added, False if the session does not keep a registry or the URI is registered already
+        """
+        if self.registry is None or entity.uri in self.registry:
+            return False
+
+        self.registry[entity.uri] = entity
+        return True
+
+    @property
+    def graph(self) -> Graph:
+        """Shared graph of the session"""
+        return self.buffer.graph()
+
+    def attach(self, sink, retain: bool = False) -> bool:
+        """Attach a streaming sink, e.g. dlod.io.NTriplesWriter
+
+        Triples are written to the sink as they are added.
+        Triples that were added before are written at once.
+
+        Args:
+            sink: Object with a method write(triples)
+            retain (bool, optional): Also keep the triples in memory, e.g. to serialize them later. Defaults to False.
+
+        Returns:
+            bool: True if successful
+        """
+        self.buffer.attach(sink, retain=retain)
+        return True
+
+    def dump(self) -> Graph:
+        """Return the shared graph
+
+        Returns:
+            Graph: All triples of the entities in this session
+        """
+        return self.graph
+
+    def serialize(self, format: str = "ttl"):
+        """Serialize the shared graph
+
+        Args:
+            format (str): Format of the serialization. Defaults to "ttl". Other values: e.g. "xml"
+        """
+        return self.graph.serialize(format=format)
+
+    def store(self, format: str = "ttl", folder: str = "export", filename: str = "out") -> bool:
+        """Store the serialized shared graph in a file
+
+        Args:
+            format (str): Format of the serialization. Defaults to "ttl".
+            folder (str): Destination folder
+            filename (str): Name of the file without extension
+
+        Returns:
+            bool: True if successful
+        """
+        destination = f"{folder}/{filename}.{format}"
+        self.graph.serialize(format=format, destination=destination)
+        return True
@@ -4,10 +4,14 @@ see also https://www.w3.org/TR/2009/REC-skos-reference-20090818/
 
 """
 
-from rdflib import Namespace
-from .entity import Entity
+from rdflib import Namespace, Literal, URIRef, RDF
+from .entity import Entity, EntityHandle
+from .buffer import TripleBuffer
+from .session import Session
+from .properties import EntityProperty, LiteralProperty
+from .namespaces import SKOSNAMESPACE
 
-NAMESPACE = "http://www.w3.org/2004/02/skos/core#"
+NAMESPACE = SKOSNAMESPACE
 
 SKOS = Namespace(NAMESPACE)
 
@@ -43,424 +47,226 @@ class SkosConcept(Entity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def skos_pref_label(self, content: str, lang: str = None) -> bool:
-        """skos:prefLabel: Literal
+    @classmethod
+    def from_records(cls,
+                     records,
+                     base_uri: str = "",
+                     scheme=None,
+                     lang: str = None,
+                     top_concepts: bool = True,
+                     session: Session = None) -> list:
+        """Create skos:Concepts from (nested) records in one pass
 
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = SKOS.prefLabel
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
+        Records are structured like the raw data in the notebooks, e.g.
+            {"id": "drama", "label": "Drama", "narrower": [{"id": "tragoedie", "label": "Tragödie"}]}
 
-    def skos_alt_label(self, content: str, lang: str = None) -> bool:
-        """skos:altLabel: Literal
+        Adds skos:prefLabel, skos:inScheme (if a scheme is passed), skos:narrower and skos:broader, and for the
+        records on the top level skos:topConceptOf and skos:hasTopConcept (if top_concepts is set).
+        The triples are written to the buffer of the session or else of the scheme, so the handles can be linked to
+        other entities of the scheme without copying any triples.
 
         Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
+            records: Iterable of records with "id" (or "uri"), "label", optional "lang" and "narrower"
+            base_uri (str, optional): Base URI the "id" of the records is appended to
+            scheme (SkosConceptScheme, optional): Concept Scheme of the concepts
+            lang (str, optional): Language of the labels if a record does not have "lang"
+            top_concepts (bool, optional): Add the records on the top level as top concepts of the scheme.
+                Defaults to True.
+            session (Session, optional): Session to write the triples to
 
         Returns:
-             bool: True if added
+            list: EntityHandle of each concept, depth first in the order of the records
         """
-        prop = SKOS.altLabel
+        if session:
+            buffer = session.buffer
+        elif scheme:
+            buffer = scheme.buffer
+        else:
+            buffer = TripleBuffer()
 
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
+        class_uris = cls.rdf_types(cls.infer_types)
+        scheme_e = URIRef(scheme.uri) if scheme and scheme.uri else None
 
-    def skos_hidden_label(self, content: str, lang: str = None) -> bool:
-        """skos:hiddenLabel: Literal
+        triples = []
+        handles = []
 
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
+        # (record, URIRef of the broader concept)
+        stack = [(record, None) for record in reversed(list(records))]
 
-        Returns:
-             bool: True if added
-        """
-        prop = SKOS.hiddenLabel
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
+        while stack:
+            record, broader_e = stack.pop()
 
-    def skos_broader(self, *entities, uris: list = None) -> bool:
-        """skos:broader (skos:narrower): skos:Concept
+            uri = cls.record_uri(record, base_uri)
+            if uri is None:
+                continue
 
-        Add triples "skos:broader" and inverse to the self.graph either for each passed entity
-        or for each URI provided in "uris".
+            concept_e = URIRef(uri)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+            for class_e in class_uris:
+                triples.append((concept_e, RDF.type, class_e))
 
-        Returns:
-            bool: True if added
+            if record.get("label"):
+                triples.append((concept_e, SKOS.prefLabel, Literal(record["label"], lang=record.get("lang", lang))))
 
-        """
-        prop = SKOS.broader
-        prop_inverse = SKOS.narrower
+            if scheme_e:
+                triples.append((concept_e, SKOS.inScheme, scheme_e))
 
-        range_class_constraint = SkosConcept
+                if broader_e is None and top_concepts:
+                    triples.append((scheme_e, SKOS.hasTopConcept, concept_e))
+                    triples.append((concept_e, SKOS.topConceptOf, scheme_e))
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+            if broader_e is not None:
+                triples.append((broader_e, SKOS.narrower, concept_e))
+                triples.append((concept_e, SKOS.broader, broader_e))
 
-    def skos_narrower(self, *entities, uris: list = None) -> bool:
-        """skos:narrower (skos:braoder): skos:Concept
+            handles.append(EntityHandle(uri, cls, buffer))
 
-        Add triples "skos:narrower" and inverse to the self.graph either for each passed entity
-        or for each URI provided in "uris".
+            for narrower in reversed(record.get("narrower", [])):
+                stack.append((narrower, concept_e))
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+        buffer.extend(triples)
 
-        Returns:
-            bool: True if added
+        return handles
 
-        """
-        prop = SKOS.narrower
-        prop_inverse = SKOS.broader
+    skos_pref_label = LiteralProperty(SKOS.prefLabel,
+                                      doc="skos:prefLabel: Literal")
 
-        range_class_constraint = SkosConcept
+    skos_alt_label = LiteralProperty(SKOS.altLabel,
+                                     doc="skos:altLabel: Literal")
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+    skos_hidden_label = LiteralProperty(SKOS.hiddenLabel,
+                                        doc="skos:hiddenLabel: Literal")
 
-    def skos_related(self, *entities, uris: list = None) -> bool:
-        """skos:related: skos:Concept
+    skos_broader = EntityProperty(SKOS.broader,
+                                  prop_inverse=SKOS.narrower,
+                                  range_class="SkosConcept",
+                                  doc="""skos:broader (skos:narrower): skos:Concept
 
-        Add triples "skos:related" and inverse to the self.graph either for each passed entity
+        Add triples "skos:broader" and inverse to the self.graph either for each passed entity
         or for each URI provided in "uris".
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-
-        """
-        prop = SKOS.related
-        prop_inverse = SKOS.related
-
-        range_class_constraint = SkosConcept
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def skos_definition(self, content: str, lang: str = None) -> bool:
-        """skos:definition: Literal
-        
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = SKOS.definition
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
-
-    def skos_note(self, content: str, lang: str = None) -> bool:
-        """skos:note: Literal
-
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = SKOS.note
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
-
-    def skos_scope_note(self, content: str, lang: str = None) -> bool:
-        """skos:scopeNote: Literal
-
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = SKOS.scopeNote
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
-
-    def skos_example(self, content: str, lang: str = None) -> bool:
-        """skos:example: Literal
-
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = SKOS.example
-
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
+    skos_narrower = EntityProperty(SKOS.narrower,
+                                   prop_inverse=SKOS.broader,
+                                   range_class="SkosConcept",
+                                   doc="""skos:narrower (skos:braoder): skos:Concept
 
-    def skos_history_note(self, content: str, lang: str = None) -> bool:
-        """skos:historyNote: Literal
-
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
-
-        Returns:
-             bool: True if added
-        """
-        prop = SKOS.historyNote
+        Add triples "skos:narrower" and inverse to the self.graph either for each passed entity
+        or for each URI provided in "uris".
+        """)
 
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
+    skos_related = EntityProperty(SKOS.related,
+                                  prop_inverse=SKOS.related,
+                                  range_class="SkosConcept",
+                                  doc="""skos:related: skos:Concept
 
-    def skos_editorial_note(self, content: str, lang: str = None) -> bool:
-        """skos:editorialNote: Literal
+        Add triples "skos:related" and inverse to the self.graph either for each passed entity
+        or for each URI provided in "uris".
+        """)
 
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
+    skos_definition = LiteralProperty(SKOS.definition,
+                                      doc="skos:definition: Literal")
 
-        Returns:
-             bool: True if added
-        """
-        prop = SKOS.editorialNote
+    skos_note = LiteralProperty(SKOS.note,
+                                doc="skos:note: Literal")
 
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
+    skos_scope_note = LiteralProperty(SKOS.scopeNote,
+                                      doc="skos:scopeNote: Literal")
 
-    def skos_change_note(self, content: str, lang: str = None) -> bool:
-        """skos:changeNote: Literal
+    skos_example = LiteralProperty(SKOS.example,
+                                   doc="skos:example: Literal")
 
-        Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
+    skos_history_note = LiteralProperty(SKOS.historyNote,
+                                        doc="skos:historyNote: Literal")
 
-        Returns:
-             bool: True if added
-        """
-        prop = SKOS.changeNote
+    skos_editorial_note = LiteralProperty(SKOS.editorialNote,
+                                          doc="skos:editorialNote: Literal")
 
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
+    skos_change_note = LiteralProperty(SKOS.changeNote,
+                                       doc="skos:changeNote: Literal")
 
-    def skos_in_scheme(self, *entities, uris: list = None) -> bool:
-        """skos:inScheme: skos:ConceptScheme
+    skos_in_scheme = EntityProperty(SKOS.inScheme,
+                                    range_class="SkosConceptScheme",
+                                    doc="""skos:inScheme: skos:ConceptScheme
 
         Add triples "skos:inScheme" to the self.graph either for each passed entity
         or for each URI provided in "uris".
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-
-        """
-        prop = SKOS.inScheme
-
-        range_class_constraint = SkosConceptScheme
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                range_class_constraint=range_class_constraint)
-
-    def skos_broad_match(self, *entities, uris: list = None) -> bool:
-        """skos:broadMatch: skos:Concept
+    skos_broad_match = EntityProperty(SKOS.broadMatch,
+                                      prop_inverse=SKOS.narrowMatch,
+                                      range_class="SkosConcept",
+                                      doc="""skos:broadMatch: skos:Concept
 
         Add triples "skos:broadMatch" to the self.graph either for each passed entity
         or for each URI provided in "uris".
 
         inverse skos:narrowMatch
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-
-        """
-        prop = SKOS.broadMatch
-        prop_inverse = SKOS.narrowMatch
-
-        range_class_constraint = SkosConcept
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def skos_narrow_match(self, *entities, uris: list = None) -> bool:
-        """skos:narrowMatch: skos:Concept
+    skos_narrow_match = EntityProperty(SKOS.narrowMatch,
+                                       prop_inverse=SKOS.broadMatch,
+                                       range_class="SkosConcept",
+                                       doc="""skos:narrowMatch: skos:Concept
 
         Add triples "skos:narrowMatch" to the self.graph either for each passed entity
         or for each URI provided in "uris".
 
         TODO: check if inverse
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-
-        """
-        prop = SKOS.narrowMatch
-        prop_inverse = SKOS.broadMatch
-
-        range_class_constraint = SkosConcept
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def skos_related_match(self, *entities, uris: list = None) -> bool:
-        """skos:relatedMatch: skos:Concept
+    # Not sure about the inverse; if it can be assumed automatically
+    # prop_inverse = SKOS.relatedMatch
+    # prop_inverse=prop_inverse,
+    skos_related_match = EntityProperty(SKOS.relatedMatch,
+                                        range_class="SkosConcept",
+                                        doc="""skos:relatedMatch: skos:Concept
 
         Add triples "skos:relatedMatch" to the self.graph either for each passed entity
         or for each URI provided in "uris".
 
         TODO: check if inverse
+        """)
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-
-        """
-        prop = SKOS.relatedMatch
-        # Not sure about the inverse; if it can be assumed automatically
-        # prop_inverse = SKOS.relatedMatch
-
-        range_class_constraint = SkosConcept
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                # prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-
-    def skos_exact_match(self, *entities, uris: list = None) -> bool:
-        """skos:exactMatch: skos:Concept
+    # Not sure about the inverse; if it can be assumed automatically
+    # prop_inverse = SKOS.exactMatch
+    # prop_inverse=prop_inverse,
+    skos_exact_match = EntityProperty(SKOS.exactMatch,
+                                      range_class="SkosConcept",
+                                      doc="""skos:exactMatch: skos:Concept
 
         Add triples "skos:exactMatch" to the self.graph either for each passed entity
         or for each URI provided in "uris".
 
         TODO: check if inverse
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-
-        """
-        prop = SKOS.exactMatch
-        # Not sure about the inverse; if it can be assumed automatically
-        # prop_inverse = SKOS.exactMatch
-
-        range_class_constraint = SkosConcept
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                # prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
-    
-    def skos_semanticRelation(self, *entities, uris: list = None) -> bool:
-        """skos:semanticRelation: skos:Concept
+        """)
     
+    skos_semanticRelation = EntityProperty(SKOS.semanticRelation,
+                                           range_class="SkosConcept",
+                                           doc="""skos:semanticRelation: skos:Concept
+
         Add triples "skos:semanticRelation" to the self.graph either for each passed entity
         or for each URI provided in "uris".
-        
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-        """
-        prop = SKOS.semanticRelation
-
-        range_class_constraint = SkosConcept
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                range_class_constraint=range_class_constraint)
+        """)
     
-    def skos_broaderTransitive(self, *entities, uris: list = None) -> bool:
-        """skos:broaderTransitive
-        
+    skos_broaderTransitive = EntityProperty(SKOS.broaderTransitive,
+                                            prop_inverse=SKOS.narrowerTransitive,
+                                            range_class="SkosConcept",
+                                            doc="""skos:broaderTransitive
+
         Add triples "skos:broaderTransitive" and inverse skos:narrowerTransitive to the self.graph 
         either for each passed entity or for each URI provided in "uris".
-        
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-        """
-        prop = SKOS.broaderTransitive
-        prop_inverse = SKOS.narrowerTransitive
-
-        range_class_constraint = SkosConcept
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+        """)
     
 
-    def skos_narrowerTransitive(self, *entities, uris: list = None) -> bool:
-        """skos:narrowerTransitive
-        
+    skos_narrowerTransitive = EntityProperty(SKOS.narrowerTransitive,
+                                             prop_inverse=SKOS.broaderTransitive,
+                                             range_class="SkosConcept",
+                                             doc="""skos:narrowerTransitive
+
         Add triples "skos:narrowerTransitive" and inverse skos:broaderTransitive to the self.graph 
         either for each passed entity or for each URI provided in "uris".
-        
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-        """
-        prop = SKOS.narrowerTransitive
-        prop_inverse = SKOS.broaderTransitive
-
-        range_class_constraint = SkosConcept
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+        """)
 
 
 
@@ -475,30 +281,14 @@ class SkosConceptScheme(Entity):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-    def skos_has_top_concept(self, *entities, uris: list = None) -> bool:
-        """skos:hasTopConcept: skos:Concept
+    skos_has_top_concept = EntityProperty(SKOS.hasTopConcept,
+                                          prop_inverse=SKOS.topConceptOf,
+                                          range_class="SkosConcept",
+                                          doc="""skos:hasTopConcept: skos:Concept
 
         Add triples "skos:hasTopConcept" and inverse (skos:topConceptOf) to the self.graph either for each passed entity
         or for each URI provided in "uris".
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-
-        """
-        prop = SKOS.hasTopConcept
-        prop_inverse = SKOS.topConceptOf
-
-        range_class_constraint = SkosConcept
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop,
-                                prop_inverse=prop_inverse,
-                                range_class_constraint=range_class_constraint)
+        """)
 
 class SkosCollection(Entity):
     """skos:Collection
@@ -510,46 +300,70 @@ class SkosCollection(Entity):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-    
-    # also need skos:prefLabel here (ideally, this would be interited from a super-class of 
-    # skos:Concep and skos:Collection)
-    # in the ontology these are disjoint classes, but implementation-whise it would be smarter not having to define the properties twice
-    def skos_pref_label(self, content: str, lang: str = None) -> bool:
-        """skos:prefLabel: Literal
+
+    @classmethod
+    def from_records(cls, records, base_uri: str = "", lang: str = None, session: Session = None) -> list:
+        """Create skos:Collections from records in one pass
+
+        A record has an "id" (or "uri"), a "label" and "members", e.g.
+            {"id": "collection/melodram_oper", "label": "Das Melodram und die Oper", "members": ["melodram", "oper"]}
+
+        Members are IDs (appended to base_uri) or records with "id" or "uri"; they are added with skos:member.
 
         Args:
-            content (str): Textual content
-            lang (str, optional): Language of the content. Added to the Literal.
+            records: Iterable of records
+            base_uri (str, optional): Base URI the IDs are appended to
+            lang (str, optional): Language of the labels if a record does not have "lang"
+            session (Session, optional): Session to write the triples to
 
         Returns:
-             bool: True if added
+            list: EntityHandle of each collection
         """
-        prop = SKOS.prefLabel
+        buffer = session.buffer if session else TripleBuffer()
 
-        return self.add_property_to_literal_value_triple(content, prop=prop, lang=lang)
-    
-    def skos_member(self, *entities, uris: list = None) -> bool:
-        """skos:member skos:Collection (also skos:Concept)
-        range = union of skos:Concept and skos:Collection
+        class_uris = cls.rdf_types(cls.infer_types)
 
-        Add triples "skos:member" and inverse (skos:topConceptOf) to the self.graph either for each passed entity
-        or for each URI provided in "uris".
+        triples = []
+        handles = []
 
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
+        for record in records:
+            uri = cls.record_uri(record, base_uri)
+            if uri is None:
+                continue
 
-        Returns:
-            bool: True if added
-        """
-        prop = SKOS.member
+            collection_e = URIRef(uri)
 
-        # TODO: Check range constraint
+            for class_e in class_uris:
+                triples.append((collection_e, RDF.type, class_e))
 
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop
-                                )
+            if record.get("label"):
+                triples.append((collection_e, SKOS.prefLabel, Literal(record["label"], lang=record.get("lang", lang))))
+
+            for member in record.get("members", []):
+                member_uri = base_uri + member if type(member) == str else cls.record_uri(member, base_uri)
+                if member_uri:
+                    triples.append((collection_e, SKOS.member, URIRef(member_uri)))
+
+            handles.append(EntityHandle(uri, cls, buffer))
+
+        buffer.extend(triples)
+
+        return handles
+    
+    # also need skos:prefLabel here (ideally, this would be interited from a super-class of 
+    # skos:Concep and skos:Collection)
+    # in the ontology these are disjoint classes, but implementation-whise it would be smarter not having to define the properties twice
+    skos_pref_label = LiteralProperty(SKOS.prefLabel,
+                                      doc="skos:prefLabel: Literal")
+    
+    # TODO: Check range constraint
+    skos_member = EntityProperty(SKOS.member,
+                                 doc="""skos:member skos:Collection (also skos:Concept)
+        range = union of skos:Concept and skos:Collection
+
+        Add triples "skos:member" and inverse (skos:topConceptOf) to the self.graph either for each passed entity
+        or for each URI provided in "uris".
+        """)
 
 class SkosOrderedCollection(SkosCollection):
     """skos:OrderedCollection
@@ -562,27 +376,13 @@ class SkosOrderedCollection(SkosCollection):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
     
-    def skos_memberList(self, *entities, uris: list = None) -> bool:
-        """skos:memberList:  rdf:List? )
-        
+    # TODO: Check range constraint ( rdf:List): see: https://www.w3.org/TR/skos-reference/#collections
+    skos_memberList = EntityProperty(SKOS.memberList,
+                                     doc="""skos:memberList:  rdf:List? )
+
         Add triples "skos:memberList"  to the self.graph either for each passed entity
         or for each URI provided in "uris".
-
-        Args:
-            *entities (optional): Any number of instances of an Entity class
-            uris (list, optional): List of URIs of entities that identify this
-
-        Returns:
-            bool: True if added
-        """
-        prop = SKOS.memberList
-
-        # TODO: Check range constraint ( rdf:List): see: https://www.w3.org/TR/skos-reference/#collections
-
-        return self.add_triples(entities=list(entities),
-                                uris=uris,
-                                prop=prop
-                                )
+        """)
 
     
 
@@ -2,13 +2,1259 @@
 
 Used to connect to a triple store and send SPARQL queries
 
+The default endpoints are the ones of the Fuseki instance of the development setup (docker/compose.yml), e.g.
+http://localhost:9030/genre/sparql for queries and http://localhost:9030/genre/update for updates.
 """
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from rdflib import Graph, Literal, URIRef, BNode
+from rdflib.compare import isomorphic
+from rdflib.util import from_n3
+from .io import nt_term, NTriplesWriter
+
+# Longest query that is sent with GET, longer queries are sent with POST
+MAX_GET_QUERY_LENGTH = 2000
+
+# String literals (long ones first) and IRIs of a query: whitespace and "#" in them are kept. A "#" outside of them
+# starts a comment, which is matched but not captured.
+QUERY_TOKENS = re.compile("("
+                          + r'"""(?:[^"\\]|\\.|"(?!""))*"""' + "|" + r"'''(?:[^'\\]|\\.|'(?!''))*'''" + "|"
+                          + r'"(?:[^"\\\n]|\\.)*"' + "|" + r"'(?:[^'\\\n]|\\.)*'" + "|"
+                          + r'<[^<>"{}|^`\\\s]*>'
+                          + r")|#[^\n]*")
+
+WHITESPACE = re.compile(r"\s+")
+
+# PREFIX and BASE declarations (and comments) at the beginning of a query
+PROLOGUE = re.compile(r"^\s*((?:(?:PREFIX\s+[^\s:]*:\s*<[^>]*>|BASE\s+<[^>]*>|#[^\n]*)\s*)*)", re.IGNORECASE)
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for the result cache
+
+    Comments are removed and runs of whitespace are replaced by a single space, both outside of string literals
+    and IRIs. Removing comments first keeps a comment from commenting out the rest of the query once the lines are
+    joined.
+
+    Args:
+        query (str): SPARQL query
+
+    Returns:
+        str: Normalized query
+    """
+    parts = []
+    # text outside of string literals and IRIs, up to the next literal or IRI
+    text = []
+    position = 0
+
+    for match in QUERY_TOKENS.finditer(query):
+        text.append(query[position:match.start()])
+        position = match.end()
+
+        # group 1 is a string literal or an IRI, otherwise the match is a comment and left out
+        if match.group(1) is not None:
+            parts.append(WHITESPACE.sub(" ", "".join(text)))
+            parts.append(match.group(1))
+            text = []
+
+    text.append(query[position:])
+    parts.append(WHITESPACE.sub(" ", "".join(text)))
+
+    return "".join(parts).strip()
+
+
+def iter_triples(source):
+    """Triples of a graph, an entity, a session, a buffer or a file
+
+    Args:
+        source: rdflib.Graph, Entity, Session, EntityHandle, TripleBuffer (anything with a buffer is read from the
+            buffer without building a graph) or the path of an RDF file, e.g. "out/eschenburg.ttl"
+
+    Returns:
+        Iterable of triples
+    """
+    if isinstance(source, str):
+        g = Graph()
+        g.parse(source)
+        return g
+
+    if isinstance(source, Graph):
+        return source
+
+    buffer = getattr(source, "buffer", None)
+    if buffer is not None:
+        # compact once, the triples of a shared buffer are not uploaded twice
+        buffer.compact()
+        return buffer
+
+    return source
+
+
+def binding_to_term(binding: dict):
+    """Convert a value of the SPARQL JSON results format to an rdflib term
+
+    Args:
+        binding (dict): Value, e.g. {"type": "uri", "value": "http://..."}
+
+    Returns:
+        URIRef, Literal or BNode
+    """
+    if binding["type"] == "uri":
+        return URIRef(binding["value"])
+
+    if binding["type"] == "bnode":
+        return BNode(binding["value"])
+
+    # "literal" and "typed-literal" (SPARQL 1.0)
+    if binding.get("datatype"):
+        return Literal(binding["value"], datatype=URIRef(binding["datatype"]))
+
+    return Literal(binding["value"], lang=binding.get("xml:lang"))
+
+
+def split_prologue(query: str) -> tuple:
+    """Split a query into the prologue (PREFIX and BASE declarations) and the rest
+
+    Args:
+        query (str): SPARQL query
+
+    Returns:
+        tuple: (prologue, query without prologue)
+    """
+    prologue = PROLOGUE.match(query).group(1)
+    return prologue, query[len(prologue):].strip()
+
+
+def iter_tsv_results(lines):
+    """Parse SPARQL TSV results incrementally
+
+    Args:
+        lines: Iterable of the lines (str) of the response
+
+    Returns:
+        Generator: The variables (tuple of names) first, then one tuple of rdflib terms (None if unbound) per result
+    """
+    lines = iter(lines)
+
+    header = next(lines, "")
+    yield tuple(variable.lstrip("?$") for variable in header.split("\t")) if header else tuple()
+
+    for line in lines:
+        if not line:
+            continue
+        yield tuple(from_n3(value) if value else None for value in line.split("\t"))
+
+
+def iter_json_results(chunks):
+    """Parse SPARQL JSON results incrementally
+
+    The bindings are decoded one by one while the response is read. If the endpoint writes "head" after
+    "results", the bindings have to be kept until the variables are known.
+
+    Args:
+        chunks: Iterable of the parts (str) of the response
+
+    Returns:
+        Generator: The variables (tuple of names) first, then one tuple of rdflib terms (None if unbound) per result
+    """
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    text = ""
+
+    def more() -> bool:
+        nonlocal text
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        text += chunk
+        return True
+
+    # read up to the start of the array of the bindings
+    while True:
+        bindings_key = text.find('"bindings"')
+        if bindings_key >= 0 and text.find("[", bindings_key) >= 0:
+            break
+        if not more():
+            raise ValueError("Invalid SPARQL JSON results: no bindings.")
+
+    variables = None
+    vars_key = text.find('"vars"', 0, bindings_key)
+    if vars_key >= 0:
+        variables = tuple(decoder.raw_decode(text, text.index("[", vars_key))[0])
+        yield variables
+
+    position = text.find("[", bindings_key) + 1
+    buffered = []
+
+    while True:
+        # skip whitespace and commas between the bindings
+        while position < len(text) and text[position] in " \t\r\n,":
+            position += 1
+
+        if position >= len(text):
+            text = ""
+            position = 0
+            if not more():
+                raise ValueError("Invalid SPARQL JSON results: incomplete bindings.")
+            continue
+
+        if text[position] == "]":
+            break
+
+        try:
+            binding, position = decoder.raw_decode(text, position)
+        except json.JSONDecodeError:
+            # incomplete binding, read on
+            text = text[position:]
+            position = 0
+            if not more():
+                raise
+            continue
+
+        if variables is None:
+            buffered.append(binding)
+        else:
+            yield tuple(binding_to_term(binding[variable]) if variable in binding else None
+                        for variable in variables)
+
+    if variables is None:
+        # "head" follows the results
+        text = text[position:]
+        while more():
+            pass
+        vars_key = text.find('"vars"')
+        variables = tuple(decoder.raw_decode(text, text.index("[", vars_key))[0]) if vars_key >= 0 else tuple()
+        yield variables
+
+        for binding in buffered:
+            yield tuple(binding_to_term(binding[variable]) if variable in binding else None
+                        for variable in variables)
+
+
+class ResultCache:
+    """Result Cache
+
+    LRU cache of query results with a time to live. Keys are the dataset, the media type of the result and the
+    normalized query. A cache can be shared by several DB connections; DB.update and DB.upload invalidate the
+    entries of their dataset.
+
+    Attributes:
+        maxsize (int): Maximum number of results
+        ttl (float): Time to live of a result in seconds. None: results do not expire.
+        hits (int): Number of results returned from the cache
+        misses (int): Number of results that were not in the cache (or expired)
+    """
+
+    maxsize = 256
+
+    ttl = 300.0
+
+    hits = 0
+
+    misses = 0
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        """Initialize
+
+        Args:
+            maxsize (int, optional): Maximum number of results. Defaults to 256.
+            ttl (float, optional): Time to live of a result in seconds. Defaults to 300. None: no expiry.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        # key -> (expiry time, result)
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def key(dataset: str, accept: str, query: str) -> tuple:
+        """Key of a query
+
+        Args:
+            dataset (str): URL of the dataset
+            accept (str): Media type of the result
+            query (str): SPARQL query
+
+        Returns:
+            tuple: Key
+        """
+        return dataset, accept, normalize_query(query)
+
+    def get(self, key: tuple):
+        """Get a result
+
+        Args:
+            key (tuple): Key, see key()
+
+        Returns:
+            Result or None if there is no result or it is expired
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None or (entry[0] is not None and entry[0] < time.monotonic()):
+                if entry is not None:
+                    del self.__entries[key]
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, result) -> None:
+        """Add a result, the least recently used result is removed if the cache is full
+
+        Args:
+            key (tuple): Key, see key()
+            result: Result
+        """
+        if self.maxsize <= 0:
+            return
+
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self.__lock:
+            self.__entries[key] = (expires, result)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, dataset: str = None) -> int:
+        """Remove the results of a dataset
+
+        Args:
+            dataset (str, optional): URL of the dataset. Defaults to all datasets.
+
+        Returns:
+            int: Number of removed results
+        """
+        with self.__lock:
+            if dataset is None:
+                count = len(self.__entries)
+                self.__entries.clear()
+                return count
+
+            keys = [key for key in self.__entries if key[0] == dataset]
+            for key in keys:
+                del self.__entries[key]
+            return len(keys)
+
+    def info(self) -> dict:
+        """Statistics of the cache
+
+        Returns:
+            dict: "hits", "misses", "size", "maxsize" and "ttl"
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.__entries), "maxsize": self.maxsize,
+                "ttl": self.ttl}
 
 
 class DB:
-    """Stub of DB class
+    """Triple Store Connection
+
+    SPARQL 1.1 client with a persistent pool of keep-alive connections, all requests reuse the open connections.
+
+    Attributes:
+        url (str): Base URL of the dataset, e.g. http://localhost:9030/genre
+        query_endpoint (str): URL of the SPARQL query endpoint
+        update_endpoint (str): URL of the SPARQL update endpoint
+        graph_store_endpoint (str): URL of the Graph Store HTTP Protocol endpoint
+        timeout (tuple): Connect and read timeout in seconds
+        cache (ResultCache): Cache of the query results. None if results are not cached.
+    """
+
+    # Base URL of the dataset
+    url = None
+
+    # Endpoints
+    query_endpoint = None
+    update_endpoint = None
+    graph_store_endpoint = None
+
+    # (connect, read) timeout in seconds
+    timeout = (5, 60)
+
+    # Query results
+    cache = None
+
+    def __init__(self,
+                 url: str = "http://localhost:9030/genre",
+                 query_endpoint: str = None,
+                 update_endpoint: str = None,
+                 graph_store_endpoint: str = None,
+                 username: str = None,
+                 password: str = None,
+                 timeout=None,
+                 pool_size: int = 10,
+                 cache=False):
+        """Initialize
+
+        Args:
+            url (str, optional): Base URL of the dataset. Defaults to the Fuseki of the development setup.
+            query_endpoint (str, optional): URL of the query endpoint. Defaults to url + "/sparql"
+            update_endpoint (str, optional): URL of the update endpoint. Defaults to url + "/update"
+            graph_store_endpoint (str, optional): URL of the Graph Store Protocol endpoint. Defaults to url + "/data"
+            username (str, optional): User for HTTP Basic authentication, e.g. "admin" to send updates to Fuseki
+            password (str, optional): Password for HTTP Basic authentication
+            timeout (optional): Timeout in seconds, a number or a tuple (connect, read). Defaults to (5, 60)
+            pool_size (int, optional): Maximum number of connections kept open. Defaults to 10.
+            cache (optional): True to cache query results in a new ResultCache, a ResultCache to share it with other
+                connections, or False (default) to send every query. Only cache if the dataset is not changed by
+                other clients, or invalidate() after their changes; cached results are up to ResultCache.ttl old.
+        """
+        # requests is only needed if there is a connection, importing dlod.entity should not load it
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.url = url.rstrip("/")
+        self.query_endpoint = query_endpoint or self.url + "/sparql"
+        self.update_endpoint = update_endpoint or self.url + "/update"
+        self.graph_store_endpoint = graph_store_endpoint or self.url + "/data"
+
+        if timeout is not None:
+            self.timeout = timeout
+
+        # connection pool
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+
+        if username:
+            self.__session.auth = (username, password)
+
+        if cache is True:
+            self.cache = ResultCache()
+        elif cache:
+            assert type(cache) == ResultCache, "Invalid type. Expected ResultCache."
+            self.cache = cache
+
+    def request(self, method: str, url: str, timeout=None, **kwargs):
+        """Send an HTTP request over the connection pool
+
+        Args:
+            method (str): HTTP method, e.g. "GET"
+            url (str): URL
+            timeout (optional): Timeout of this request. Defaults to self.timeout
+            **kwargs: Arguments of requests.Session.request, e.g. params, data, headers
+
+        Returns:
+            requests.Response: Response
+
+        Raises:
+            requests.HTTPError: The endpoint responded with an error status
+        """
+        response = self.__session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def query(self, query: str, accept: str, timeout=None, cache: bool = True) -> bytes:
+        """Send a query to the query endpoint
+
+        Short queries are sent with GET (responses can be cached by a proxy, e.g. Varnish), long queries with POST.
+        The result is returned from the result cache if the connection caches results and it is there.
+
+        Args:
+            query (str): SPARQL query
+            accept (str): Media type of the result, e.g. "application/sparql-results+json"
+            timeout (optional): Timeout of this request. Defaults to self.timeout
+            cache (bool, optional): Use the result cache of the connection (if any). Defaults to True.
+
+        Returns:
+            bytes: Content of the response
+        """
+        key = None
+        if cache and self.cache is not None:
+            key = self.cache.key(self.url, accept, query)
+            content = self.cache.get(key)
+            if content is not None:
+                return content
+
+        response = self.__send_query(query, accept, timeout=timeout)
+
+        if key is not None:
+            self.cache.put(key, response.content)
+
+        return response.content
+
+    def __send_query(self, query: str, accept: str, timeout=None, stream: bool = False):
+        """Helper function to send a query with GET or POST
+
+        Args:
+            query (str): SPARQL query
+            accept (str): Media type of the result
+            timeout (optional): Timeout of this request
+            stream (bool, optional): Do not read the content at once. Defaults to False.
+
+        Returns:
+            requests.Response: Response
+        """
+        headers = {"Accept": accept}
+
+        if len(query) <= MAX_GET_QUERY_LENGTH:
+            return self.request("GET", self.query_endpoint, params={"query": query}, headers=headers,
+                                timeout=timeout, stream=stream)
+
+        return self.request("POST", self.query_endpoint, data={"query": query}, headers=headers,
+                            timeout=timeout, stream=stream)
+
+    def __iter_results(self, query: str, format: str, timeout=None):
+        """Helper function to stream the results of a SELECT query
+
+        Args:
+            query (str): SPARQL SELECT query
+            format (str): "tsv" or "json"
+            timeout (optional): Timeout of this request
+
+        Returns:
+            Generator: The variables first, then the results as tuples
+        """
+        if format == "tsv":
+            accept = "text/tab-separated-values"
+        elif format == "json":
+            accept = "application/sparql-results+json"
+        else:
+            raise ValueError(f"Unknown format '{format}'. Expected 'tsv' or 'json'.")
+
+        with self.__send_query(query, accept, timeout=timeout, stream=True) as response:
+            response.encoding = "utf-8"
+
+            if format == "tsv":
+                yield from iter_tsv_results(response.iter_lines(chunk_size=1 << 16, decode_unicode=True))
+            else:
+                yield from iter_json_results(response.iter_content(chunk_size=1 << 16, decode_unicode=True))
+
+    def iter_select(self,
+                    query: str,
+                    page_size: int = None,
+                    key: str = None,
+                    format: str = "tsv",
+                    header: bool = False,
+                    timeout=None):
+        """Stream the results of a SELECT query
+
+        The response is parsed while it is read, the results are not kept in memory. Results are not cached.
+
+        With page_size the results are fetched in pages, e.g. if the endpoint limits the number of results of a query
+        (page_size must not be larger than the limit). The query is wrapped in a subquery and ordered by all variables.
+        Without key the pages are fetched with LIMIT/OFFSET. With key (name of a variable that is bound in every
+        result, e.g. the subject) the results are ordered by the key first and the next page starts at the last value
+        of the key (keyset pagination), skipping the results with that value that were already returned; the key does
+        not have to be unique, but only the results of one value of the key are skipped with OFFSET.
+
+        Args:
+            query (str): SPARQL SELECT query
+            page_size (int, optional): Number of results per request. Defaults to all results in one request.
+            key (str, optional): Variable for keyset pagination, without "?"
+            format (str, optional): Format of the results: "tsv" (default) or "json"
+            header (bool, optional): Yield the names of the variables (tuple) first. Defaults to False.
+            timeout (optional): Timeout of each request. Defaults to self.timeout
+
+        Returns:
+            Generator: One tuple of rdflib terms per result, in the order of the variables; None if unbound
+
+        Raises:
+            ValueError: The key is unbound in a result
+        """
+        if not page_size:
+            results = self.__iter_results(query, format, timeout=timeout)
+            variables = next(results)
+            if header:
+                yield variables
+            yield from results
+            return
+
+        prologue, body = split_prologue(query)
+        wrapped = prologue + "SELECT * WHERE {{ {{ {body} }} {filter} }} ORDER BY {order} LIMIT {limit} OFFSET {offset}"
+
+        # the variables of the result, to order by all of them
+        variables = next(self.__iter_results(wrapped.format(body=body, filter="", order="?_", limit=0, offset=0),
+                                             format, timeout=timeout))
+        order = " ".join(f"?{variable}" for variable in variables)
+
+        if key:
+            key = key.lstrip("?$")
+            # results with the same value of the key are ordered by the other variables, the order is the same on
+            # every page
+            order = f"STR(?{key}) " + " ".join(f"?{variable}" for variable in variables if variable != key)
+
+        order = order.strip() or "?_"
+
+        offset = 0
+        # value of the key (str) of the last result and number of results with that value that were returned
+        last = None
+        last_count = 0
+        first_page = True
+
+        while True:
+            if key and last is not None:
+                filter = f"FILTER(STR(?{key}) >= {Literal(last).n3()})"
+            else:
+                filter = ""
+
+            results = self.__iter_results(wrapped.format(body=body,
+                                                         filter=filter,
+                                                         order=order,
+                                                         limit=page_size,
+                                                         offset=last_count if key else offset), format,
+                                          timeout=timeout)
+            variables = next(results)
+
+            if first_page and header:
+                yield variables
+            first_page = False
+
+            if key:
+                key_index = variables.index(key)
 
+            count = 0
+            for result in results:
+                count += 1
+                if key:
+                    if result[key_index] is None:
+                        raise ValueError(f"Variable '{key}' is unbound in a result, it can not be the key of the"
+                                         f" pages. Use pages without key.")
+                    value = str(result[key_index])
+                    if value == last:
+                        last_count += 1
+                    else:
+                        last = value
+                        last_count = 1
+                yield result
+
+            if count < page_size:
+                return
+
+            offset += count
+
+    def invalidate(self) -> int:
+        """Remove the cached results of the dataset, e.g. after it was changed by another client
+
+        Returns:
+            int: Number of removed results
+        """
+        if self.cache is None:
+            return 0
+
+        return self.cache.invalidate(self.url)
+
+    def select(self, query: str, timeout=None) -> list:
+        """Send a SELECT query
+
+        Args:
+            query (str): SPARQL SELECT query
+            timeout (optional): Timeout of this request. Defaults to self.timeout
+
+        Returns:
+            list: One dictionary per result, variable -> rdflib term. Unbound variables are missing.
+        """
+        results = json.loads(self.query(query, accept="application/sparql-results+json", timeout=timeout))
+
+        return [{variable: binding_to_term(value) for variable, value in binding.items()}
+                for binding in results["results"]["bindings"]]
+
+    def construct(self, query: str, timeout=None) -> Graph:
+        """Send a CONSTRUCT (or DESCRIBE) query
+
+        Args:
+            query (str): SPARQL CONSTRUCT query
+            timeout (optional): Timeout of this request. Defaults to self.timeout
+
+        Returns:
+            Graph: Resulting triples
+        """
+        content = self.query(query, accept="application/n-triples", timeout=timeout)
+
+        g = Graph()
+        g.parse(data=content.decode("utf-8"), format="nt")
+        return g
+
+    def ask(self, query: str, timeout=None) -> bool:
+        """Send an ASK query
+
+        Args:
+            query (str): SPARQL ASK query
+            timeout (optional): Timeout of this request. Defaults to self.timeout
+
+        Returns:
+            bool: Result
+        """
+        return json.loads(self.query(query, accept="application/sparql-results+json", timeout=timeout))["boolean"]
+
+    def update(self, update: str, timeout=None) -> bool:
+        """Send an update to the update endpoint
+
+        The cached results of the dataset are invalidated.
+
+        Args:
+            update (str): SPARQL Update, e.g. INSERT DATA { ... }
+            timeout (optional): Timeout of this request. Defaults to self.timeout
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            self.request("POST", self.update_endpoint, data={"update": update}, timeout=timeout)
+        finally:
+            # also if the update failed, it might have been applied partially
+            self.invalidate()
+        return True
+
+    def upload(self,
+               sources,
+               named_graph: str = None,
+               chunk_triples: int = 50000,
+               compress: bool = False,
+               workers: int = 4,
+               replace: bool = False,
+               timeout=None) -> dict:
+        """Upload graphs or entities to the triple store with the SPARQL Graph Store HTTP Protocol
+
+        The triples are streamed as N-Triples in chunks of chunk_triples triples, each chunk is sent with a POST
+        request (added to the graph). Up to "workers" chunks are in flight at once and as many are queued, reading the
+        sources waits while 2 * workers chunks are pending. The throughput of each chunk is logged (level INFO). The
+        cached results of the dataset are invalidated.
+
+        Blank nodes are only identified within a chunk; the triples of a blank node split over two chunks are
+        stored with two different blank nodes.
+
+        Args:
+            sources: A source or a list of sources: rdflib.Graph, Entity, Session, TripleBuffer or path of an RDF
+                file (e.g. "out/eschenburg.ttl")
+            named_graph (str, optional): URI of the named graph. Defaults to the default graph.
+            chunk_triples (int, optional): Number of triples per request. Defaults to 50000.
+            compress (bool, optional): Send the chunks gzip-compressed (Content-Encoding: gzip). Defaults to False.
+            workers (int, optional): Number of chunks sent at the same time. Defaults to 4.
+            replace (bool, optional): Delete the graph before the upload. Defaults to False.
+            timeout (optional): Timeout of each request. Defaults to self.timeout
+
+        Returns:
+            dict: Statistics: "triples", "chunks", "seconds", "triples_per_second" and "chunk_stats"
+                (triples, seconds, triples_per_second of each chunk)
+        """
+        # the thread pool is only needed for uploads, importing dlod.entity should not load it
+        from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+        if not isinstance(sources, (list, tuple)):
+            sources = [sources]
+
+        if named_graph:
+            params = {"graph": named_graph}
+        else:
+            params = {"default": ""}
+
+        headers = {"Content-Type": "application/n-triples"}
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+
+        if replace:
+            self.delete_graph(named_graph, timeout=timeout)
+
+        def send(number: int, lines: list) -> dict:
+            body = "".join(lines).encode("utf-8")
+            if compress:
+                body = gzip.compress(body, compresslevel=1)
+
+            start = time.perf_counter()
+            self.request("POST", self.graph_store_endpoint, params=params, data=body, headers=headers,
+                         timeout=timeout)
+            seconds = time.perf_counter() - start
+            self.invalidate()
+
+            stats = {"triples": len(lines), "seconds": seconds, "triples_per_second": len(lines) / seconds}
+            logging.info(f"Uploaded chunk {number}: {len(lines)} triples in {seconds:.2f} s"
+                         f" ({stats['triples_per_second']:.0f} triples/s).")
+            return stats
+
+        chunk_stats = []
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+
+            def submit(lines: list):
+                nonlocal pending
+                # at most 2 * "workers" chunks are pending: "workers" in flight and as many queued, so a thread can
+                # start the next chunk at once. Memory is bounded by 2 * workers * chunk_triples triples.
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    chunk_stats.extend(future.result() for future in done)
+                pending.add(executor.submit(send, len(chunk_stats) + len(pending) + 1, lines))
+
+            lines = []
+            for source in sources:
+                for s, p, o in iter_triples(source):
+                    lines.append(f"{nt_term(s)} {nt_term(p)} {nt_term(o)} .\n")
+
+                    if len(lines) >= chunk_triples:
+                        submit(lines)
+                        lines = []
+
+            if lines:
+                submit(lines)
+
+            chunk_stats.extend(future.result() for future in pending)
+
+        seconds = time.perf_counter() - start
+        triples = sum(stats["triples"] for stats in chunk_stats)
+
+        return {
+            "triples": triples,
+            "chunks": len(chunk_stats),
+            "seconds": seconds,
+            "triples_per_second": triples / seconds if seconds else 0.0,
+            "chunk_stats": chunk_stats
+        }
+
+    def get_graph(self, named_graph: str = None, timeout=None) -> Graph:
+        """Get a graph with the SPARQL Graph Store HTTP Protocol
+
+        Args:
+            named_graph (str, optional): URI of the named graph. Defaults to the default graph.
+            timeout (optional): Timeout of this request. Defaults to self.timeout
+
+        Returns:
+            Graph: Triples of the graph, empty if the graph does not exist
+        """
+        if named_graph:
+            params = {"graph": named_graph}
+        else:
+            params = {"default": ""}
+
+        g = Graph()
+
+        response = self.__session.get(self.graph_store_endpoint, params=params,
+                                      headers={"Accept": "application/n-triples"}, timeout=timeout or self.timeout)
+        if response.status_code == 404:
+            return g
+
+        response.raise_for_status()
+        g.parse(data=response.content.decode("utf-8"), format="nt")
+        return g
+
+    def sync(self,
+             sources,
+             named_graph: str = None,
+             snapshot: str = None,
+             chunk_triples: int = 10000,
+             timeout=None) -> dict:
+        """Update a graph in the triple store to the local triples, only the changes are sent
+
+        The local triples are compared with the triples of the last sync, stored as N-Triples in the file
+        "snapshot" (gzip-compressed if the path ends with ".gz"). Without a snapshot the graph is fetched from the
+        triple store once. Removed triples are sent with DELETE DATA, added triples with INSERT DATA, in requests
+        of at most chunk_triples triples. Afterwards the snapshot is written.
+
+        Blank nodes can not be addressed in DELETE DATA. Triples with blank nodes are compared as a graph
+        (isomorphism); if they changed, all triples with blank nodes are deleted from the graph in the triple store
+        and the local ones are inserted in one request.
+
+        The snapshot must only be changed by sync, if the graph is changed otherwise, sync without the snapshot.
+
+        Args:
+            sources: A source or a list of sources: rdflib.Graph, Entity, Session, TripleBuffer or path of an RDF
+                file (e.g. "out/eschenburg.ttl")
+            named_graph (str, optional): URI of the named graph. Defaults to the default graph.
+            snapshot (str, optional): Path of the snapshot file
+            chunk_triples (int, optional): Maximum number of triples per request. Defaults to 10000.
+            timeout (optional): Timeout of each request. Defaults to self.timeout
+
+        Returns:
+            dict: Statistics: "added", "removed", "blank_node_triples" (number of triples with blank nodes that were
+                replaced) and "requests"
+        """
+        if not isinstance(sources, (list, tuple)):
+            sources = [sources]
+
+        local = set()
+        for source in sources:
+            local.update(iter_triples(source))
+
+        if snapshot and os.path.exists(snapshot):
+            previous = Graph()
+            if snapshot.endswith(".gz"):
+                with gzip.open(snapshot, "rt", encoding="utf-8") as file:
+                    previous.parse(data=file.read(), format="nt")
+            else:
+                previous.parse(snapshot, format="nt")
+        else:
+            previous = self.get_graph(named_graph, timeout=timeout)
+
+        def has_blank_node(triple) -> bool:
+            return isinstance(triple[0], BNode) or isinstance(triple[2], BNode)
+
+        local_blank = {triple for triple in local if has_blank_node(triple)}
+        previous_blank = {triple for triple in previous if has_blank_node(triple)}
+
+        added = local - local_blank - set(previous)
+        removed = set(previous) - previous_blank - local
+
+        blank_changed = len(local_blank) != len(previous_blank)
+        if not blank_changed and local_blank:
+            local_blank_graph = Graph()
+            local_blank_graph.addN((s, p, o, local_blank_graph) for s, p, o in local_blank)
+            previous_blank_graph = Graph()
+            previous_blank_graph.addN((s, p, o, previous_blank_graph) for s, p, o in previous_blank)
+            blank_changed = not isomorphic(local_blank_graph, previous_blank_graph)
+
+        if named_graph:
+            graph_open = f"GRAPH {URIRef(named_graph).n3()} {{ "
+            graph_close = " }"
+        else:
+            graph_open = graph_close = ""
+
+        def data(operation: str, triples) -> str:
+            lines = " ".join(f"{nt_term(s)} {nt_term(p)} {nt_term(o)} ." for s, p, o in triples)
+            return f"{operation} {{ {graph_open}{lines}{graph_close} }}"
+
+        # operations with the number of triples
+        operations = []
+
+        removed = list(removed)
+        for start in range(0, len(removed), chunk_triples):
+            operations.append((data("DELETE DATA", removed[start:start + chunk_triples]),
+                               len(removed[start:start + chunk_triples])))
+
+        if blank_changed and previous_blank:
+            pattern = "?s ?p ?o"
+            operations.append((f"DELETE {{ {graph_open}{pattern}{graph_close} }} WHERE {{ {graph_open}{pattern}"
+                               f" FILTER(isBlank(?s) || isBlank(?o)){graph_close} }}", 1))
+
+        added = list(added)
+        for start in range(0, len(added), chunk_triples):
+            operations.append((data("INSERT DATA", added[start:start + chunk_triples]),
+                               len(added[start:start + chunk_triples])))
+
+        if blank_changed and local_blank:
+            # blank nodes are scoped to the request, all triples of the blank nodes are inserted at once
+            operations.append((data("INSERT DATA", local_blank), len(local_blank)))
+
+        # DELETE DATA and INSERT DATA are combined into one request as long as the requests are small
+        requests = 0
+        batch = []
+        size = 0
+        for operation, count in operations:
+            if batch and size + count > chunk_triples:
+                self.update(" ;\n".join(batch), timeout=timeout)
+                requests += 1
+                batch = []
+                size = 0
+            batch.append(operation)
+            size += count
+
+        if batch:
+            self.update(" ;\n".join(batch), timeout=timeout)
+            requests += 1
+
+        if snapshot:
+            # written to a temporary file first, the snapshot is not corrupted if writing fails
+            with NTriplesWriter(snapshot + ".tmp", compress=snapshot.endswith(".gz")) as writer:
+                writer.write(local)
+            os.replace(snapshot + ".tmp", snapshot)
+
+        return {
+            "added": len(added),
+            "removed": len(removed),
+            "blank_node_triples": len(local_blank) if blank_changed else 0,
+            "requests": requests
+        }
+
+    def delete_graph(self, named_graph: str = None, timeout=None) -> bool:
+        """Delete a graph with the SPARQL Graph Store HTTP Protocol
+
+        Args:
+            named_graph (str, optional): URI of the named graph. Defaults to the default graph.
+            timeout (optional): Timeout of this request. Defaults to self.timeout
+
+        Returns:
+            bool: True if deleted, False if the graph does not exist
+        """
+        if named_graph:
+            params = {"graph": named_graph}
+        else:
+            params = {"default": ""}
+
+        response = self.__session.delete(self.graph_store_endpoint, params=params, timeout=timeout or self.timeout)
+        self.invalidate()
+
+        if response.status_code == 404:
+            return False
+
+        response.raise_for_status()
+        return True
+
+    def close(self) -> None:
+        """Close all connections of the pool"""
+        self.__session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncDB:
+    """Asynchronous Triple Store Connection
+
+    asyncio variant of DB on a shared httpx.AsyncClient (pool of keep-alive connections). At most "concurrency"
+    requests are in flight at the same time, further requests wait for a free slot. The *_many methods send
+    batches of queries concurrently, e.g. one query per scheme or per chunk of concepts.
+
+    Use it as async context manager or call aclose():
+
+        async with AsyncDB() as db:
+            results = await db.select_many(queries)
+
+    Attributes:
+        url (str): Base URL of the dataset, e.g. http://localhost:9030/genre
+        query_endpoint (str): URL of the SPARQL query endpoint
+        update_endpoint (str): URL of the SPARQL update endpoint
+        timeout (tuple): Connect and read timeout in seconds
+        concurrency (int): Maximum number of requests in flight
+        cache (ResultCache): Cache of the query results. None if results are not cached.
     """
-    def __init__(self):
-        pass
 
+    # Base URL of the dataset
+    url = None
+
+    # Endpoints
+    query_endpoint = None
+    update_endpoint = None
+
+    # (connect, read) timeout in seconds
+    timeout = (5, 60)
+
+    # Requests in flight
+    concurrency = 8
+
+    # Query results
+    cache = None
+
+    def __init__(self,
+                 url: str = "http://localhost:9030/genre",
+                 query_endpoint: str = None,
+                 update_endpoint: str = None,
+                 username: str = None,
+                 password: str = None,
+                 timeout=None,
+                 concurrency: int = 8,
+                 cache=False):
+        """Initialize
+
+        Args:
+            url (str, optional): Base URL of the dataset. Defaults to the Fuseki of the development setup.
+            query_endpoint (str, optional): URL of the query endpoint. Defaults to url + "/sparql"
+            update_endpoint (str, optional): URL of the update endpoint. Defaults to url + "/update"
+            username (str, optional): User for HTTP Basic authentication
+            password (str, optional): Password for HTTP Basic authentication
+            timeout (optional): Timeout in seconds, a number or a tuple (connect, read). Defaults to (5, 60)
+            concurrency (int, optional): Maximum number of requests in flight. Defaults to 8.
+            cache (optional): True to cache query results in a new ResultCache, a ResultCache to share it (e.g. with
+                a DB of the same dataset), or False (default) to send every query
+        """
+        # asyncio and httpx are only needed for asynchronous connections, importing dlod.entity should not load them
+        import asyncio
+        import httpx
+
+        self.url = url.rstrip("/")
+        self.query_endpoint = query_endpoint or self.url + "/sparql"
+        self.update_endpoint = update_endpoint or self.url + "/update"
+
+        if timeout is not None:
+            self.timeout = timeout
+
+        if isinstance(self.timeout, tuple):
+            client_timeout = httpx.Timeout(self.timeout[1], connect=self.timeout[0])
+        else:
+            client_timeout = httpx.Timeout(self.timeout)
+
+        self.concurrency = concurrency
+
+        # connection pool, as many connections as requests in flight
+        self.__client = httpx.AsyncClient(
+            auth=(username, password) if username else None,
+            timeout=client_timeout,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency))
+
+        self.__semaphore = asyncio.Semaphore(concurrency)
+
+        if cache is True:
+            self.cache = ResultCache()
+        elif cache:
+            assert type(cache) == ResultCache, "Invalid type. Expected ResultCache."
+            self.cache = cache
+
+    async def request(self, method: str, url: str, **kwargs):
+        """Send an HTTP request, waits if "concurrency" requests are in flight
+
+        Args:
+            method (str): HTTP method, e.g. "GET"
+            url (str): URL
+            **kwargs: Arguments of httpx.AsyncClient.request, e.g. params, data, headers
+
+        Returns:
+            httpx.Response: Response
+
+        Raises:
+            httpx.HTTPStatusError: The endpoint responded with an error status
+        """
+        async with self.__semaphore:
+            response = await self.__client.request(method, url, **kwargs)
+
+        response.raise_for_status()
+        return response
+
+    async def query(self, query: str, accept: str, cache: bool = True) -> bytes:
+        """Send a query to the query endpoint, see DB.query
+
+        Args:
+            query (str): SPARQL query
+            accept (str): Media type of the result, e.g. "application/sparql-results+json"
+            cache (bool, optional): Use the result cache of the connection (if any). Defaults to True.
+
+        Returns:
+            bytes: Content of the response
+        """
+        key = None
+        if cache and self.cache is not None:
+            key = self.cache.key(self.url, accept, query)
+            content = self.cache.get(key)
+            if content is not None:
+                return content
+
+        headers = {"Accept": accept}
+
+        if len(query) <= MAX_GET_QUERY_LENGTH:
+            response = await self.request("GET", self.query_endpoint, params={"query": query}, headers=headers)
+        else:
+            response = await self.request("POST", self.query_endpoint, data={"query": query}, headers=headers)
+
+        if key is not None:
+            self.cache.put(key, response.content)
+
+        return response.content
+
+    async def select(self, query: str) -> list:
+        """Send a SELECT query
+
+        Args:
+            query (str): SPARQL SELECT query
+
+        Returns:
+            list: One dictionary per result, variable -> rdflib term. Unbound variables are missing.
+        """
+        results = json.loads(await self.query(query, accept="application/sparql-results+json"))
+
+        return [{variable: binding_to_term(value) for variable, value in binding.items()}
+                for binding in results["results"]["bindings"]]
+
+    async def construct(self, query: str) -> Graph:
+        """Send a CONSTRUCT (or DESCRIBE) query
+
+        Args:
+            query (str): SPARQL CONSTRUCT query
+
+        Returns:
+            Graph: Resulting triples
+        """
+        content = await self.query(query, accept="application/n-triples")
+
+        g = Graph()
+        g.parse(data=content.decode("utf-8"), format="nt")
+        return g
+
+    async def ask(self, query: str) -> bool:
+        """Send an ASK query
+
+        Args:
+            query (str): SPARQL ASK query
+
+        Returns:
+            bool: Result
+        """
+        return json.loads(await self.query(query, accept="application/sparql-results+json"))["boolean"]
+
+    async def update(self, update: str) -> bool:
+        """Send an update to the update endpoint, the cached results of the dataset are invalidated
+
+        Args:
+            update (str): SPARQL Update, e.g. INSERT DATA { ... }
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            await self.request("POST", self.update_endpoint, data={"update": update})
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(self.url)
+        return True
+
+    async def gather(self, method, queries: list) -> list:
+        """Send queries concurrently
+
+        Args:
+            method: Coroutine function that is called with each query, e.g. self.select
+            queries (list): Queries
+
+        Returns:
+            list: Results in the order of the queries
+        """
+        import asyncio
+
+        return list(await asyncio.gather(*(method(query) for query in queries)))
+
+    async def select_many(self, queries: list) -> list:
+        """Send SELECT queries concurrently
+
+        Args:
+            queries (list): SPARQL SELECT queries
+
+        Returns:
+            list: Results of each query (see select) in the order of the queries
+        """
+        return await self.gather(self.select, queries)
+
+    async def construct_many(self, queries: list) -> list:
+        """Send CONSTRUCT queries concurrently
+
+        Args:
+            queries (list): SPARQL CONSTRUCT queries
+
+        Returns:
+            list: Graph of each query in the order of the queries
+        """
+        return await self.gather(self.construct, queries)
+
+    async def ask_many(self, queries: list) -> list:
+        """Send ASK queries concurrently
+
+        Args:
+            queries (list): SPARQL ASK queries
+
+        Returns:
+            list: Result of each query in the order of the queries
+        """
+        return await self.gather(self.ask, queries)
+
+    async def aclose(self) -> None:
+        """Close all connections of the pool"""
+        await self.__client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
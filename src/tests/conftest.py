@@ -0,0 +1,27 @@
+"""Test configuration: the package is imported from the source tree (src)"""
+import os
+import sys
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+
+@pytest.fixture(scope="session")
+def standin():
+    """Local SPARQL endpoint (tests/standin.py), started once for all tests"""
+    from tests.standin import SparqlStandIn
+
+    standin = SparqlStandIn()
+    standin.url = standin.start()
+    yield standin
+    standin.stop()
+
+
+@pytest.fixture
+def endpoint(standin):
+    """Base URL of the empty dataset of the local SPARQL endpoint"""
+    standin.reset()
+    return standin.url
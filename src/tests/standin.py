@@ -0,0 +1,201 @@
+"""Local SPARQL endpoint for the tests
+
+Stand-in for the Fuseki of the development setup: SPARQL 1.1 Query, Update and Graph Store HTTP Protocol on an
+in-memory rdflib Dataset, served over HTTP/1.1 with keep-alive on 127.0.0.1. Counts the requests and the client
+connections, e.g. to check that a client reuses its connections.
+
+    standin = SparqlStandIn()
+    url = standin.start()  # e.g. http://127.0.0.1:45678/ds
+    ...
+    standin.stop()
+"""
+import gzip
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from rdflib import Dataset, URIRef
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.plugins import sparql
+from rdflib.plugins.sparql import evaluate
+
+# the default graph of queries and updates is the default graph of the dataset, like the Graph Store Protocol's
+# ?default (otherwise rdflib queries the union of the graphs and adds the triples of updates to a new graph)
+sparql.SPARQL_DEFAULT_GRAPH_UNION = False
+
+# rdflib can not sort by an expression that is an error for some results, e.g. ORDER BY STR(?x) with ?x unbound.
+# Like Fuseki, errors are sorted first.
+sort_key = evaluate._val
+evaluate._val = lambda value: sort_key(value) or (-1, "")
+
+
+def tsv_term(term) -> str:
+    """Term of the SPARQL TSV results format, tabs and line breaks are escaped
+
+    Args:
+        term: rdflib term or None if unbound
+
+    Returns:
+        str: Term in N3 syntax, empty if unbound
+    """
+    if term is None:
+        return ""
+    return term.n3().replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Requests to /<dataset>/sparql, /<dataset>/update and /<dataset>/data"""
+
+    # keep-alive connections
+    protocol_version = "HTTP/1.1"
+
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def standin(self):
+        return self.server.standin
+
+    def read_body(self) -> bytes:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    def respond(self, status: int, body: bytes = b"", content_type: str = "text/plain") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def route(self) -> tuple:
+        """Path and parameters of the request, the request is counted"""
+        self.standin.count(self.client_address)
+        url = urllib.parse.urlparse(self.path)
+        return url.path, urllib.parse.parse_qs(url.query, keep_blank_values=True)
+
+    def graph(self, params: dict):
+        """Graph of the Graph Store Protocol parameters, ?graph=<uri> or ?default"""
+        if "graph" in params:
+            return self.standin.dataset.graph(URIRef(params["graph"][0]))
+        return self.standin.dataset.graph(DATASET_DEFAULT_GRAPH_ID)
+
+    def query(self, query: str) -> None:
+        try:
+            with self.standin.lock:
+                result = self.standin.dataset.query(query)
+                rows = list(result) if result.type == "SELECT" else None
+        except Exception as error:
+            return self.respond(400, str(error).encode("utf-8"))
+
+        if result.type == "SELECT" and "tab-separated-values" in self.headers.get("Accept", ""):
+            lines = ["\t".join(f"?{variable}" for variable in result.vars)]
+            lines.extend("\t".join(tsv_term(term) for term in row) for row in rows)
+            return self.respond(200, ("\n".join(lines) + "\n").encode("utf-8"), "text/tab-separated-values")
+
+        if result.type in ("SELECT", "ASK"):
+            return self.respond(200, result.serialize(format="json"), "application/sparql-results+json")
+
+        return self.respond(200, result.graph.serialize(format="nt").encode("utf-8"), "application/n-triples")
+
+    def do_GET(self):
+        path, params = self.route()
+
+        if path.endswith("/sparql"):
+            return self.query(params["query"][0])
+
+        if path.endswith("/data"):
+            with self.standin.lock:
+                graph = self.graph(params)
+                if "graph" in params and len(graph) == 0:
+                    return self.respond(404)
+                body = graph.serialize(format="nt").encode("utf-8")
+            return self.respond(200, body, "application/n-triples")
+
+        self.respond(404)
+
+    def do_POST(self):
+        path, params = self.route()
+        body = self.read_body()
+
+        if path.endswith("/sparql"):
+            return self.query(urllib.parse.parse_qs(body.decode("utf-8"))["query"][0])
+
+        if path.endswith("/update"):
+            try:
+                with self.standin.lock:
+                    self.standin.dataset.update(urllib.parse.parse_qs(body.decode("utf-8"))["update"][0])
+            except Exception as error:
+                return self.respond(400, str(error).encode("utf-8"))
+            return self.respond(204)
+
+        if path.endswith("/data"):
+            with self.standin.lock:
+                self.graph(params).parse(data=body.decode("utf-8"), format="nt")
+            return self.respond(204)
+
+        self.respond(404)
+
+    def do_DELETE(self):
+        path, params = self.route()
+
+        with self.standin.lock:
+            graph = self.graph(params)
+            if len(graph) == 0:
+                return self.respond(404)
+            graph.remove((None, None, None))
+
+        self.respond(204)
+
+
+class SparqlStandIn:
+    """SPARQL endpoint on an in-memory dataset
+
+    Attributes:
+        dataset (Dataset): Triples of the endpoint
+        requests (int): Number of requests
+        connections (set): Addresses (host, port) of the client connections
+    """
+
+    # Triples of the endpoint
+    dataset = None
+
+    # Statistics
+    requests = 0
+    connections = None
+
+    def __init__(self):
+        self.dataset = Dataset()
+        self.lock = threading.Lock()
+        self.connections = set()
+        self.__server = None
+
+    def count(self, address: tuple) -> None:
+        with self.lock:
+            self.requests += 1
+            self.connections.add(address)
+
+    def reset(self) -> None:
+        """Remove all triples and reset the statistics"""
+        with self.lock:
+            self.dataset = Dataset()
+            self.requests = 0
+            self.connections = set()
+
+    def start(self) -> str:
+        """Serve on a free port of 127.0.0.1
+
+        Returns:
+            str: Base URL of the dataset
+        """
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__server.daemon_threads = True
+        self.__server.standin = self
+        threading.Thread(target=self.__server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.__server.server_address[1]}/ds"
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
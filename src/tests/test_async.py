@@ -0,0 +1,69 @@
+"""Tests of the asynchronous SPARQL client (dlod.sparql.AsyncDB) against the local stand-in endpoint
+(tests/standin.py)"""
+import asyncio
+from rdflib import Literal, URIRef
+from dlod.sparql import AsyncDB, ResultCache
+
+EX = "https://genre.clscor.io/test/"
+
+DATA = f"""INSERT DATA {{
+    <{EX}a> <{EX}label> "A"@de .
+    <{EX}b> <{EX}label> "B"@de .
+    <{EX}c> <{EX}label> "C" .
+}}"""
+
+
+def test_select_construct_ask(endpoint):
+    async def run():
+        async with AsyncDB(endpoint) as db:
+            assert await db.update(DATA) is True
+
+            results = await db.select(f"SELECT ?s ?label WHERE {{ ?s <{EX}label> ?label }} ORDER BY ?s")
+            assert [result["s"] for result in results] == [URIRef(EX + "a"), URIRef(EX + "b"), URIRef(EX + "c")]
+            assert results[0]["label"] == Literal("A", lang="de")
+
+            g = await db.construct(f"CONSTRUCT {{ ?s <{EX}label> ?label }} WHERE {{ ?s <{EX}label> ?label }}")
+            assert (URIRef(EX + "c"), URIRef(EX + "label"), Literal("C")) in g
+
+            assert await db.ask(f"ASK {{ <{EX}a> ?p ?o }}") is True
+
+    asyncio.run(run())
+
+
+def test_many_queries_share_the_connections(standin, endpoint):
+    letters = ["a", "b", "c", "d"] * 10
+
+    async def run():
+        async with AsyncDB(endpoint, concurrency=2) as db:
+            await db.update(DATA)
+            asks = await db.ask_many([f"ASK {{ <{EX}{letter}> ?p ?o }}" for letter in letters])
+            selects = await db.select_many([f"SELECT ?label WHERE {{ <{EX}{letter}> <{EX}label> ?label }}"
+                                            for letter in letters])
+            graphs = await db.construct_many([f"CONSTRUCT {{ <{EX}{letter}> ?p ?o }} WHERE {{ <{EX}{letter}> ?p ?o }}"
+                                              for letter in letters])
+        return asks, selects, graphs
+
+    asks, selects, graphs = asyncio.run(run())
+
+    # results in the order of the queries
+    assert asks == [letter != "d" for letter in letters]
+    assert [len(results) for results in selects] == [0 if letter == "d" else 1 for letter in letters]
+    assert [len(g) for g in graphs] == [0 if letter == "d" else 1 for letter in letters]
+
+    assert standin.requests == 1 + 3 * len(letters)
+    assert len(standin.connections) <= 2
+
+
+def test_update_invalidates_shared_cache(endpoint):
+    cache = ResultCache()
+    query = f"SELECT ?s WHERE {{ ?s <{EX}label> ?label }}"
+
+    async def run():
+        async with AsyncDB(endpoint, cache=cache) as db:
+            assert await db.select(query) == []
+            assert await db.select(query) == []
+            await db.update(DATA)
+            return await db.select(query)
+
+    assert len(asyncio.run(run())) == 3
+    assert cache.hits == 1
@@ -0,0 +1,149 @@
+"""Tests of dlod.buffer: term tables, the cached graph and copying triples between buffers"""
+import threading
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+from dlod.buffer import TermTable, TripleBuffer
+from dlod.session import Session
+from dlod.skos import SkosConcept, SkosConceptScheme
+
+EX = "https://genre.clscor.io/test/"
+
+LABEL = URIRef(EX + "label")
+NOTE = URIRef(EX + "note")
+TEXT = URIRef(EX + "text")
+
+# Graph of the concept of test_entity_graph_as_in_the_baseline, as the baseline built it (rdflib.Graph per entity)
+BASELINE_CONCEPT = f"""
+<{EX}oper> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2004/02/skos/core#Concept> .
+<{EX}oper> <http://www.w3.org/2000/01/rdf-schema#label> "Oper" .
+<{EX}oper> <http://www.w3.org/2004/02/skos/core#inScheme> <{EX}scheme> .
+<{EX}oper> <http://www.w3.org/2004/02/skos/core#prefLabel> "Oper"@de .
+<{EX}scheme> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2004/02/skos/core#ConceptScheme> .
+<{EX}scheme> <http://www.w3.org/2000/01/rdf-schema#label> "Gattungen" .
+"""
+
+
+def with_note(subject: str, text: str) -> list:
+    """Triples of a subject with a label and a note (blank node)"""
+    note = BNode()
+    return [(URIRef(EX + subject), LABEL, Literal(subject)),
+            (URIRef(EX + subject), NOTE, note),
+            (note, TEXT, Literal(text))]
+
+
+def test_graph_is_cached_until_the_buffer_changes():
+    buffer = TripleBuffer()
+    buffer.extend(with_note("a", "Anmerkung"))
+
+    g = buffer.graph()
+    assert buffer.graph() is g
+    assert len(g) == 3
+
+    triple = (URIRef(EX + "b"), LABEL, Literal("b"))
+    buffer.add(triple)
+    assert buffer.graph() is not g
+    assert triple in buffer.graph()
+    assert triple not in g
+
+    # duplicates are removed when the graph is built
+    buffer.add(triple)
+    assert len(buffer.graph()) == 4
+
+    buffer.clear()
+    assert len(buffer.graph()) == 0
+
+
+def test_buffers_have_disjoint_term_tables():
+    a = TripleBuffer()
+    b = TripleBuffer()
+    assert a.terms is not b.terms
+
+    a.extend(with_note("a", "Anmerkung"))
+    assert len(b.terms) == 0
+
+    # the IDs are translated to the table of b
+    z = (URIRef(EX + "z"), LABEL, Literal("z"))
+    b.add(z)
+    b.update(a)
+
+    expected = Graph()
+    expected.add(z)
+    for triple in a:
+        expected.add(triple)
+
+    assert isomorphic(b.graph(), expected)
+    assert set(b.terms.terms) >= set(a.terms.terms)
+
+    # a shared table: the IDs are copied
+    table = TermTable()
+    c = TripleBuffer(table)
+    d = TripleBuffer(table)
+    c.extend(with_note("c", "Anmerkung"))
+    size = len(table)
+    d.update(c)
+    assert len(table) == size
+    assert set(d) == set(c)
+
+
+def test_intern_from_threads():
+    table = TermTable()
+    terms = [URIRef(f"{EX}{i}") for i in range(1000)]
+    ids = [None] * 8
+
+    def intern(index: int) -> None:
+        ids[index] = [table.intern(term) for term in terms]
+
+    threads = [threading.Thread(target=intern, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # every term has one ID
+    assert len(table) == 1000
+    assert all(thread_ids == ids[0] for thread_ids in ids)
+    assert [table.terms[term_id] for term_id in ids[0]] == terms
+
+
+def test_subject_triples_with_blank_nodes():
+    shared = TripleBuffer()
+    shared.extend(with_note("a", "Anmerkung A"))
+    shared.extend(with_note("b", "Anmerkung B"))
+
+    copy = TripleBuffer()
+    copy.update(shared, subjects=[URIRef(EX + "a")])
+
+    expected = Graph()
+    for triple in with_note("a", "Anmerkung A"):
+        expected.add(triple)
+
+    assert isomorphic(copy.graph(), expected)
+    assert set(shared.subject_triples([URIRef(EX + "a")])) == set(copy)
+    assert shared.subject_triples([URIRef(EX + "missing")]) == []
+
+
+def test_linked_entity_is_copied_out_of_a_shared_buffer():
+    session = Session()
+    scheme = SkosConceptScheme(uri=EX + "scheme", session=session)
+    for i in range(5):
+        SkosConcept(uri=f"{EX}other/{i}", session=session).skos_in_scheme(scheme)
+
+    concept = SkosConcept(uri=EX + "oper")
+    concept.skos_in_scheme(scheme)
+
+    # the statements about the scheme, not the other concepts of the session
+    subjects = {s for s, p, o in concept.buffer}
+    assert subjects == {URIRef(EX + "oper"), URIRef(EX + "scheme")}
+
+
+def test_entity_graph_as_in_the_baseline():
+    scheme = SkosConceptScheme(uri=EX + "scheme", labels=[{"lang": "de", "label": "Gattungen"}])
+    concept = SkosConcept(uri=EX + "oper", labels=[{"lang": "de", "label": "Oper"}])
+    concept.skos_pref_label("Oper", lang="de")
+    concept.skos_in_scheme(scheme)
+
+    expected = Graph()
+    expected.parse(data=BASELINE_CONCEPT, format="nt")
+
+    assert isomorphic(concept.graph, expected)
+    assert isomorphic(concept.buffer.graph(), expected)
@@ -0,0 +1,173 @@
+"""Tests of Entity.insert_edges and the generated bulk_* class methods under each validation policy"""
+import logging
+import pytest
+from rdflib import RDF, Graph, URIRef
+from rdflib.compare import isomorphic
+from dlod.buffer import TripleBuffer
+from dlod.entity import Entity
+from dlod.session import Session, STRICT, BATCH, TRUSTED
+from dlod.skos import SKOS, SkosConcept, SkosConceptScheme
+
+EX = "https://genre.clscor.io/test/"
+
+POLICIES = [STRICT, BATCH, TRUSTED]
+
+
+def concepts(session: Session = None, n: int = 3) -> list:
+    return [SkosConcept(uri=f"{EX}concept/{i}", session=session) for i in range(n)]
+
+
+def in_scheme_graph(domains: list, scheme: str = EX + "scheme") -> Graph:
+    """Expected links skos:inScheme of the domains"""
+    g = Graph()
+    for domain in domains:
+        g.add((URIRef(domain), SKOS.inScheme, URIRef(scheme)))
+    return g
+
+
+@pytest.mark.parametrize("validation", POLICIES)
+def test_bulk_pairs_and_parallel_sequences(validation):
+    domains = [f"{EX}concept/{i}" for i in range(3)]
+    ranges = [EX + "scheme"] * 3
+
+    by_pairs = SkosConcept(uri=EX + "target", validation=validation)
+    assert SkosConcept.bulk_skos_in_scheme(by_pairs, pairs=list(zip(domains, ranges))) is True
+
+    by_sequences = SkosConcept(uri=EX + "target", validation=validation)
+    assert SkosConcept.bulk_skos_in_scheme(by_sequences, domains=domains, ranges=ranges) is True
+
+    expected = SkosConcept(uri=EX + "target").graph + in_scheme_graph(domains)
+    assert isomorphic(by_pairs.graph, expected)
+    assert isomorphic(by_sequences.graph, expected)
+
+
+def test_bulk_without_data(caplog):
+    target = SkosConcept(uri=EX + "target")
+    size = len(target.graph)
+
+    with caplog.at_level(logging.WARNING):
+        assert SkosConcept.bulk_skos_in_scheme(target) is False
+        assert SkosConcept.bulk_skos_in_scheme(target, domains=[EX + "concept/0"]) is False
+
+    assert "No data provided" in caplog.text
+    assert len(target.graph) == size
+
+
+def test_bulk_sequences_of_different_length():
+    target = SkosConcept(uri=EX + "target")
+
+    with pytest.raises(AssertionError):
+        SkosConcept.bulk_skos_in_scheme(target, domains=[EX + "concept/0", EX + "concept/1"], ranges=[EX + "scheme"])
+
+
+@pytest.mark.parametrize("validation", POLICIES)
+def test_bulk_with_a_session_as_target(validation):
+    session = Session(validation=validation)
+    scheme = SkosConceptScheme(uri=EX + "scheme", session=session)
+    domains = concepts(session)
+    size = len(session.buffer.graph())
+
+    assert SkosConcept.bulk_skos_in_scheme(session, pairs=[(concept, scheme) for concept in domains]) is True
+
+    g = session.graph
+    assert len(g) == size + 3
+    assert all((URIRef(concept.uri), SKOS.inScheme, URIRef(scheme.uri)) in g for concept in domains)
+
+
+@pytest.mark.parametrize("validation", [STRICT, BATCH])
+@pytest.mark.parametrize("role", ["domain", "range"])
+def test_bulk_violation_inserts_nothing(caplog, validation, role):
+    session = Session(validation=validation)
+    scheme = SkosConceptScheme(uri=EX + "scheme", session=session)
+    pairs = [(concept, scheme) for concept in concepts(session)]
+
+    # the last pair violates the constraint, the valid pairs before it are not inserted either
+    other_scheme = SkosConceptScheme(uri=EX + "other", session=session)
+    other_concept = SkosConcept(uri=EX + "other/concept", session=session)
+    pairs.append((other_scheme, scheme) if role == "domain" else (other_concept, other_concept))
+
+    before = set(session.buffer)
+
+    with caplog.at_level(logging.WARNING):
+        assert SkosConcept.bulk_skos_in_scheme(session, pairs=pairs) is False
+
+    assert f"is not allowed as {role} of '{SKOS.inScheme}'" in caplog.text
+    assert set(session.buffer) == before
+
+
+@pytest.mark.parametrize("role", ["domain", "range"])
+def test_bulk_violation_is_not_checked_when_trusted(caplog, role):
+    session = Session(validation=TRUSTED)
+    scheme = SkosConceptScheme(uri=EX + "scheme", session=session)
+    other_concept = SkosConcept(uri=EX + "other/concept", session=session)
+    pair = (scheme, scheme) if role == "domain" else (other_concept, other_concept)
+
+    with caplog.at_level(logging.WARNING):
+        assert SkosConcept.bulk_skos_in_scheme(session, pairs=[pair]) is True
+
+    assert "is not allowed" not in caplog.text
+    assert (URIRef(pair[0].uri), SKOS.inScheme, URIRef(pair[1].uri)) in session.graph
+
+
+def test_bulk_uses_the_policy_of_the_class_without_a_target_policy():
+    # a session without a policy of its own: the policy of SkosConcept (strict)
+    session = Session()
+    scheme = SkosConceptScheme(uri=EX + "scheme", session=session)
+
+    assert SkosConcept.bulk_skos_in_scheme(session, pairs=[(scheme, scheme)]) is False
+    assert (URIRef(scheme.uri), SKOS.inScheme, URIRef(scheme.uri)) not in session.graph
+
+
+def test_bulk_copies_the_triples_of_entities_in_other_buffers():
+    scheme = SkosConceptScheme(uri=EX + "scheme", labels=[{"lang": "de", "label": "Gattungen"}])
+    handles = SkosConcept.bulk_create([{"id": str(i), "label": f"Gattung {i}"} for i in range(3)],
+                                      base_uri=EX + "concept/")
+
+    target = SkosConcept(uri=EX + "target")
+    assert SkosConcept.bulk_skos_in_scheme(target, pairs=[(handle, scheme) for handle in handles]) is True
+
+    expected = Graph()
+    expected += SkosConcept(uri=EX + "target").graph
+    expected += scheme.graph
+    expected += handles[0].graph
+    expected += in_scheme_graph([handle.uri for handle in handles])
+    assert isomorphic(target.graph, expected)
+
+
+@pytest.mark.parametrize("validation", POLICIES)
+def test_insert_edges_with_the_inverse_property(validation):
+    buffer = TripleBuffer()
+    broader = SkosConcept(uri=EX + "broader")
+    narrower = concepts()
+
+    assert Entity.insert_edges(buffer,
+                               SKOS.broader,
+                               pairs=[(concept, broader) for concept in narrower],
+                               prop_inverse=SKOS.narrower,
+                               range_class_constraint=SkosConcept,
+                               domain_class_constraint=SkosConcept,
+                               validation=validation) is True
+
+    g = buffer.graph()
+    for concept in narrower:
+        assert (URIRef(concept.uri), SKOS.broader, URIRef(broader.uri)) in g
+        assert (URIRef(broader.uri), SKOS.narrower, URIRef(concept.uri)) in g
+
+    # the triples of the linked entities are copied as well
+    assert (URIRef(broader.uri), RDF.type, SKOS.Concept) in g
+
+
+@pytest.mark.parametrize("validation", POLICIES)
+def test_insert_edges_does_not_check_uris(validation):
+    buffer = TripleBuffer()
+
+    # URIs have no class, any URI is accepted as domain and range
+    assert Entity.insert_edges(buffer,
+                               SKOS.inScheme,
+                               domains=[EX + "concept/0"],
+                               ranges=[EX + "scheme"],
+                               range_class_constraint=SkosConceptScheme,
+                               domain_class_constraint=SkosConcept,
+                               validation=validation) is True
+
+    assert set(buffer) == set(in_scheme_graph([EX + "concept/0"]))
@@ -0,0 +1,145 @@
+"""Tests of dlod.entity.Entity: rdf:type statements, identity registry of sessions and validation policies"""
+import logging
+import pytest
+from rdflib import RDF, RDFS, Literal, URIRef
+from dlod.clscor import CLSCorVocabTerm, CLSCorVocab, CLSCorFormat, CLSCorFeature
+from dlod.entity import Entity
+from dlod.session import Session, STRICT, BATCH, TRUSTED
+from dlod.skos import SkosConcept, SkosConceptScheme
+
+EX = "https://genre.clscor.io/test/"
+
+CRM = "http://www.cidoc-crm.org/cidoc-crm/"
+SKOS = "http://www.w3.org/2004/02/skos/core#"
+CRMCLS = "https://clscor.io/ontologies/CRMcls/"
+
+# rdf:types of the classes in the baseline (the types were added in __init__), without class_uri=
+BASELINE_TYPES = {
+    CLSCorVocabTerm: {CRM + "E55_Type", SKOS + "Concept"},
+    CLSCorVocab: {CRM + "E32_Authority_Document", SKOS + "ConceptScheme"},
+    CLSCorFormat: {CRM + "E55_Type", SKOS + "Concept", CRMCLS + "X7_Format"},
+    CLSCorFeature: {CRM + "E55_Type", SKOS + "Concept", CRMCLS + "X3_Feature"},
+}
+
+
+def rdf_types(entity) -> set:
+    return {str(o) for s, p, o in entity.buffer if p == RDF.type}
+
+
+@pytest.mark.parametrize("klass", list(BASELINE_TYPES))
+def test_rdf_types_as_in_the_baseline(klass):
+    assert rdf_types(klass(uri=EX + "x")) == BASELINE_TYPES[klass]
+    assert {str(uri) for uri in klass.rdf_types()} == BASELINE_TYPES[klass]
+
+    # class_uri is added, the types listed in additional_class_uris are kept
+    assert rdf_types(klass(uri=EX + "x", class_uri=EX + "Class")) == BASELINE_TYPES[klass] | {EX + "Class"}
+
+
+def test_class_uri_replaces_the_class_level_class_uri():
+    assert rdf_types(SkosConcept(uri=EX + "x", class_uri=EX + "Class")) == {EX + "Class"}
+    assert rdf_types(SkosConcept(uri=EX + "x")) == {SKOS + "Concept"}
+    assert URIRef(SKOS + "Concept") in SkosConcept.rdf_types()
+
+
+def test_registry_returns_the_same_instance():
+    session = Session(registry=True)
+
+    concept = SkosConcept(uri=EX + "oper", session=session)
+    assert SkosConcept(uri=EX + "oper", session=session) is concept
+    assert session.get(EX + "oper") is concept
+
+    # class URI and URI as positional arguments
+    entity = Entity(EX + "Class", EX + "entity", session=session)
+    assert Entity(EX + "Class", EX + "entity", session=session) is entity
+    assert Entity(uri=EX + "entity", session=session) is entity
+    assert list(session.buffer).count((URIRef(EX + "entity"), RDF.type, URIRef(EX + "Class"))) == 1
+
+    # another class URI is added to the registered instance
+    assert Entity(EX + "Other", EX + "entity", session=session) is entity
+    assert (URIRef(EX + "entity"), RDF.type, URIRef(EX + "Other")) in session.graph
+
+
+def test_registry_is_off_by_default():
+    session = Session()
+
+    concept = SkosConcept(uri=EX + "oper", session=session)
+    assert SkosConcept(uri=EX + "oper", session=session) is not concept
+    assert session.registry is None
+    assert session.get(EX + "oper") is None
+
+
+def test_registered_entity_does_not_add_its_triples_again():
+    session = Session(registry=True)
+
+    SkosConcept(uri=EX + "oper", session=session)
+    concept = SkosConcept(uri=EX + "oper", session=session, labels=[{"lang": "de", "label": "Oper"}])
+    SkosConcept(uri=EX + "oper", session=session)
+
+    # the buffer is append-only, a repeated rdf:type statement would be in it twice
+    triples = list(session.buffer)
+    assert triples.count((URIRef(EX + "oper"), RDF.type, URIRef(SKOS + "Concept"))) == 1
+    assert (URIRef(EX + "oper"), RDFS.label, Literal("Oper")) in concept.graph
+    assert len(triples) == 2
+
+
+def test_registered_entity_of_another_class(caplog):
+    session = Session(registry=True)
+
+    scheme = SkosConceptScheme(uri=EX + "x", session=session)
+    with caplog.at_level(logging.WARNING):
+        concept = SkosConcept(uri=EX + "x", session=session)
+
+    assert concept is not scheme
+    assert session.get(EX + "x") is scheme
+    assert "registered as 'SkosConceptScheme'" in caplog.text
+
+
+@pytest.mark.parametrize("validation", [STRICT, BATCH])
+def test_invalid_labels_are_removed(validation):
+    labels = [{"lang": "de", "label": "Oper"}, {"lang": "de", "label": 5}]
+    concept = SkosConcept(uri=EX + "oper", labels=labels, validation=validation)
+
+    assert {o for s, p, o in concept.buffer if p == RDFS.label} == {Literal("Oper")}
+
+
+def test_labels_are_not_validated_when_trusted():
+    labels = [{"lang": "de", "label": "Oper"}, {"lang": "de", "label": 5}]
+    concept = SkosConcept(uri=EX + "oper", labels=labels, validation=TRUSTED)
+
+    assert {o for s, p, o in concept.buffer if p == RDFS.label} == {Literal("Oper"), Literal(5)}
+
+
+@pytest.mark.parametrize("validation", [STRICT, BATCH, TRUSTED])
+def test_validation_policy_of_the_session(validation):
+    session = Session(validation=validation)
+
+    assert SkosConcept(uri=EX + "oper", session=session).validation == validation
+    # the policy passed to the entity wins
+    assert SkosConcept(uri=EX + "drama", session=session, validation=STRICT).validation == STRICT
+    assert SkosConcept(uri=EX + "drama").validation == STRICT
+
+
+def test_invalid_validation_policy():
+    with pytest.raises(AssertionError):
+        Session(validation="lenient")
+
+    with pytest.raises(AssertionError):
+        SkosConcept(uri=EX + "oper", validation="lenient")
+
+
+@pytest.mark.parametrize("validation", [STRICT, BATCH, TRUSTED])
+def test_range_class_is_checked_unless_trusted(caplog, validation):
+    concept = SkosConcept(uri=EX + "oper", validation=validation)
+    other = SkosConcept(uri=EX + "drama")
+    size = len(concept.graph)
+
+    with caplog.at_level(logging.WARNING):
+        added = concept.skos_in_scheme(other)
+
+    if validation == TRUSTED:
+        assert added is True
+        assert (URIRef(EX + "oper"), URIRef(SKOS + "inScheme"), URIRef(EX + "drama")) in concept.graph
+    else:
+        assert added is False
+        assert "is not allowed as range" in caplog.text
+        assert len(concept.graph) == size
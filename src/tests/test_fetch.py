@@ -0,0 +1,57 @@
+"""Tests of Entity.fetch_many against the local stand-in endpoint (tests/standin.py)"""
+import logging
+from rdflib import SKOS
+from dlod.cidoc import CRM, E55Type
+from dlod.entity import Entity
+from dlod.session import Session
+from dlod.skos import SkosConcept, SkosConceptScheme, SkosCollection
+from dlod.sparql import DB
+
+EX = "https://genre.clscor.io/test/"
+
+DATA = f"""INSERT DATA {{
+    <{EX}concept> a <{SKOS.Concept}> ; <{SKOS.prefLabel}> "Oper"@de ; <{SKOS.inScheme}> <{EX}scheme> .
+    <{EX}scheme> a <{SKOS.ConceptScheme}> ; <{SKOS.prefLabel}> "Gattungen"@de .
+    <{EX}collection> a <{SKOS.Collection}> ; <{SKOS.member}> <{EX}concept> .
+}}"""
+
+
+def fetched(endpoint) -> DB:
+    db = DB(endpoint)
+    db.update(DATA)
+    return db
+
+
+def test_fetch_many_skips_other_classes(endpoint, caplog):
+    uris = [EX + "scheme", EX + "concept", EX + "collection", EX + "missing"]
+
+    with fetched(endpoint) as db, caplog.at_level(logging.WARNING):
+        concepts = SkosConcept.fetch_many(uris, db)
+
+    assert [(type(concept), concept.uri) for concept in concepts] == [(SkosConcept, EX + "concept")]
+    assert f"'{EX}scheme' is not an instance of 'SkosConcept'" in caplog.text
+    assert f"'{EX}collection' is not an instance of 'SkosConcept'" in caplog.text
+
+
+def test_fetch_many_chooses_the_class(endpoint):
+    with fetched(endpoint) as db:
+        entities = Entity.fetch_many([EX + "scheme", EX + "concept", EX + "collection"], db, session=Session())
+
+    assert [type(entity) for entity in entities] == [SkosConceptScheme, SkosConcept, SkosCollection]
+
+
+def test_fetched_entity_has_only_the_fetched_statements(endpoint):
+    with fetched(endpoint) as db:
+        db.update(f"INSERT DATA {{ <{EX}type> a <{CRM.E55_Type}> ; <{SKOS.prefLabel}> \"Gattung\"@de . }}")
+        expected = set(db.construct(f"CONSTRUCT {{ <{EX}type> ?p ?o }} WHERE {{ <{EX}type> ?p ?o }}"))
+
+        # no rdf:types of the superclasses (E28, E71, ...), although the class infers them
+        E55Type.infer_types = True
+        try:
+            entity = Entity.fetch(EX + "type", db)
+        finally:
+            del E55Type.infer_types
+
+    assert type(entity) == E55Type
+    assert set(entity.buffer) == expected
+    assert len(expected) == 2
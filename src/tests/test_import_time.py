@@ -0,0 +1,74 @@
+"""Import-time benchmark
+
+Cold imports are timed in fresh interpreters (best of several runs). The tests fail if importing dlod loads rdflib, if
+importing dlod.entity loads the ontology classes, an HTTP client or asyncio, or if the time dlod.entity adds on top of
+its dependencies (rdflib, marshmallow) exceeds the budget.
+
+Budgets can be changed with the environment variables DLOD_PACKAGE_IMPORT_BUDGET_MS and DLOD_ENTITY_IMPORT_BUDGET_MS.
+"""
+import json
+import os
+import subprocess
+import sys
+
+from conftest import SRC
+
+# Time in ms "import dlod" may take
+PACKAGE_IMPORT_BUDGET_MS = float(os.environ.get("DLOD_PACKAGE_IMPORT_BUDGET_MS", 20))
+
+# Time in ms "import dlod.entity" may take in addition to "import rdflib, marshmallow"
+ENTITY_IMPORT_BUDGET_MS = float(os.environ.get("DLOD_ENTITY_IMPORT_BUDGET_MS", 60))
+
+RUNS = 5
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {modules}
+seconds = time.perf_counter() - start
+print(json.dumps({{"ms": seconds * 1000, "modules": sorted(sys.modules)}}))
+"""
+
+
+def cold_import(modules: str) -> dict:
+    """Import modules in fresh interpreters
+
+    Args:
+        modules (str): Modules as in an import statement, e.g. "rdflib, marshmallow"
+
+    Returns:
+        dict: Best time in "ms" and the loaded "modules"
+    """
+    results = []
+    for _ in range(RUNS):
+        output = subprocess.run([sys.executable, "-c", SCRIPT.format(modules=modules)],
+                                cwd=SRC, capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output))
+
+    return min(results, key=lambda result: result["ms"])
+
+
+def test_package_import_is_lazy():
+    result = cold_import("dlod")
+
+    assert "rdflib" not in result["modules"]
+    assert result["ms"] < PACKAGE_IMPORT_BUDGET_MS, f"import dlod took {result['ms']:.1f} ms"
+
+
+def test_entity_import_does_not_load_ontologies():
+    modules = cold_import("dlod.entity")["modules"]
+
+    for name in ["cidoc", "lrmoo", "crmdig", "pem", "crmcls", "skos", "clscor", "matching"]:
+        assert "dlod." + name not in modules
+
+    for name in ["requests", "httpx", "asyncio", "concurrent.futures"]:
+        assert name not in modules
+
+
+def test_entity_import_time():
+    dependencies = cold_import("rdflib, marshmallow")["ms"]
+    entity = cold_import("dlod.entity")["ms"]
+
+    overhead = entity - dependencies
+    assert overhead < ENTITY_IMPORT_BUDGET_MS, \
+        f"import dlod.entity took {entity:.1f} ms, {overhead:.1f} ms more than rdflib and marshmallow"
@@ -0,0 +1,66 @@
+"""Tests of the streaming sinks of dlod.io"""
+import gzip
+import pytest
+from rdflib import Dataset, Graph, URIRef
+from rdflib.compare import isomorphic
+from dlod.io import NQuadsWriter, NTriplesWriter
+from dlod.skos import SkosConcept, SkosConceptScheme
+
+EX = "https://genre.clscor.io/test/"
+
+
+def linked_concept(sink=None, retain: bool = False) -> SkosConcept:
+    """A concept linked to a scheme and to two concepts of the scheme, the triples of the scheme are copied three
+    times"""
+    scheme = SkosConceptScheme(uri=EX + "scheme", labels=[{"lang": "de", "label": "Gattungen"}])
+    broader = SkosConcept(uri=EX + "drama", labels=[{"lang": "de", "label": "Drama"}])
+    broader.skos_in_scheme(scheme)
+    related = SkosConcept(uri=EX + "operette", labels=[{"lang": "de", "label": "Operette"}])
+    related.skos_in_scheme(scheme)
+
+    concept = SkosConcept(uri=EX + "oper")
+    if sink is not None:
+        concept.attach(sink, retain=retain)
+
+    concept.skos_pref_label("Oper", lang="de")
+    concept.skos_in_scheme(scheme)
+    concept.skos_broader(broader)
+    concept.skos_related(related)
+
+    return concept
+
+
+def read_lines(path: str) -> list:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        return [line for line in file.read().split("\n") if line]
+
+
+@pytest.mark.parametrize("filename", ["out.nt", "out.nt.gz"])
+@pytest.mark.parametrize("retain", [False, True])
+def test_linked_entities_are_written_once(tmp_path, filename, retain):
+    path = str(tmp_path / filename)
+
+    with NTriplesWriter(path) as writer:
+        linked_concept(writer, retain=retain)
+
+    lines = read_lines(path)
+    assert len(lines) == len(set(lines))
+
+    g = Graph()
+    g.parse(data="\n".join(lines), format="nt")
+    assert isomorphic(g, linked_concept().graph)
+
+
+def test_nquads_linked_entities_are_written_once(tmp_path):
+    path = str(tmp_path / "out.nq")
+
+    with NQuadsWriter(path, graph=EX + "graph") as writer:
+        linked_concept(writer)
+
+    lines = read_lines(path)
+    assert len(lines) == len(set(lines))
+
+    dataset = Dataset()
+    dataset.parse(path, format="nquads")
+    assert isomorphic(dataset.graph(URIRef(EX + "graph")), linked_concept().graph)
@@ -0,0 +1,61 @@
+"""Tests of the q-gram blocking of dlod.matching on the SKOS vocabularies of the notebooks (out/*.ttl)
+
+With blocking, only the candidate pairs of a q-gram index are compared. The filter must not lose a match: the blocked
+and the exhaustive comparison have to find the same pairs.
+"""
+import os
+import pytest
+from rdflib import Graph
+from conftest import SRC
+from dlod.matching import containment_matches, edit_distance_candidates
+
+# Labels of the concepts of a vocabulary
+LABELS_QUERY = """PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
+SELECT ?uri ?label WHERE { ?uri skos:prefLabel|skos:altLabel ?label } ORDER BY ?uri ?label"""
+
+VOCABULARIES = ["bouterwek", "eschenburg", "goethe"]
+
+
+def vocabulary_terms(name: str) -> list:
+    """Terms ({"id", "label"}) with the skos:prefLabel and skos:altLabel of a vocabulary of out/"""
+    g = Graph()
+    g.parse(os.path.join(SRC, "out", name + ".ttl"))
+    return [{"id": str(uri), "label": str(label)} for uri, label in g.query(LABELS_QUERY)]
+
+
+@pytest.fixture(scope="module")
+def vocabularies() -> dict:
+    terms = {name: vocabulary_terms(name) for name in VOCABULARIES}
+    # all vocabularies in one, many more pairs with small distances
+    terms["all"] = [term for name in VOCABULARIES for term in terms[name]]
+    return terms
+
+
+PAIRS = [("bouterwek", "eschenburg"), ("eschenburg", "bouterwek"), ("bouterwek", "goethe"),
+         ("goethe", "eschenburg"), ("all", "all")]
+
+
+@pytest.mark.parametrize("q", [1, 2, 3])
+@pytest.mark.parametrize("max_distance", [1, 2, 3])
+@pytest.mark.parametrize("name_a,name_b", PAIRS)
+def test_blocked_edit_distance_candidates(vocabularies, name_a, name_b, max_distance, q):
+    terms_a, terms_b = vocabularies[name_a], vocabularies[name_b]
+
+    exhaustive = edit_distance_candidates(terms_a, terms_b, max_distance)
+    blocked = edit_distance_candidates(terms_a, terms_b, max_distance, blocking=True, q=q)
+
+    assert blocked == exhaustive
+
+
+@pytest.mark.parametrize("q", [1, 2, 3])
+@pytest.mark.parametrize("name_a,name_b", PAIRS)
+def test_blocked_containment_matches(vocabularies, name_a, name_b, q):
+    terms_a, terms_b = vocabularies[name_a], vocabularies[name_b]
+
+    assert containment_matches(terms_a, terms_b, blocking=True, q=q) == containment_matches(terms_a, terms_b)
+
+
+def test_vocabularies_have_candidates(vocabularies):
+    # the comparisons above are not trivially equal
+    assert edit_distance_candidates(vocabularies["all"], vocabularies["all"], 3)
+    assert containment_matches(vocabularies["bouterwek"], vocabularies["eschenburg"])
@@ -0,0 +1,52 @@
+"""Tests of the property declarations of dlod.properties"""
+import pytest
+from rdflib import URIRef
+from dlod.entity import Entity
+from dlod.properties import Property, EntityProperty, get_property
+
+EX = "https://genre.clscor.io/test/"
+
+
+def test_property_is_abstract():
+    with pytest.raises(TypeError):
+        Property(URIRef(EX + "prop"))
+
+
+def test_declaration_without_method_is_not_instantiated():
+    class Incomplete(Property):
+        def _args_doc(self) -> str:
+            return ""
+
+    with pytest.raises(TypeError, match="_method"):
+        Incomplete(URIRef(EX + "prop"))
+
+
+def test_declaration_of_a_subclass():
+    class FlagProperty(Property):
+        kind = "flag"
+
+        def _args_doc(self) -> str:
+            return "\nReturns:\n     bool: True if added\n"
+
+        def _method(self, definition):
+            prop = definition.prop
+
+            def method(self) -> bool:
+                self.buffer.add((URIRef(self.uri), prop, URIRef(EX + "true")))
+                return True
+
+            return method
+
+    class Flagged(Entity):
+        flagged = FlagProperty(URIRef(EX + "flagged"), doc="Flag the entity")
+        linked = EntityProperty(URIRef(EX + "linked"), range_class=Entity)
+
+    entity = Flagged(uri=EX + "x")
+    assert entity.flagged() is True
+    assert (URIRef(EX + "x"), URIRef(EX + "flagged"), URIRef(EX + "true")) in entity.graph
+
+    definition = get_property(Flagged, "flagged")
+    assert definition.kind == "flag"
+    assert Flagged.flagged.__doc__.startswith("Flag the entity\n")
+    assert not hasattr(Flagged, "bulk_flagged")
+    assert hasattr(Flagged, "bulk_linked")
@@ -0,0 +1,162 @@
+"""Tests of the SPARQL client (dlod.sparql.DB) against the local stand-in endpoint (tests/standin.py)"""
+import pytest
+from rdflib import Graph, Literal, URIRef
+from dlod.sparql import DB, normalize_query
+
+EX = "https://genre.clscor.io/test/"
+
+DATA = f"""INSERT DATA {{
+    <{EX}a> <{EX}label> "A"@de .
+    <{EX}b> <{EX}label> "B"@de .
+    <{EX}c> <{EX}label> "C" .
+}}"""
+
+
+def test_select_construct_ask(endpoint):
+    with DB(endpoint) as db:
+        assert db.update(DATA) is True
+
+        results = db.select(f"SELECT ?s ?label WHERE {{ ?s <{EX}label> ?label }} ORDER BY ?s")
+        assert [result["s"] for result in results] == [URIRef(EX + "a"), URIRef(EX + "b"), URIRef(EX + "c")]
+        assert results[0]["label"] == Literal("A", lang="de")
+
+        g = db.construct(f"CONSTRUCT {{ ?s <{EX}label> ?label }} WHERE {{ ?s <{EX}label> ?label }}")
+        assert len(g) == 3
+        assert (URIRef(EX + "c"), URIRef(EX + "label"), Literal("C")) in g
+
+        assert db.ask(f"ASK {{ <{EX}a> ?p ?o }}") is True
+        assert db.ask(f"ASK {{ <{EX}d> ?p ?o }}") is False
+
+
+def test_connections_are_reused(standin, endpoint):
+    with DB(endpoint) as db:
+        for _ in range(20):
+            db.ask(f"ASK {{ <{EX}a> ?p ?o }}")
+
+    assert standin.requests == 20
+    assert len(standin.connections) == 1
+
+
+def test_long_query_is_posted(endpoint):
+    with DB(endpoint) as db:
+        db.update(DATA)
+        padding = "#" + "x" * 3000 + "\n"
+        assert len(db.select(padding + f"SELECT ?s WHERE {{ ?s <{EX}label> ?label }}")) == 3
+
+
+def test_iter_select(endpoint):
+    with DB(endpoint) as db:
+        db.update(DATA)
+        query = f"SELECT ?s ?label WHERE {{ ?s <{EX}label> ?label }}"
+
+        for format in ["tsv", "json"]:
+            results = list(db.iter_select(query + " ORDER BY ?s", format=format, header=True))
+            assert results[0] == ("s", "label")
+            assert results[1] == (URIRef(EX + "a"), Literal("A", lang="de"))
+            assert len(results) == 4
+
+            # pages of 2 results, with keyset and with offset pagination
+            expected = {frozenset(zip(results[0], result)) for result in results[1:]}
+            for key in ["s", None]:
+                paged = list(db.iter_select(query, page_size=2, key=key, format=format, header=True))
+                # the order of the variables of SELECT * is up to the endpoint
+                assert {frozenset(zip(paged[0], result)) for result in paged[1:]} == expected
+                assert len(paged) == 4
+
+
+def test_upload_get_delete_graph(endpoint):
+    graph = EX + "graph"
+
+    g = Graph()
+    for i in range(25):
+        g.add((URIRef(f"{EX}{i}"), URIRef(EX + "label"), Literal(f"Label {i}", lang="de")))
+
+    with DB(endpoint) as db:
+        stats = db.upload(g, named_graph=graph, chunk_triples=4, compress=True, workers=2)
+        assert stats["triples"] == 25
+        assert stats["chunks"] == 7
+
+        assert len(db.get_graph(graph) ^ g) == 0
+        assert db.ask(f"ASK {{ GRAPH <{graph}> {{ <{EX}24> ?p ?o }} }}") is True
+
+        # replace deletes the graph first
+        db.upload(g, named_graph=graph, replace=True)
+        assert len(db.get_graph(graph)) == 25
+
+        assert db.delete_graph(graph) is True
+        assert len(db.get_graph(graph)) == 0
+        assert db.delete_graph(graph) is False
+
+
+def test_update_invalidates_cache(endpoint):
+    with DB(endpoint, cache=True) as db:
+        query = f"SELECT ?s WHERE {{ ?s <{EX}label> ?label }}"
+        assert db.select(query) == []
+        assert db.select(query) == []
+        assert db.cache.hits == 1
+
+        db.update(DATA)
+        assert len(db.select(query)) == 3
+
+
+def test_cache_is_opt_in(standin, endpoint):
+    with DB(endpoint) as db:
+        assert db.cache is None
+        db.ask(f"ASK {{ <{EX}a> ?p ?o }}")
+        db.ask(f"ASK {{ <{EX}a> ?p ?o }}")
+
+    assert standin.requests == 2
+
+
+def test_normalize_query():
+    query = f"""PREFIX ex: <{EX}#>
+        SELECT ?s  # the subjects
+        WHERE {{ ?s ex:label "A  # B" ; ex:see <{EX}#a> . }}"""
+
+    assert normalize_query(query) == f'PREFIX ex: <{EX}#> SELECT ?s WHERE {{ ?s ex:label "A  # B" ; ex:see <{EX}#a> . }}'
+
+    # a comment does not comment out the rest of the query once the lines are joined
+    assert normalize_query("SELECT ?s\n# WHERE { ?s ?p ?o }") != normalize_query("SELECT ?s WHERE { ?s ?p ?o }")
+    assert normalize_query("SELECT ?s # subjects\nWHERE { ?s ?p ?o }") == normalize_query("SELECT ?s WHERE { ?s ?p ?o }")
+    assert normalize_query('ASK { ?s ?p """a\n  #b""" }') == 'ASK { ?s ?p """a\n  #b""" }'
+
+
+def test_commented_queries_are_cached_apart(endpoint):
+    query = f"SELECT ?s WHERE {{ ?s <{EX}label> ?label }} # all subjects"
+
+    with DB(endpoint, cache=True) as db:
+        db.update(DATA)
+        assert len(db.select(query + "\nLIMIT 1")) == 1
+        # LIMIT is part of the comment
+        assert len(db.select(query + " LIMIT 1")) == 3
+
+
+def test_iter_select_repeated_key(endpoint):
+    labels = {"a": ["A1", "A2", "A3"], "b": ["B1"], "c": ["C1", "C2"]}
+    rows = {(URIRef(EX + s), Literal(label)) for s, values in labels.items() for label in values}
+
+    with DB(endpoint) as db:
+        db.update("INSERT DATA { " + " ".join(f"{s.n3()} <{EX}label> {label.n3()} ." for s, label in rows)
+                  + " }")
+        query = f"SELECT ?s ?label WHERE {{ ?s <{EX}label> ?label }}"
+
+        for format in ["tsv", "json"]:
+            for page_size in [1, 2, 3, 4, 10]:
+                paged = list(db.iter_select(query, page_size=page_size, key="s", format=format, header=True))
+                index = paged[0].index("s"), paged[0].index("label")
+                results = [(result[index[0]], result[index[1]]) for result in paged[1:]]
+                # every result once
+                assert len(results) == len(rows)
+                assert set(results) == rows
+
+
+def test_iter_select_unbound_key(endpoint):
+    with DB(endpoint) as db:
+        db.update(DATA)
+        query = f"SELECT ?s ?label ?see WHERE {{ ?s <{EX}label> ?label OPTIONAL {{ ?s <{EX}see> ?see }} }}"
+
+        with pytest.raises(ValueError):
+            list(db.iter_select(query, page_size=2, key="see"))
+
+        # without key
+        assert len(list(db.iter_select(query, page_size=2))) == 3
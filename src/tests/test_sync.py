@@ -0,0 +1,106 @@
+"""Tests of DB.sync against the local stand-in endpoint (tests/standin.py)"""
+import pytest
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+from dlod.sparql import DB
+
+EX = "https://genre.clscor.io/test/"
+
+LABEL = URIRef(EX + "label")
+NOTE = URIRef(EX + "note")
+TEXT = URIRef(EX + "text")
+
+
+def local_graph(n: int = 10, note: str = "Anmerkung") -> Graph:
+    """n labelled concepts, the first one with a note (blank node)"""
+    g = Graph()
+    for i in range(n):
+        g.add((URIRef(f"{EX}{i}"), LABEL, Literal(f"Label {i}", lang="de")))
+
+    note_node = BNode()
+    g.add((URIRef(EX + "0"), NOTE, note_node))
+    g.add((note_node, TEXT, Literal(note)))
+    return g
+
+
+@pytest.fixture(params=[None, EX + "graph"], ids=["default", "named"])
+def named_graph(request):
+    return request.param
+
+
+@pytest.fixture(params=[None, "snapshot.nt", "snapshot.nt.gz"], ids=["no snapshot", "snapshot", "gzip snapshot"])
+def snapshot(request, tmp_path):
+    return str(tmp_path / request.param) if request.param else None
+
+
+def test_sync_added(endpoint, named_graph, snapshot):
+    local = local_graph()
+
+    with DB(endpoint) as db:
+        stats = db.sync(local, named_graph=named_graph, snapshot=snapshot)
+        assert stats == {"added": 10, "removed": 0, "blank_node_triples": 2, "requests": 1}
+        assert isomorphic(db.get_graph(named_graph), local)
+
+        # more concepts
+        local = local_graph(15)
+        stats = db.sync(local, named_graph=named_graph, snapshot=snapshot)
+        assert stats == {"added": 5, "removed": 0, "blank_node_triples": 0, "requests": 1}
+        assert isomorphic(db.get_graph(named_graph), local)
+
+
+def test_sync_removed(endpoint, named_graph, snapshot):
+    with DB(endpoint) as db:
+        db.sync(local_graph(15), named_graph=named_graph, snapshot=snapshot)
+
+        local = local_graph(10)
+        stats = db.sync(local, named_graph=named_graph, snapshot=snapshot, chunk_triples=2)
+        # 5 triples in requests of at most 2 triples
+        assert stats == {"added": 0, "removed": 5, "blank_node_triples": 0, "requests": 3}
+        assert isomorphic(db.get_graph(named_graph), local)
+
+
+def test_sync_blank_nodes(endpoint, named_graph, snapshot):
+    with DB(endpoint) as db:
+        db.sync(local_graph(), named_graph=named_graph, snapshot=snapshot)
+
+        # the triples of the blank nodes are replaced
+        local = local_graph(note="Geänderte Anmerkung")
+        stats = db.sync(local, named_graph=named_graph, snapshot=snapshot)
+        assert stats == {"added": 0, "removed": 0, "blank_node_triples": 2, "requests": 1}
+        assert isomorphic(db.get_graph(named_graph), local)
+
+        # other blank node labels, same graph: nothing is sent
+        stats = db.sync(local_graph(note="Geänderte Anmerkung"), named_graph=named_graph, snapshot=snapshot)
+        assert stats == {"added": 0, "removed": 0, "blank_node_triples": 0, "requests": 0}
+
+        # no blank nodes left
+        local.remove((None, NOTE, None))
+        local.remove((None, TEXT, None))
+        stats = db.sync(local, named_graph=named_graph, snapshot=snapshot)
+        assert stats == {"added": 0, "removed": 0, "blank_node_triples": 0, "requests": 1}
+        assert isomorphic(db.get_graph(named_graph), local)
+
+
+def test_sync_keeps_the_other_graphs(endpoint, named_graph):
+    other = None if named_graph else EX + "other"
+
+    with DB(endpoint) as db:
+        db.sync(local_graph(3), named_graph=other)
+        db.sync(local_graph(5), named_graph=named_graph)
+        db.sync(local_graph(2), named_graph=named_graph)
+
+        assert isomorphic(db.get_graph(other), local_graph(3))
+        assert isomorphic(db.get_graph(named_graph), local_graph(2))
+
+
+def test_sync_with_snapshot_does_not_read_the_graph(standin, endpoint, named_graph, tmp_path):
+    snapshot = str(tmp_path / "snapshot.nt")
+
+    with DB(endpoint) as db:
+        db.sync(local_graph(), named_graph=named_graph, snapshot=snapshot)
+        requests = standin.requests
+
+        stats = db.sync(local_graph(), named_graph=named_graph, snapshot=snapshot)
+
+    assert stats["requests"] == 0
+    assert standin.requests == requests